@@ -21,6 +21,7 @@ from openpyxl.compat import (
     basestring,
     bytes,
     NUMERIC_TYPES,
+    numpy_types,
     range,
     deprecated,
 )
@@ -197,6 +198,9 @@ class Cell(StyleableObject):
             elif self.guess_types:
                 value = self._infer_value(value)
 
+        elif isinstance(value, numpy_types()):
+            pass
+
         elif value is not None:
             raise ValueError("Cannot convert {0!r} to Excel".format(value))
 
@@ -11,7 +11,7 @@ from .strings import (
     safe_string,
     safe_repr,
     )
-from .numbers import long, NUMERIC_TYPES
+from .numbers import long, NUMERIC_TYPES, numpy_types
 
 # Python 2.6
 try:
@@ -1,6 +1,8 @@
 from __future__ import absolute_import
 # Copyright (c) 2010-2017 openpyxl
 
+import sys
+
 try:
     # Python 2
     long = long
@@ -13,19 +15,33 @@ from decimal import Decimal
 NUMERIC_TYPES = (int, float, long, Decimal)
 
 
-try:
-    import numpy
-    NUMPY = True
-except ImportError:
-    NUMPY = False
-
-
-if NUMPY:
-    NUMERIC_TYPES = NUMERIC_TYPES + (numpy.bool_, numpy.floating, numpy.integer)
-
-
-try:
-    import pandas
-    PANDAS = True
-except ImportError:
-    PANDAS = False
+def _installed(name):
+    """
+    Check whether a package can be imported without importing it
+    """
+    try:
+        from importlib.util import find_spec
+    except ImportError:
+        # Python 2
+        import imp
+        try:
+            imp.find_module(name)
+        except ImportError:
+            return False
+        return True
+    return find_spec(name) is not None
+
+
+NUMPY = _installed("numpy")
+PANDAS = _installed("pandas")
+
+
+def numpy_types():
+    """
+    NumPy scalars which are numbers. NumPy is not imported for this: values
+    can only be NumPy scalars once it has been imported.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return ()
+    return (numpy.bool_, numpy.floating, numpy.integer)
@@ -6,7 +6,7 @@ import sys
 
 VER = sys.version_info
 
-from .numbers import NUMERIC_TYPES
+from .numbers import NUMERIC_TYPES, numpy_types
 
 if VER[0] >= 3:
     basestring = str
@@ -33,6 +33,8 @@ def safe_string(value):
             value = "%.16g" % value
     elif value is None:
         value = "none"
+    elif isinstance(value, numpy_types()):
+        value = safe_string(value.item())
     elif not isinstance(value, basestring):
         value = str(value)
     return value
@@ -20,11 +20,16 @@ def test_safe_string(value, result):
     assert v == 's'
 
 
-@pytest.mark.numpy_required
 def test_numeric_types():
-    from ..numbers import NUMERIC_TYPES, numpy, Decimal, long
-    assert NUMERIC_TYPES == (int, float, long, Decimal, numpy.bool_,
-                             numpy.floating, numpy.integer)
+    from ..numbers import NUMERIC_TYPES, Decimal, long
+    assert NUMERIC_TYPES == (int, float, long, Decimal)
+
+
+@pytest.mark.numpy_required
+def test_numpy_types():
+    import numpy
+    from ..numbers import numpy_types
+    assert numpy_types() == (numpy.bool_, numpy.floating, numpy.integer)
 
 
 @pytest.mark.numpy_required
@@ -17,6 +17,152 @@ from openpyxl.xml.functions import (
 
 seq_types = (list, tuple)
 
+# kinds of child elements
+SINGLE = 0
+SEQUENCE = 1
+NESTED_SEQUENCE = 2
+
+
+def _text(node):
+    return node.text
+
+
+class _TreeReader(object):
+    """
+    Lookups for creating objects of a class from XML. Attribute names and
+    child tags are resolved against the class the first time they are seen.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.attributes = {}
+        self.children = {}
+        self.text = "attr_text" in cls.__attrs__
+
+
+    def attribute(self, name):
+        """
+        Keyword argument for an attribute or None if it should be ignored
+        """
+        key = name
+        for attr, ns in self.cls.__namespaced__:
+            if name == ns:
+                key = attr
+                break
+        else:
+            if name.startswith('{'):
+                key = None
+        if key in KEYWORDS:
+            key = "_" + key
+        self.attributes[name] = key
+        return key
+
+
+    def child(self, node):
+        """
+        (keyword, conversion, kind) for a child element or None if it should
+        be ignored
+        """
+        tag = localname(node)
+        if tag in KEYWORDS:
+            tag = "_" + tag
+        desc = getattr(self.cls, tag, None)
+        entry = None
+        if desc is not None and not isinstance(desc, property):
+            if hasattr(desc, 'from_tree'):
+                #descriptor manages conversion
+                convert = desc.from_tree
+            elif hasattr(desc.expected_type, "from_tree"):
+                #complex type
+                convert = desc.expected_type.from_tree
+            else:
+                #primitive
+                convert = _text
+
+            kind = SINGLE
+            if (isinstance(desc, Sequence)
+                and not isinstance(desc, NestedSequence)):
+                kind = SEQUENCE
+            entry = tag, convert, kind
+        self.children[node.tag] = entry
+        return entry
+
+
+class _TreeWriter(object):
+    """
+    Lookups for serialising objects of a class to XML. Some objects change
+    their attributes or elements so these are keyed by them.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self._attributes = {}
+        self._children = {}
+        self._attrs = self._elements = None
+        self._default_attributes = self.attributes(cls.__attrs__)
+        self._default_children = self.children(cls.__elements__)
+        self._attrs = cls.__attrs__
+        self._elements = cls.__elements__
+
+
+    def attributes(self, attrs):
+        """
+        (attribute, name) for attributes serialised to XML
+        """
+        if attrs is self._attrs:
+            return self._default_attributes
+        try:
+            return self._attributes[attrs]
+        except KeyError:
+            pass
+        names = []
+        for attr in attrs:
+            name = attr
+            if name.startswith("_"):
+                name = name[1:]
+            if name != "attr_text":
+                names.append((attr, name))
+        self._attributes[attrs] = names
+        return names
+
+
+    def children(self, elements):
+        """
+        (tag, descriptor, kind, nested) for child elements
+        """
+        if elements is self._elements:
+            return self._default_children
+        try:
+            return self._children[elements]
+        except KeyError:
+            pass
+        cls = self.cls
+        children = []
+        for child_tag in elements:
+            desc = getattr(cls, child_tag, None)
+            if isinstance(desc, NestedSequence):
+                kind = NESTED_SEQUENCE
+            elif isinstance(desc, Sequence):
+                kind = SEQUENCE
+            else:
+                kind = SINGLE
+            children.append((child_tag, desc, kind, child_tag in cls.__nested__))
+        self._children[elements] = children
+        return children
+
+
+def _lookups(cls, name, factory):
+    """
+    Lookups for a class created on first use. Each class has its own
+    because descriptors and tags can differ between subclasses.
+    """
+    lookups = cls.__dict__.get(name)
+    if lookups is None:
+        lookups = factory(cls)
+        setattr(cls, name, lookups)
+    return lookups
+
+
 class Serialisable(_Serialiasable):
     """
     Objects can serialise to XML their attributes and child objects.
@@ -44,48 +190,35 @@ class Serialisable(_Serialiasable):
         """
         Create object from XML
         """
-        # strip known namespaces from attributes
-        attrib = dict(node.attrib)
-        for key, ns in cls.__namespaced__:
-            if ns in attrib:
-                attrib[key] = attrib[ns]
-                del attrib[ns]
-
-        # strip attributes with unknown namespaces
-        for key in list(attrib):
-            if key.startswith('{'):
-                del attrib[key]
-            elif key in KEYWORDS:
-                attrib["_" + key] = attrib[key]
-                del attrib[key]
-
-        if node.text and "attr_text" in cls.__attrs__:
+        reader = _lookups(cls, "_tree_reader", _TreeReader)
+
+        # strip known namespaces from attributes, unknown ones are ignored
+        attributes = reader.attributes
+        attrib = {}
+        for name, value in node.attrib.items():
+            try:
+                key = attributes[name]
+            except KeyError:
+                key = reader.attribute(name)
+            if key is not None:
+                attrib[key] = value
+
+        if reader.text and node.text:
             attrib["attr_text"] = node.text
 
+        children = reader.children
         for el in node:
-            tag = localname(el)
-            if tag in KEYWORDS:
-                tag = "_" + tag
-            desc = getattr(cls, tag, None)
-            if desc is None or isinstance(desc, property):
+            try:
+                entry = children[el.tag]
+            except KeyError:
+                entry = reader.child(el)
+            if entry is None:
                 continue
 
-            if hasattr(desc, 'from_tree'):
-                #descriptor manages conversion
-                obj = desc.from_tree(el)
-            else:
-                if hasattr(desc.expected_type, "from_tree"):
-                    #complex type
-                    obj = desc.expected_type.from_tree(el)
-                else:
-                    #primitive
-                    obj = el.text
-
-            if isinstance(desc, NestedSequence):
-                attrib[tag] = obj
-            elif isinstance(desc, Sequence):
-                attrib.setdefault(tag, [])
-                attrib[tag].append(obj)
+            tag, convert, kind = entry
+            obj = convert(el)
+            if kind == SEQUENCE:
+                attrib.setdefault(tag, []).append(obj)
             else:
                 attrib[tag] = obj
 
@@ -114,17 +247,19 @@ class Serialisable(_Serialiasable):
         if "attr_text" in self.__attrs__:
             el.text = safe_string(getattr(self, "attr_text"))
 
-        for child_tag in self.__elements__:
-            desc = getattr(self.__class__, child_tag, None)
+        writer = _lookups(self.__class__, "_tree_writer", _TreeWriter)
+        for child_tag, desc, kind, nested in writer.children(self.__elements__):
             obj = getattr(self, child_tag)
+            if obj is None and not nested:
+                continue
 
             if isinstance(obj, seq_types):
-                if isinstance(desc, NestedSequence):
+                if kind == NESTED_SEQUENCE:
                     # wrap sequence in container
                     if not obj:
                         continue
                     nodes = [desc.to_tree(child_tag, obj, namespace)]
-                elif isinstance(desc, Sequence):
+                elif kind == SEQUENCE:
                     # sequence
                     desc.idx_base = self.idx_base
                     nodes = (desc.to_tree(child_tag, obj, namespace))
@@ -133,10 +268,8 @@ class Serialisable(_Serialiasable):
                 for node in nodes:
                     el.append(node)
             else:
-                if child_tag in self.__nested__:
+                if nested:
                     node = desc.to_tree(child_tag, obj, namespace)
-                elif obj is None:
-                    continue
                 else:
                     node = obj.to_tree(child_tag)
                 if node is not None:
@@ -145,12 +278,11 @@ class Serialisable(_Serialiasable):
 
 
     def __iter__(self):
-        for attr in self.__attrs__:
+        writer = _lookups(self.__class__, "_tree_writer", _TreeWriter)
+        for attr, name in writer.attributes(self.__attrs__):
             value = getattr(self, attr)
-            if attr.startswith("_"):
-                attr = attr[1:]
-            if attr != "attr_text" and value is not None:
-                yield attr, safe_string(value)
+            if value is not None:
+                yield name, safe_string(value)
 
 
     def __eq__(self, other):
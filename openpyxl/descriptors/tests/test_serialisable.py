@@ -200,3 +200,31 @@ class TestKeywordNode:
         el = fromstring(src)
         dummy = KeywordNode.from_tree(el)
         assert dummy._from.val is True
+
+
+class TestLookups:
+
+
+    def test_subclass_has_own_lookups(self, KeywordNode):
+
+        class Derived(KeywordNode):
+            tagname = "derived"
+
+        KeywordNode.from_tree(fromstring("""<dummy><from val="1" /></dummy>"""))
+        assert "_tree_reader" in KeywordNode.__dict__
+        assert "_tree_reader" not in Derived.__dict__
+        dummy = Derived.from_tree(fromstring("""<derived><from val="0" /></derived>"""))
+        assert Derived._tree_reader is not KeywordNode._tree_reader
+        assert dummy._from.val is False
+
+
+    def test_instance_elements(self, KeywordNode, Node):
+        dummy = KeywordNode(_from=Node(val=True))
+        xml = tostring(dummy.to_tree())
+        diff = compare_xml(xml, """<dummy><from val="1" /></dummy>""")
+        assert diff is None, diff
+
+        dummy.__elements__ = ()
+        xml = tostring(dummy.to_tree())
+        diff = compare_xml(xml, """<dummy />""")
+        assert diff is None, diff
@@ -0,0 +1,77 @@
+from __future__ import absolute_import, print_function
+# Copyright (c) 2010-2017 openpyxl
+
+"""
+Compare the time taken to append a block of numbers to a worksheet row by
+row, with append_rows and with append_array, for both cell stores.
+
+python -m openpyxl.develop.benchmark_append --rows 10000 --cols 20
+"""
+
+import argparse
+from random import random
+from timeit import default_timer
+
+from openpyxl import Workbook
+
+
+def append(ws, rows, array):
+    for row in rows:
+        ws.append(row)
+
+
+def append_rows(ws, rows, array):
+    ws.append_rows(rows)
+
+
+def append_array(ws, rows, array):
+    ws.append_array(array)
+
+
+METHODS = (append, append_rows, append_array)
+
+
+def timed(method, rows, array, compact_cells, repeat):
+    """
+    Best time of several runs, each appending to a new worksheet
+    """
+    best = None
+    for _ in range(repeat):
+        ws = Workbook(compact_cells=compact_cells).active
+        start = default_timer()
+        method(ws, rows, array)
+        elapsed = default_timer() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time bulk appends to worksheets")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [[random() for _ in range(args.cols)] for _ in range(args.rows)]
+    methods = METHODS
+    try:
+        import numpy
+        array = numpy.array(rows)
+    except ImportError:
+        array = None
+        methods = METHODS[:-1]
+
+    for compact_cells in (False, True):
+        base = None
+        for method in methods:
+            elapsed = timed(method, rows, array, compact_cells, args.repeat)
+            if base is None:
+                base = elapsed
+            print("{0:<8} {1:<13} {2:7.3f}s {3:5.2f}x".format(
+                "compact" if compact_cells else "cells", method.__name__,
+                elapsed, base / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,6 @@ from openpyxl.drawing.image import Image
 
 from openpyxl.xml.constants import SHEET_DRAWING_NS
 
-from openpyxl.chart._chart import ChartBase
 from .shapes import (
     Point2D,
     PositiveSize2D,
@@ -255,6 +254,8 @@ class SpreadsheetDrawing(Serialisable):
         """
         create required structure and the serialise
         """
+        from openpyxl.chart._chart import ChartBase # charts are rarely used
+
         anchors = []
         for idx, obj in enumerate(self.charts + self.images, 1):
             if isinstance(obj, ChartBase):
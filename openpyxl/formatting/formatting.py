@@ -10,6 +10,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.excel import ExtensionList
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.worksheet.cell_range import CellRangeSet, RangeIndex
 
 from .rule import Rule
 
@@ -36,6 +37,7 @@ class ConditionalFormattingList(object):
     def __init__(self):
         self.cf_rules = OrderedDict()
         self.max_priority = 0
+        self._index = RangeIndex()
 
     def add(self, range_string, cfRule):
         """Add a rule such as ColorScaleRule, FormulaRule or CellIsRule
@@ -49,9 +51,29 @@ class ConditionalFormattingList(object):
         if not rule.priority:
             rule.priority = self.max_priority
 
+        if range_string not in self.cf_rules:
+            ranges = CellRangeSet()
+            for piece in range_string.split():
+                try:
+                    ranges.add(piece)
+                except ValueError:
+                    # not a range of cells on this sheet, such as "Sheet1!A1"
+                    continue
+            for bounds in ranges:
+                self._index.add(bounds, range_string)
         self.cf_rules.setdefault(range_string, []).append(rule)
 
 
+    def rules(self, row, column):
+        """
+        Return the rules which apply to a cell ordered by priority
+        """
+        found = []
+        for range_string in set(key for _, key in self._index.find(row, column)):
+            found.extend(self.cf_rules[range_string])
+        return sorted(found, key=lambda rule: int(rule.priority))
+
+
     def __bool__(self):
         return bool(self.cf_rules)
 
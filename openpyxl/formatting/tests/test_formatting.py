@@ -122,6 +122,34 @@ class TestConditionalFormatting(object):
         assert diff is None, diff
 
 
+def test_rules_for_cell():
+    cf = ConditionalFormattingList()
+    blank = Rule(type="containsBlanks")
+    errors = Rule(type="containsErrors")
+    top = Rule(type="top10")
+    column = Rule(type="duplicateValues")
+    cf.add("A1:A10 B1:B10", blank)
+    cf.add("$A$1:$B$10", errors)
+    cf.add("C1:C5", top)
+    cf.add("D:D", column)
+    assert list(cf.cf_rules) == ["A1:A10 B1:B10", "$A$1:$B$10", "C1:C5", "D:D"]
+    assert cf.rules(5, 2) == [blank, errors]
+    assert cf.rules(11, 2) == []
+    assert cf.rules(1048576, 4) == [column]
+
+
+def test_rules_for_unusual_ranges():
+    cf = ConditionalFormattingList()
+    reversed_range = Rule(type="containsBlanks")
+    other_sheet = Rule(type="containsErrors")
+    cf.add("B2:A1", reversed_range)
+    cf.add("Sheet1!A1 C3", other_sheet)
+    assert list(cf.cf_rules) == ["B2:A1", "Sheet1!A1 C3"]
+    assert cf.rules(1, 1) == [reversed_range]
+    assert cf.rules(2, 2) == [reversed_range]
+    assert cf.rules(3, 3) == [other_sheet]
+
+
 def test_conditional_formatting_read(datadir):
     datadir.chdir()
     reference_file = 'conditional-formatting.xlsx'
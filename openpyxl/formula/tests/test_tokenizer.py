@@ -233,6 +233,24 @@ class TestTokenizer(object):
                   for token in tok.items]
         assert result == tokens
 
+    def test_cache(self, tokenizer):
+        formula = '=SUM(A1:B2)+"text"'
+        first = tokenizer.Tokenizer(formula)
+        first.items[0].value = "changed"
+        tok = tokenizer.Tokenizer(formula)
+        assert formula in tokenizer.Tokenizer._cache
+        assert tok.offset == len(formula)
+        assert tok.render() == formula
+        assert tok.items[1] is not first.items[1]
+
+    def test_cache_size(self, tokenizer, monkeypatch):
+        monkeypatch.setattr(tokenizer.Tokenizer, "CACHE_SIZE", 2)
+        monkeypatch.setattr(tokenizer.Tokenizer, "_cache",
+                            tokenizer.OrderedDict())
+        for formula in ("=A1", "=A2", "=A1", "=A3"):
+            tokenizer.Tokenizer(formula)
+        assert list(tokenizer.Tokenizer._cache) == ["=A1", "=A3"]
+
     @pytest.mark.parametrize('formula, offset, result', [
         ('"spamspamspam"spam', 0, '"spamspamspam"'),
         ('"this is "" a test "" "test', 0, '"this is "" a test "" "'),
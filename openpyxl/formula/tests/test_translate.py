@@ -233,3 +233,12 @@ class TestTranslator(object):
                                origin, dest, result):
         trans = Translator(formula, origin)
         assert trans.translate_formula(dest) == result
+
+    def test_translate_formula_repeatedly(self, Translator, TranslatorError):
+        trans = Translator('=SUM($A1:B$2)*C3+name+"D4"', "B2")
+        assert trans.translate_formula("C4") == '=SUM($A3:C$2)*D5+name+"D4"'
+        assert trans.translate_formula("B2") == '=SUM($A1:B$2)*C3+name+"D4"'
+        with pytest.raises(TranslatorError):
+            trans.translate_formula("B1")
+        with pytest.raises(TranslatorError):
+            Translator("=ZZZ1", "A1").translate_formula("B1")
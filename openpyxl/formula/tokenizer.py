@@ -8,6 +8,8 @@ Bachtal
 
 import re
 
+from openpyxl.compat import OrderedDict
+
 
 class TokenizerError(Exception):
     "Base class for all Tokenizer errors."
@@ -26,8 +28,14 @@ class Tokenizer(object):
     Tokenizer defines a method `._parse()` to parse the formula into tokens,
     which can then be accessed through the `.items` attribute.
 
+    The tokens of recently parsed formulae are kept so that the same formula
+    is only parsed once. Each tokenizer gets its own copies of the tokens.
+
     """
 
+    CACHE_SIZE = 1024
+    _cache = OrderedDict()
+
     SN_RE = re.compile("^[1-9](\\.[0-9]+)?[Ee]$")  # Scientific notation
     WSPACE_RE = re.compile(" +")
     STRING_REGEXES = {
@@ -50,7 +58,34 @@ class Tokenizer(object):
                                # parentheses
         self.offset = 0  # How many chars have we read
         self.token = []  # Used to build up token values char by char
-        self._parse()
+        cached = self._cached(formula)
+        if cached is None:
+            self._parse()
+            self._store(formula, self.items)
+        else:
+            self.items = [Token(t.value, t.type, t.subtype) for t in cached]
+            self.offset = len(formula)
+
+    @classmethod
+    def _cached(cls, formula):
+        "Tokens of a recently parsed formula or None."
+        try:
+            items = cls._cache.pop(formula)
+        except KeyError:
+            return None
+        cls._cache[formula] = items  # most recently used go last
+        return items
+
+    @classmethod
+    def _store(cls, formula, items):
+        cache = cls._cache
+        cache[formula] = tuple(Token(t.value, t.type, t.subtype)
+                               for t in items)
+        while len(cache) > cls.CACHE_SIZE:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
 
     def _parse(self):
         "Populate self.items with the tokens from the formula."
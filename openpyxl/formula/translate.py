@@ -48,6 +48,7 @@ class Translator(object):
         col, self.row = coordinate_from_string(origin)
         self.col = column_index_from_string(col)
         self.tokenizer = Tokenizer(formula)
+        self._parts = None
 
     def get_tokens(self):
         "Returns a list with the tokens comprising the formula."
@@ -133,6 +134,73 @@ class Translator(object):
         return (ws_part + cls.translate_col(match.group(1), cdelta)
                 + cls.translate_row(match.group(2), rdelta))
 
+    # relative parts of compiled references
+    ROW = "row"
+    COL = "col"
+
+    @classmethod
+    def _compile_range(cls, range_str):
+        """
+        Split a range reference into the parts which `translate_range` would
+        change and the parts it would keep.
+
+        Returns a list of strings to keep and (ROW, row) or (COL, column)
+        tuples for relative rows and columns to be moved.
+        """
+        ws_part, range_str = cls.strip_ws_name(range_str)
+        match = cls.ROW_RANGE_RE.match(range_str)
+        if match is not None:
+            return ([ws_part] + cls._compile_row(match.group(1)) + [":"]
+                    + cls._compile_row(match.group(2)))
+        match = cls.COL_RANGE_RE.match(range_str)
+        if match is not None:
+            return ([ws_part] + cls._compile_col(match.group(1)) + [":"]
+                    + cls._compile_col(match.group(2)))
+        if ':' in range_str:
+            parts = [ws_part]
+            for idx, piece in enumerate(range_str.split(':')):
+                if idx:
+                    parts.append(":")
+                parts.extend(cls._compile_range(piece))
+            return parts
+        match = cls.CELL_REF_RE.match(range_str)
+        if match is None:
+            return [range_str]
+        return ([ws_part] + cls._compile_col(match.group(1))
+                + cls._compile_row(match.group(2)))
+
+    @classmethod
+    def _compile_row(cls, row_str):
+        if row_str.startswith('$'):
+            return [row_str]
+        return [(cls.ROW, int(row_str))]
+
+    @classmethod
+    def _compile_col(cls, col_str):
+        if col_str.startswith('$'):
+            return [col_str]
+        return [(cls.COL, column_index_from_string(col_str))]
+
+    def _compile(self):
+        """
+        Parts of the whole formula with consecutive strings joined.
+        """
+        parts = ['=']
+        for token in self.get_tokens():
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                pieces = self._compile_range(token.value)
+            else:
+                pieces = [token.value]
+            for piece in pieces:
+                if isinstance(piece, tuple):
+                    parts.append(piece)
+                elif piece:
+                    if isinstance(parts[-1], tuple):
+                        parts.append(piece)
+                    else:
+                        parts[-1] += piece
+        return parts
+
     def translate_formula(self, dest):
         """
         Convert the formula into A1 notation.
@@ -146,7 +214,6 @@ class Translator(object):
             return ""
         elif tokens[0].type == Token.LITERAL:
             return tokens[0].value
-        out = ['=']
         # per the spec:
         # A compliant producer or consumer considers a defined name in the
         # range A1-XFD1048576 to be an error. All other names outside this
@@ -156,10 +223,22 @@ class Translator(object):
         dcol = column_index_from_string(dcol)
         row_delta = drow - self.row
         col_delta = dcol - self.col
-        for token in tokens:
-            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
-                out.append(self.translate_range(token.value, row_delta,
-                                                col_delta))
-            else:
-                out.append(token.value)
+        # the formula is only split up once for all destinations
+        if self._parts is None:
+            self._parts = self._compile()
+        out = []
+        for part in self._parts:
+            if isinstance(part, tuple):
+                kind, value = part
+                if kind == self.ROW:
+                    value += row_delta
+                    if value <= 0:
+                        raise TranslatorError("Formula out of range")
+                    part = str(value)
+                else:
+                    try:
+                        part = get_column_letter(value + col_delta)
+                    except ValueError:
+                        raise TranslatorError("Formula out of range")
+            out.append(part)
         return "".join(out)
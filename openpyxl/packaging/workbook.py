@@ -92,7 +92,7 @@ class WorkbookParser:
         for defn in self.wb.defined_names.definedName:
             reserved = defn.is_reserved
             if reserved in ("Print_Titles", "Print_Area"):
-                sheet = self.wb._sheets[defn.localSheetId]
+                sheet = self.wb._load_sheet(self.wb._sheets[defn.localSheetId])
                 if reserved == "Print_Titles":
                     rows, cols = _unpack_print_titles(defn)
                     sheet.print_title_rows = rows
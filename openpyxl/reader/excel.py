@@ -5,6 +5,7 @@ from __future__ import absolute_import
 
 # Python stdlib imports
 from zipfile import ZipFile, ZIP_DEFLATED, BadZipfile
+from functools import partial
 from sys import exc_info
 from io import BytesIO
 import os.path
@@ -39,6 +40,7 @@ from openpyxl.xml.constants import (
 
 from openpyxl.comments.comment_sheet import CommentSheet
 from openpyxl.workbook import Workbook
+from openpyxl.workbook.workbook import LazySheet
 
 from .strings import read_string_table
 from openpyxl.styles.stylesheet import apply_stylesheet
@@ -48,6 +50,7 @@ from openpyxl.packaging.manifest import Manifest, Override
 from openpyxl.packaging.workbook import WorkbookParser
 from openpyxl.packaging.relationship import get_dependents, get_rels_path
 
+from openpyxl.worksheet import Worksheet
 from openpyxl.worksheet.read_only import ReadOnlyWorksheet
 from openpyxl.worksheet.table import Table
 
@@ -138,8 +141,48 @@ def _find_workbook_part(package):
     raise IOError("File contains no valid workbook part")
 
 
+def _read_worksheet(ws, archive, worksheet_path, rels, shared_strings):
+    """
+    Parse a worksheet and its comments and tables from the archive
+    """
+    wb = ws.parent
+    fh = archive.open(worksheet_path)
+    ws._rels = rels
+    ws_parser = WorkSheetParser(ws, fh, shared_strings)
+    ws_parser.parse()
+
+    if rels:
+        # assign any comments to cells
+        for r in rels.find(COMMENTS_NS):
+            src = archive.read(r.target)
+            comment_sheet = CommentSheet.from_tree(fromstring(src))
+            for ref, comment in comment_sheet.comments:
+                ws[ref].comment = comment
+
+        # preserve link to VML file if VBA
+        if (
+            wb.vba_archive is not None
+            and ws.legacy_drawing is not None
+            ):
+            ws.legacy_drawing = rels[ws.legacy_drawing].target
+
+        for t in ws_parser.tables:
+            src = archive.read(t)
+            xml = fromstring(src)
+            table = Table.from_tree(xml)
+            ws.add_table(table)
+    ws._rels = [] # reset
+
+
+def _load_worksheet(wb, archive, worksheet_path, rels, shared_strings, title):
+    ws = Worksheet(wb, title)
+    _read_worksheet(ws, archive, worksheet_path, rels, shared_strings)
+    return ws
+
+
 def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, guess_types=False, keep_links=True):
+                  data_only=False, guess_types=False, keep_links=True,
+                  lazy=False):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -160,6 +203,9 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
     :param keep_links: whether links to external workbooks should be preserved. The default is True
     :type keep_links: bool
 
+    :param lazy: only read worksheets when they are first used. The file is kept open until the workbook is closed
+    :type lazy: bool
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
@@ -235,42 +281,26 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
         if read_only:
             ws = ReadOnlyWorksheet(wb, sheet_name, worksheet_path, None,
                                    shared_strings)
+            ws._rels = []
 
+            wb._sheets.append(ws)
+        elif lazy:
+            loader = partial(_load_worksheet, wb, archive, worksheet_path, rels,
+                             shared_strings)
+            ws = LazySheet(wb, sheet_name, loader)
             wb._sheets.append(ws)
         else:
-            fh = archive.open(worksheet_path)
             ws = wb.create_sheet(sheet_name)
-            ws._rels = rels
-            ws_parser = WorkSheetParser(ws, fh, shared_strings)
-            ws_parser.parse()
-
-            if rels:
-                # assign any comments to cells
-                for r in rels.find(COMMENTS_NS):
-                    src = archive.read(r.target)
-                    comment_sheet = CommentSheet.from_tree(fromstring(src))
-                    for ref, comment in comment_sheet.comments:
-                        ws[ref].comment = comment
-
-                # preserve link to VML file if VBA
-                if (
-                    wb.vba_archive is not None
-                    and ws.legacy_drawing is not None
-                    ):
-                    ws.legacy_drawing = rels[ws.legacy_drawing].target
-
-                for t in ws_parser.tables:
-                    src = archive.read(t)
-                    xml = fromstring(src)
-                    table = Table.from_tree(xml)
-                    ws.add_table(table)
+            _read_worksheet(ws, archive, worksheet_path, rels, shared_strings)
 
         ws.sheet_state = sheet.state
-        ws._rels = [] # reset
 
     parser.assign_names()
 
     #wb._differential_styles.styles =  [] # tables may depened upon dxf
 
-    archive.close()
+    if lazy and not read_only:
+        wb._archive = archive
+    else:
+        archive.close()
     return wb
@@ -0,0 +1,169 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+"""Read the rows of several worksheets concurrently"""
+
+import multiprocessing
+import pickle
+from sys import exc_info
+
+try:
+    from queue import Empty
+except ImportError:
+    from Queue import Empty
+
+from openpyxl.xml.constants import ARC_CONTENT_TYPES
+from openpyxl.xml.functions import fromstring
+from openpyxl.packaging.manifest import Manifest
+from openpyxl.packaging.workbook import WorkbookParser
+
+from .excel import (
+    load_workbook,
+    _validate_archive,
+    _find_workbook_part,
+)
+
+
+def sheet_names(filename):
+    """
+    Return the names of the worksheets of a workbook without reading them
+    """
+    archive = _validate_archive(filename)
+    try:
+        package = Manifest.from_tree(fromstring(archive.read(ARC_CONTENT_TYPES)))
+        wb_part = _find_workbook_part(package)
+        parser = WorkbookParser(archive, wb_part.PartName[1:])
+        parser.parse()
+        valid_files = archive.namelist()
+        return [sheet.name for sheet, rel in parser.find_sheets()
+                if rel.target in valid_files]
+    finally:
+        archive.close()
+
+
+def read_rows(filename, sheetname, batch_size=1000, data_only=False):
+    """
+    Read a worksheet in read-only mode and return its rows as lists of
+    tuples of values
+    """
+    wb = load_workbook(filename, read_only=True, data_only=data_only)
+    try:
+        batch = []
+        for row in wb[sheetname].iter_rows():
+            batch.append(tuple(cell.value for cell in row))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        wb.close()
+
+
+# queue for the batches of worker processes
+_QUEUE = None
+
+# seconds to wait for a batch before checking the worker processes
+POLL_INTERVAL = 1
+
+
+def _init_worker(queue):
+    global _QUEUE
+    _QUEUE = queue
+
+
+def _picklable(exc):
+    """
+    The exception itself if it can be sent to another process, otherwise a
+    RuntimeError describing it
+    """
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        exc = RuntimeError("{0}: {1}".format(type(exc).__name__, exc))
+    return exc
+
+
+def _scan_sheet(task):
+    idx = task[0]
+    try:
+        for batch in read_rows(*task[1:]):
+            _QUEUE.put((idx, batch))
+    except Exception:
+        _QUEUE.put((idx, _picklable(exc_info()[1])))
+    _QUEUE.put((idx, None))
+
+
+def _check_workers(pool, workers, result):
+    """
+    Raise an exception if a task failed or a worker process died, in which
+    case batches will never arrive
+    """
+    if result.ready() and not result.successful():
+        result.get()
+    workers.update(pool._pool)
+    for process in workers:
+        if process.exitcode:
+            raise RuntimeError(
+                "Worker process {0} exited with code {1}".format(
+                    process.pid, process.exitcode))
+
+
+def read_rows_parallel(sources, processes=None, batch_size=1000, data_only=False):
+    """
+    Read the rows of worksheets in a pool of processes.
+
+    `sources` are filenames, in which case all worksheets of the workbook are
+    read, or (filename, sheetname) pairs. Each worksheet is read by one
+    process which opens its own copy of the workbook.
+
+    Yields (filename, sheetname, rows) with lists of up to `batch_size` rows
+    of values as they become available. Batches of different worksheets are
+    interleaved but those of each worksheet are in order.
+
+    Starting the processes and sending the rows back to this one take time,
+    so this is only faster than reading the worksheets one after the other
+    for several large worksheets and as many free cpus. With a single
+    process the worksheets are read in this process.
+
+    :raise: RuntimeError when a worker process dies
+    """
+    tasks = []
+    for source in sources:
+        if isinstance(source, tuple):
+            filename, names = source[0], [source[1]]
+        else:
+            filename, names = source, sheet_names(source)
+        for name in names:
+            tasks.append((len(tasks), filename, name, batch_size, data_only))
+    if not tasks:
+        return
+
+    processes = processes or multiprocessing.cpu_count()
+    if processes == 1:
+        for task in tasks:
+            for batch in read_rows(*task[1:]):
+                yield task[1], task[2], batch
+        return
+
+    queue = multiprocessing.Queue(4 * processes)
+    pool = multiprocessing.Pool(processes, _init_worker, (queue,))
+    try:
+        workers = set(pool._pool)
+        result = pool.map_async(_scan_sheet, tasks, chunksize=1)
+        remaining = len(tasks)
+        while remaining:
+            try:
+                idx, batch = queue.get(timeout=POLL_INTERVAL)
+            except Empty:
+                _check_workers(pool, workers, result)
+                continue
+            if batch is None:
+                remaining -= 1
+            elif isinstance(batch, Exception):
+                raise batch
+            else:
+                yield tasks[idx][1], tasks[idx][2], batch
+    finally:
+        pool.terminate()
+        pool.join()
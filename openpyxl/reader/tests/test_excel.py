@@ -162,3 +162,59 @@ def test_no_external_links(datadir, load_workbook):
 
     wb = load_workbook("bug137.xlsx", keep_links=False)
     assert wb.keep_links is False
+
+
+def test_lazy_load(load_workbook):
+    from openpyxl.workbook import Workbook
+    from openpyxl.workbook.workbook import LazySheet
+
+    wb = Workbook()
+    wb.active.append([1, "a"])
+    for title in ("Lactate", "Pyruvate"):
+        ws = wb.create_sheet(title)
+        ws.append([title])
+    wb["Pyruvate"].sheet_state = "hidden"
+    out = BytesIO()
+    wb.save(out)
+
+    wb = load_workbook(out, lazy=True)
+    assert wb.sheetnames == ["Sheet", "Lactate", "Pyruvate"]
+    assert all(isinstance(s, LazySheet) for s in wb._sheets)
+    assert "Pyruvate" in wb
+
+    ws = wb["Lactate"]
+    assert ws.title == "Lactate"
+    assert ws["A1"].value == "Lactate"
+    assert wb._sheets[1] is ws
+    assert isinstance(wb._sheets[2], LazySheet)
+
+    assert wb.active["B1"].value == "a"
+    sheets = wb.worksheets
+    assert [ws.title for ws in sheets] == wb.sheetnames
+    assert sheets[2].sheet_state == "hidden"
+    assert wb.index(sheets[2]) == 2
+
+    wb.close()
+    assert wb._archive.fp is None
+
+
+def test_lazy_save_in_place(tmpdir, load_workbook):
+    from openpyxl.workbook import Workbook
+    tmpdir.chdir()
+    wb = Workbook()
+    wb.active.append([1, "a"])
+    ws = wb.create_sheet("Lactate")
+    ws.append(["Lactate"])
+    # larger than the buffer of the file the sheets are read from
+    ws.append_rows([[idx, idx * 1.5] for idx in range(5000)])
+    wb.save("lazy.xlsx")
+
+    wb = load_workbook("lazy.xlsx", lazy=True)
+    wb.active["C1"] = 2
+    wb.save("lazy.xlsx")
+    wb.close()
+
+    wb = load_workbook("lazy.xlsx")
+    assert wb["Sheet"]["C1"].value == 2
+    assert wb["Lactate"]["A1"].value == "Lactate"
+    assert wb["Lactate"]["B5001"].value == 4999 * 1.5
@@ -0,0 +1,112 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+import multiprocessing
+import os
+
+import pytest
+
+from openpyxl.workbook import Workbook
+
+
+# workers only see functions patched in the tests if they are forked
+forked = pytest.mark.skipif(
+    getattr(multiprocessing, "get_start_method", lambda: "fork")() != "fork",
+    reason="worker processes are not forked")
+
+
+@pytest.fixture
+def workbooks(tmpdir):
+    tmpdir.chdir()
+    filenames = []
+    for name in ("first.xlsx", "second.xlsx"):
+        wb = Workbook()
+        ws1 = wb.active
+        ws1.title = "Data"
+        for idx in range(25):
+            ws1.append([idx, name, idx * 0.5])
+        ws2 = wb.create_sheet("Empty")
+        wb.save(name)
+        filenames.append(name)
+    return filenames
+
+
+def test_sheet_names(workbooks):
+    from ..parallel import sheet_names
+    assert sheet_names("first.xlsx") == ["Data", "Empty"]
+
+
+def test_read_rows(workbooks):
+    from ..parallel import read_rows
+    batches = list(read_rows("first.xlsx", "Data", batch_size=10))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert batches[0][1] == (1, "first.xlsx", 0.5)
+
+
+def test_read_rows_parallel(workbooks):
+    from ..parallel import read_rows_parallel
+    sources = workbooks + [("first.xlsx", "Data")]
+    results = {}
+    for filename, sheetname, rows in read_rows_parallel(sources, 2, batch_size=7):
+        assert len(rows) <= 7
+        results.setdefault((filename, sheetname), []).extend(rows)
+    assert sorted(results) == [("first.xlsx", "Data"), ("second.xlsx", "Data")]
+    rows = results[("second.xlsx", "Data")]
+    assert rows == [(idx, "second.xlsx", idx * 0.5) for idx in range(25)]
+    assert len(results[("first.xlsx", "Data")]) == 50
+
+
+def test_read_rows_parallel_error(workbooks):
+    from ..parallel import read_rows_parallel
+    with pytest.raises(KeyError):
+        list(read_rows_parallel([("first.xlsx", "Missing")], 1))
+    with pytest.raises(KeyError):
+        list(read_rows_parallel([("first.xlsx", "Missing")], 2))
+
+
+class Unpicklable(Exception):
+
+    def __init__(self):
+        super(Unpicklable, self).__init__("cannot be sent")
+        self.lock = multiprocessing.Lock()
+
+
+def _raise_unpicklable(*args):
+    raise Unpicklable()
+    yield
+
+
+def _exit(*args):
+    os._exit(3)
+    yield
+
+
+@forked
+def test_read_rows_parallel_unpicklable_error(workbooks, monkeypatch):
+    from .. import parallel
+    monkeypatch.setattr(parallel, "read_rows", _raise_unpicklable)
+    with pytest.raises(RuntimeError) as err:
+        list(parallel.read_rows_parallel(workbooks, 2))
+    assert str(err.value) == "Unpicklable: cannot be sent"
+
+
+@forked
+def test_read_rows_parallel_worker_died(workbooks, monkeypatch):
+    from .. import parallel
+    monkeypatch.setattr(parallel, "read_rows", _exit)
+    monkeypatch.setattr(parallel, "POLL_INTERVAL", 0.1)
+    with pytest.raises(RuntimeError) as err:
+        list(parallel.read_rows_parallel(workbooks, 2))
+    assert "exited with code 3" in str(err.value)
+
+
+def test_read_rows_single_process(workbooks, monkeypatch):
+    from .. import parallel
+
+    def no_pool(*args):
+        raise AssertionError("no pool should be started")
+    monkeypatch.setattr(parallel.multiprocessing, "Pool", no_pool)
+    rows = list(parallel.read_rows_parallel(["first.xlsx"], 1, batch_size=10))
+    assert [(f, s, len(r)) for f, s, r in rows] == [
+        ("first.xlsx", "Data", 10), ("first.xlsx", "Data", 10),
+        ("first.xlsx", "Data", 5)]
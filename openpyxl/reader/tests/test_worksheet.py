@@ -196,6 +196,26 @@ def test_styled_row(datadir, WorkSheetParser):
     assert dict(rd) == {'s':'28', 'customFormat':'1'}
 
 
+def test_parse_row_styles(WorkSheetParser):
+    parser = WorkSheetParser
+    ws = parser.ws
+
+    src = """
+    <x:row r="3" xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <x:c r="A3" s="29"><x:v>1</x:v></x:c>
+      <x:c r="b3" s="29"><x:v>2</x:v></x:c>
+      <x:c r="$C$3"><x:v>3</x:v></x:c>
+    </x:row>
+    """
+    parser.parse_row(fromstring(src))
+
+    assert [c.value for c in ws[3]] == [1, 2, 3]
+    a3, b3 = ws["A3"], ws["B3"]
+    assert a3._style == b3._style == parser.styles[29]
+    assert a3._style is not b3._style
+    assert ws.calculate_dimension() == "A3:C3"
+
+
 def test_sheet_protection(datadir, WorkSheetParser):
     datadir.chdir()
     parser = WorkSheetParser
@@ -232,6 +252,23 @@ def test_formula_without_value(WorkSheetParser):
     assert ws['A1'].value == '=IF(TRUE, "y", "n")'
 
 
+def test_column_lookup(WorkSheetParser, monkeypatch):
+    from openpyxl.reader import worksheet
+    from openpyxl.utils.cell import _ColumnIndices
+    cache = _ColumnIndices()
+    monkeypatch.setattr(worksheet, "_COL_STRING_CACHE", cache)
+    parser = WorkSheetParser
+
+    src = """
+    <x:c r="XFA7" xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <x:v>1</x:v>
+    </x:c>
+    """
+    parser.parse_cell(fromstring(src))
+    assert cache == {"XFA": 16381}
+    assert parser.ws.cell(row=7, column=16381).value == 1
+
+
 def test_formula(WorkSheetParser):
     parser = WorkSheetParser
     ws = parser.ws
@@ -592,6 +629,25 @@ def test_merge_cells(WorkSheetParser):
     assert parser.ws._merged_cells == ["C2:F2", "B19:C20", "E19:G19"]
 
 
+def test_overlapping_merge_cells(WorkSheetParser, recwarn):
+    src = """
+    <sheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <mergeCells>
+        <mergeCell ref="C2:F2"/>
+        <mergeCell ref="D1:D3"/>
+      </mergeCells>
+    </sheet>
+    """
+
+    parser = WorkSheetParser
+    parser.source = src
+
+    parser.parse()
+
+    assert parser.ws._merged_cells == ["C2:F2"]
+    assert recwarn.pop(UserWarning)
+
+
 def test_conditonal_formatting(WorkSheetParser):
     src = """
     <sheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
@@ -615,6 +671,30 @@ def test_conditonal_formatting(WorkSheetParser):
     assert parser.ws.conditional_formatting.cf_rules['T1:T10'][-1].dxf == dxf
 
 
+def test_whole_column_conditional_formatting(WorkSheetParser):
+    src = """
+    <sheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+      <conditionalFormatting sqref="A:A">
+        <cfRule type="duplicateValues" dxfId="0" priority="2"/>
+      </conditionalFormatting>
+      <conditionalFormatting sqref="3:3 $C$1:$C$2">
+        <cfRule type="containsBlanks" dxfId="0" priority="1"/>
+      </conditionalFormatting>
+    </sheet>
+    """
+    parser = WorkSheetParser
+    parser.differential_styles = [None]
+    parser.source = src
+
+    parser.parse()
+
+    cf = parser.ws.conditional_formatting
+    assert list(cf.cf_rules) == ["A:A", "3:3 $C$1:$C$2"]
+    assert [r.type for r in cf.rules(3, 1)] == ["containsBlanks", "duplicateValues"]
+    assert [r.type for r in cf.rules(1048576, 1)] == ["duplicateValues"]
+    assert [r.type for r in cf.rules(2, 3)] == ["containsBlanks"]
+
+
 def test_sheet_properties(WorkSheetParser):
     src = """
     <sheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
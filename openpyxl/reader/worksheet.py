@@ -3,6 +3,7 @@ from __future__ import absolute_import
 
 """Reader for a single worksheet."""
 from io import BytesIO
+from string import digits as DIGITS
 from warnings import warn
 
 # compatibility imports
@@ -44,6 +45,7 @@ from openpyxl.utils import (
     column_index_from_string,
     coordinate_to_tuple,
     )
+from openpyxl.utils.cell import _COL_STRING_CACHE
 from openpyxl.descriptors.excel import ExtensionList, Extension
 from openpyxl.worksheet.table import TablePartList
 
@@ -133,11 +135,19 @@ class WorkSheetParser(object):
         self.ws._current_row = self.ws.max_row
 
 
-    def parse_cell(self, element):
-        value = element.find(self.VALUE_TAG)
-        if value is not None:
-            value = value.text
-        formula = element.find(self.FORMULA_TAG)
+    def parse_cell(self, element, cells=None):
+        """
+        Create a cell from its element and add it to `cells` or the worksheet
+        """
+        value = formula = inline = None
+        for child in element:
+            tag = child.tag
+            if tag == self.VALUE_TAG:
+                value = child.text
+            elif tag == self.FORMULA_TAG:
+                formula = child
+            elif tag == self.INLINE_STRING:
+                inline = child
         data_type = element.get('t', 'n')
         coordinate = element.get('r')
         self._col_count += 1
@@ -206,12 +216,23 @@ class WorkSheetParser(object):
             style_array = self.styles[style_id]
 
         if coordinate:
-            row, column = coordinate_to_tuple(coordinate)
+            letters = coordinate.rstrip(DIGITS)
+            try:
+                column = _COL_STRING_CACHE[letters]
+            except KeyError:
+                column = None
+            row = 0
+            if column is not None and letters != coordinate:
+                row = int(coordinate[len(letters):])
+            if not row:
+                row, column = coordinate_to_tuple(coordinate)
         else:
             row, column = self._row_count, self._col_count
 
         cell = Cell(self.ws, row=row, col_idx=column, style_array=style_array)
-        self.ws._cells[(row, column)] = cell
+        if cells is None:
+            cells = self.ws._cells
+        cells[(row, column)] = cell
 
         if value is not None:
             if data_type == 'n':
@@ -225,10 +246,9 @@ class WorkSheetParser(object):
 
         else:
             if data_type == 'inlineStr':
-                child = element.find(self.INLINE_STRING)
-                if child is not None:
+                if inline is not None:
                     data_type = 's'
-                    richtext = Text.from_tree(child)
+                    richtext = Text.from_tree(inline)
                     value = richtext.content
 
         if self.guess_types or value is None:
@@ -241,7 +261,10 @@ class WorkSheetParser(object):
     def parse_merge(self, element):
         merged = MergeCells.from_tree(element)
         for c in merged.mergeCell:
-            self.ws.merge_cells(c.ref)
+            try:
+                self.ws.merge_cells(c.ref)
+            except ValueError as e:
+                warn("{0} and will be ignored".format(e))
 
 
     def parse_column_dimensions(self, col):
@@ -276,8 +299,10 @@ class WorkSheetParser(object):
             dim = RowDimension(self.ws, **attrs)
             self.ws.row_dimensions[dim.index] = dim
 
+        cells = {}
         for cell in safe_iterator(row, self.CELL_TAG):
-            self.parse_cell(cell)
+            self.parse_cell(cell, cells)
+        self.ws._cells.update(cells)
 
 
     def parser_conditional_formatting(self, element):
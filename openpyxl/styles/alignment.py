@@ -4,7 +4,7 @@ from __future__ import absolute_import
 from openpyxl.compat import safe_string
 
 from openpyxl.descriptors import Bool, MinMax, Min, Alias, NoneSet
-from openpyxl.descriptors.serialisable import Serialisable
+from .hashable import HashableObject
 
 
 horizontal_alignments = (
@@ -14,7 +14,7 @@ vertical_aligments = (
     "top", "center", "bottom", "justify", "distributed",
 )
 
-class Alignment(Serialisable):
+class Alignment(HashableObject):
     """Alignment options for use in styles."""
 
     tagname = "alignment"
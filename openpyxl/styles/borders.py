@@ -10,7 +10,7 @@ from openpyxl.descriptors import (
     Sequence,
     Integer,
 )
-from openpyxl.descriptors.serialisable import Serialisable
+from .hashable import HashableObject
 
 from .colors import ColorDescriptor
 
@@ -31,7 +31,7 @@ BORDER_THICK = 'thick'
 BORDER_THIN = 'thin'
 
 
-class Side(Serialisable):
+class Side(HashableObject):
 
     """Border options for use in styles.
     Caution: if you do not specify a border_style, other attributes will
@@ -54,7 +54,7 @@ class Side(Serialisable):
         self.color = color
 
 
-class Border(Serialisable):
+class Border(HashableObject):
     """Border positioning for use in styles."""
 
     tagname = "border"
@@ -31,6 +31,9 @@ class ArrayDescriptor(object):
         instance[self.key] = value
 
 
+_tobytes = getattr(array, "tobytes", None) or array.tostring
+
+
 class StyleArray(array):
     """
     Simplified named tuple with an array
@@ -55,7 +58,7 @@ class StyleArray(array):
 
 
     def __hash__(self):
-        return hash(tuple(self))
+        return hash(_tobytes(self))
 
 
     def __copy__(self):
@@ -14,6 +14,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.excel import HexBinary, ExtensionList
 from openpyxl.descriptors.serialisable import Serialisable
+from .hashable import HashableObject
 
 # Default Color Index as per 18.8.27 of ECMA Part 4
 COLOR_INDEX = (
@@ -65,7 +66,7 @@ class RGB(Typed):
         super(RGB, self).__set__(instance, value)
 
 
-class Color(Serialisable):
+class Color(HashableObject):
     """Named colors for use in styles."""
 
     tagname = "color"
@@ -9,7 +9,7 @@ from openpyxl.descriptors import (
     Sequence,
     Integer,
 )
-from openpyxl.descriptors.serialisable import Serialisable
+from .hashable import HashableObject
 from openpyxl.descriptors.sequence import ValueSequence
 from openpyxl.compat import safe_string
 
@@ -48,7 +48,7 @@ fills = (FILL_SOLID, FILL_PATTERN_DARKDOWN, FILL_PATTERN_DARKGRAY,
          FILL_PATTERN_MEDIUMGRAY)
 
 
-class Fill(Serialisable):
+class Fill(HashableObject):
 
     """Base class"""
 
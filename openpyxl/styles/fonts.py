@@ -7,7 +7,7 @@ from openpyxl.descriptors import (
     Sequence,
     Integer
 )
-from openpyxl.descriptors.serialisable import Serialisable
+from .hashable import HashableObject
 
 from openpyxl.descriptors.nested import (
     NestedValue,
@@ -30,7 +30,7 @@ def _no_value(tagname, value, namespace=None):
         return Element(tagname, val=safe_string(value))
 
 
-class Font(Serialisable):
+class Font(HashableObject):
     """Font options used in styles."""
 
     UNDERLINE_DOUBLE = 'double'
@@ -0,0 +1,43 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+from openpyxl.descriptors.serialisable import Serialisable
+
+
+class HashableObject(Serialisable):
+    """
+    Style objects which remember their hash.
+
+    Style objects can contain each other, so changing one which has been
+    hashed makes all remembered hashes stale. Objects are usually built and
+    then only hashed when they are added to a workbook, so this rarely
+    happens. Lists of values must not be changed in place.
+    """
+
+    # incremented whenever an object with a remembered hash is changed
+    _generation = 0
+
+
+    def __setattr__(self, attr, value):
+        if "_hash" in self.__dict__:
+            del self.__dict__["_hash"]
+            HashableObject._generation += 1
+        super(HashableObject, self).__setattr__(attr, value)
+
+
+    def __hash__(self):
+        generation = HashableObject._generation
+        cached = self.__dict__.get("_hash")
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        value = super(HashableObject, self).__hash__()
+        self.__dict__["_hash"] = (generation, value)
+        return value
+
+
+    def __getstate__(self):
+        # hashes are specific to the process and proxies to the workbook
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        state.pop("_proxy", None)
+        return state
@@ -2,10 +2,10 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2017 openpyxl
 
 from openpyxl.descriptors import Bool
-from openpyxl.descriptors.serialisable import Serialisable
+from .hashable import HashableObject
 
 
-class Protection(Serialisable):
+class Protection(HashableObject):
     """Protection options for use in styles."""
 
     tagname = "protection"
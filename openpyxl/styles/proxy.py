@@ -61,3 +61,7 @@ class StyleProxy(object):
 
     def __ne__(self, other):
         return not self == other
+
+
+    def __hash__(self):
+        return hash(self.__target)
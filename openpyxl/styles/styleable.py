@@ -6,9 +6,8 @@ from warnings import warn
 
 from .numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_REVERSE
 from .proxy import StyleProxy
-from .cell_style import StyleArray
+from .cell_style import StyleArray, _tobytes
 from .named_styles import NamedStyle
-from .builtins import styles
 
 
 class StyleDescriptor(object):
@@ -17,11 +16,20 @@ class StyleDescriptor(object):
         self.collection = collection
         self.key = key
 
+    def index(self, workbook, value):
+        """
+        Index of a style object in the workbook collection
+        """
+        if isinstance(value, StyleProxy):
+            value = value._StyleProxy__target
+        return getattr(workbook, self.collection).add(value)
+
+
     def __set__(self, instance, value):
-        coll = getattr(instance.parent.parent, self.collection)
+        idx = self.index(instance.parent.parent, value)
         if not getattr(instance, "_style"):
             instance._style = StyleArray()
-        setattr(instance._style, self.key, coll.add(value))
+        setattr(instance._style, self.key, idx)
 
 
     def __get__(self, instance, cls):
@@ -29,7 +37,21 @@ class StyleDescriptor(object):
         if not getattr(instance, "_style"):
             instance._style = StyleArray()
         idx =  getattr(instance._style, self.key)
-        return StyleProxy(coll[idx])
+        return _proxy(coll[idx])
+
+
+def _proxy(target):
+    """
+    Return the proxy for a style object. Proxies are kept with the object so
+    that reading a style does not create a new one.
+    """
+    attrs = getattr(target, "__dict__", None)
+    if attrs is None:
+        return StyleProxy(target)
+    proxy = attrs.get("_proxy")
+    if proxy is None:
+        proxy = attrs["_proxy"] = StyleProxy(target)
+    return proxy
 
 
 class NumberFormatDescriptor(object):
@@ -37,12 +59,17 @@ class NumberFormatDescriptor(object):
     key = "numFmtId"
     collection = '_number_formats'
 
-    def __set__(self, instance, value):
-        coll = getattr(instance.parent.parent, self.collection)
+    def index(self, workbook, value):
+        """
+        Id of a number format, custom formats are added to the workbook
+        """
         if value in BUILTIN_FORMATS_REVERSE:
-            idx = BUILTIN_FORMATS_REVERSE[value]
-        else:
-            idx = coll.add(value) + 164
+            return BUILTIN_FORMATS_REVERSE[value]
+        return getattr(workbook, self.collection).add(value) + 164
+
+
+    def __set__(self, instance, value):
+        idx = self.index(instance.parent.parent, value)
         if not getattr(instance, "_style"):
             instance._style = StyleArray()
         setattr(instance._style, self.key, idx)
@@ -73,6 +100,7 @@ class NamedStyleDescriptor(object):
             if style not in coll:
                 instance.parent.parent.add_named_style(style)
         elif value not in coll.names:
+            from .builtins import styles # parsed on first use
             if value in styles: # is it builtin?
                 style = styles[value]
                 if style not in coll:
@@ -139,3 +167,58 @@ class StyleableObject(object):
         if self._style is None:
             return False
         return bool(self._style[7])
+
+
+class StyleUpdate(object):
+    """
+    Changes to the styles of many cells or dimensions. Style objects are
+    added to the workbook once and the changed styles are remembered by the
+    original ones.
+    """
+
+    def __init__(self, workbook, font=None, fill=None, border=None,
+                 number_format=None, protection=None, alignment=None):
+        styles = (
+            ('font', font),
+            ('fill', fill),
+            ('border', border),
+            ('number_format', number_format),
+            ('protection', protection),
+            ('alignment', alignment),
+        )
+        self.changes = []
+        for name, value in styles:
+            if value is not None:
+                desc = StyleableObject.__dict__[name]
+                self.changes.append((desc.key, desc.index(workbook, value)))
+        self._cell_styles = workbook._cell_styles
+        self._arrays = {}
+        self._ids = {}
+
+
+    def _changed(self, style):
+        key = style and _tobytes(style)
+        changed = self._arrays.get(key)
+        if changed is None:
+            changed = self._arrays[key] = StyleArray(style or StyleArray())
+            for attr, idx in self.changes:
+                setattr(changed, attr, idx)
+        return changed
+
+
+    def array(self, style):
+        """
+        A new style array with the changes applied to an existing one or None
+        """
+        return StyleArray(self._changed(style))
+
+
+    def style_id(self, style_id):
+        """
+        Id of the style with the changes applied to an existing style id
+        """
+        changed = self._ids.get(style_id)
+        if changed is None:
+            style = self._changed(self._cell_styles[style_id])
+            changed = self._ids[style_id] = self._cell_styles.add(StyleArray(style))
+        return changed
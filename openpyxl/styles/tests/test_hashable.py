@@ -0,0 +1,57 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+from copy import copy
+import pickle
+
+from ..borders import Border, Side
+from ..colors import Color
+from ..fonts import Font
+from ..proxy import StyleProxy
+
+
+class TestHashableObject:
+
+
+    def test_hash_is_cached(self):
+        font = Font(bold=True)
+        value = hash(font)
+        assert font.__dict__["_hash"][1] == value
+        assert hash(font) == value
+
+
+    def test_change(self):
+        font = Font(bold=True)
+        value = hash(font)
+        font.bold = False
+        assert "_hash" not in font.__dict__
+        assert hash(font) == hash(Font(bold=False))
+        assert hash(font) != value
+
+
+    def test_nested_change(self):
+        side = Side(style="thin", color=Color("FF0000"))
+        border = Border(left=side)
+        value = hash(border)
+        side.color.rgb = "FF00FF00"
+        assert hash(border) != value
+        assert hash(border) == hash(Border(left=Side(style="thin",
+                                                     color=Color("FF00FF00"))))
+
+
+    def test_copy(self):
+        font = Font(bold=True)
+        hash(font)
+        cp = copy(font)
+        assert cp == font
+        assert "_hash" not in cp.__dict__
+
+
+    def test_pickle(self):
+        font = Font(bold=True)
+        hash(font)
+        font.__dict__["_proxy"] = StyleProxy(font)
+        cp = pickle.loads(pickle.dumps(font))
+        assert cp == font
+        assert "_hash" not in cp.__dict__
+        assert "_proxy" not in cp.__dict__
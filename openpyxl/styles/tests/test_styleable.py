@@ -80,6 +80,38 @@ def test_has_style(StyleableObject):
     assert so.has_style
 
 
+class TestStyleUpdate:
+
+    def test_changes(self):
+        from openpyxl import Workbook
+        from ..styleable import StyleUpdate
+        wb = Workbook()
+        update = StyleUpdate(wb, font=Font(bold=True), number_format="0.00")
+        assert update.changes == [("fontId", 1), ("numFmtId", 2)]
+
+
+    def test_array(self):
+        from openpyxl import Workbook
+        from ..styleable import StyleUpdate
+        from ..cell_style import StyleArray
+        update = StyleUpdate(Workbook(), number_format="0.000")
+        style = StyleArray([1, 0, 0, 0, 0, 0, 0, 0, 0])
+        changed = update.array(style)
+        assert list(changed) == [1, 0, 0, 164, 0, 0, 0, 0, 0]
+        assert update.array(style) is not changed
+        assert list(update.array(None)) == [0, 0, 0, 164, 0, 0, 0, 0, 0]
+
+
+    def test_style_id(self):
+        from openpyxl import Workbook
+        from ..styleable import StyleUpdate
+        wb = Workbook()
+        update = StyleUpdate(wb, number_format="0.000")
+        assert update.style_id(0) == 1
+        assert update.style_id(0) == 1
+        assert list(wb._cell_styles[1]) == [0, 0, 0, 164, 0, 0, 0, 0, 0]
+
+
 class TestNamedStyle:
 
     def test_assign_name(self, StyleableObject):
@@ -136,3 +168,19 @@ class TestNamedStyle:
         s1.style = "Hyperlink"
         s2.style = "Hyperlink"
         assert s1._style is not s2._style
+
+
+def test_assign_proxy(StyleableObject):
+    so = StyleableObject
+    so.font = Font(bold=True)
+    so.border = Border()
+    so.font = so.font
+    assert so.font.b is True
+    fonts = so.parent.parent._fonts
+    assert all(type(font) is Font for font in fonts)
+
+
+def test_proxy_is_reused(StyleableObject):
+    so = StyleableObject
+    so.fill = PatternFill(patternType="solid")
+    assert so.fill is so.fill
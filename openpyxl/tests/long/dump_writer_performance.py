@@ -17,3 +17,21 @@ def test_large_append(mode):
             print("%.2f%%" % (100 * (float(idx) / float(total_rows))))
         ws.append(row)
     wb.save(tempfile.TemporaryFile(mode='wb'))
+
+
+@pytest.mark.parametrize("row", [
+    (1, 2.5, True),
+    ('this is some text', 'more text', 3.14),
+    (1, 'text', 3.14, None, False, 2**40),
+])
+def test_write_only_rows_per_second(row):
+    from time import time
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    total_rows = int(1e5)
+    start = time()
+    for idx in range(total_rows):
+        ws.append(row)
+    ws.close()
+    elapsed = time() - start
+    print("{0!r}: {1:.0f} rows/second".format(row, total_rows / elapsed))
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+
+def import_time(runs=5):
+    """
+    Best time of importing openpyxl in a fresh interpreter
+    """
+    script = ("from time import time; start = time(); import openpyxl; "
+              "print(time() - start)")
+    times = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, "-c", script])
+        times.append(float(out))
+    return min(times)
+
+
+def test_import_time():
+    print("import openpyxl: {0:.3f}s".format(import_time()))
@@ -0,0 +1,25 @@
+import openpyxl
+from openpyxl.compat import range
+
+import os
+import tempfile
+from time import time
+
+import pytest
+
+
+@pytest.mark.parametrize("compression", ("store", "fast", "default", "max"))
+def test_save_compression(compression):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append_rows([[idx * j / 7.0 for j in range(20)] for idx in range(int(5e4))])
+    fd, filename = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        start = time()
+        wb.save(filename, compression=compression)
+        elapsed = time() - start
+        print("{0}: {1:.2f}s {2:.1f}MB".format(
+            compression, elapsed, os.path.getsize(filename) / 1e6))
+    finally:
+        os.remove(filename)
@@ -0,0 +1,43 @@
+import openpyxl
+from openpyxl.chart import BarChart, LineChart, Reference
+from openpyxl.compat import range
+from openpyxl.styles import Font, PatternFill, Border, Side
+
+import os
+import tempfile
+from time import time
+
+
+def make_workbook(sheets=10, charts=5):
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    side = Side(style="thin")
+    for idx in range(sheets):
+        ws = wb.create_sheet()
+        for row in range(1, 201):
+            for col in range(1, 11):
+                cell = ws.cell(row=row, column=col, value=row * col)
+                cell.font = Font(bold=row % 2 == 0, size=8 + col)
+                cell.fill = PatternFill("solid", fgColor="00{0:02X}8000".format(row % 256))
+                cell.border = Border(left=side, right=side)
+        for n in range(charts):
+            chart = (BarChart, LineChart)[n % 2]()
+            data = Reference(ws, min_col=1, min_row=1, max_col=10, max_row=200)
+            chart.add_data(data, titles_from_data=True)
+            ws.add_chart(chart, "L{0}".format(n * 15 + 1))
+    return wb
+
+
+def test_serialisation():
+    fd, filename = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        wb = make_workbook()
+        start = time()
+        wb.save(filename)
+        print("save: {0:.2f}s".format(time() - start))
+        start = time()
+        openpyxl.load_workbook(filename)
+        print("load: {0:.2f}s".format(time() - start))
+    finally:
+        os.remove(filename)
@@ -0,0 +1,28 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import openpyxl
+
+
+@pytest.mark.parametrize("module",
+                         [
+                             "numpy",
+                             "pandas",
+                             "multiprocessing",
+                             "openpyxl.styles.builtins",
+                         ]
+                         )
+def test_not_imported(module):
+    """
+    Rarely used packages should only be imported when they are needed
+    """
+    script = "import sys, openpyxl; print({0!r} in sys.modules)".format(module)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(openpyxl.__file__)))
+    out = subprocess.check_output([sys.executable, "-c", script], cwd=root)
+    assert out.strip() == b"False"
@@ -7,7 +7,7 @@ from io import BytesIO
 import pytest
 
 from openpyxl.styles.styleable import StyleArray
-from openpyxl.xml.functions import fromstring
+from openpyxl.xml.functions import fromstring, iterparse
 from openpyxl.reader.excel import load_workbook
 from openpyxl.compat import range
 from openpyxl.cell.read_only import EMPTY_CELL
@@ -414,3 +414,101 @@ def test_read_empty_sheet(datadir, read_only):
     wb = load_workbook("empty.xlsx", read_only=read_only)
     ws = wb.active
     assert tuple(ws.rows) == tuple(ws.iter_rows())
+
+
+@pytest.fixture
+def sheet_xml():
+    rows = "".join('<row r="{0}"><c r="A{0}"><v>{0}</v></c></row>'.format(idx)
+                   for idx in range(1, 101))
+    return ("""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">"""
+            """<sheetData>{0}</sheetData><rowBreaks count="0"/></worksheet>""".format(rows)).encode("ascii")
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024])
+def test_row_index(monkeypatch, sheet_xml, chunk_size):
+    from openpyxl.worksheet import read_only
+    from openpyxl.worksheet.read_only import RowIndex
+    monkeypatch.setattr(read_only, "CHUNK_SIZE", chunk_size)
+
+    index = RowIndex.from_source(BytesIO(sheet_xml), block_size=100)
+    assert index.header.endswith(b"<sheetData>")
+    assert index.rows[0] == 1
+    assert len(index.rows) > 10
+    for row, offset in zip(index.rows, index.offsets):
+        assert sheet_xml[offset:].startswith('<row r="{0}"'.format(row).encode("ascii"))
+
+    src = index.seek(BytesIO(sheet_xml), 55)
+    rows = [int(el.get("r")) for _, el in iterparse(src)
+            if el.tag.endswith("}row")]
+    assert rows[0] <= 55
+    assert rows[-1] == 100
+
+
+def test_row_index_without_coordinates():
+    from openpyxl.worksheet.read_only import RowIndex
+    src = BytesIO(b"""<worksheet><sheetData><row r="1"/><row/></sheetData></worksheet>""")
+    index = RowIndex.from_source(src, block_size=1)
+    assert index.rows == []
+
+
+def test_read_indexed_rows(tmpdir, monkeypatch, DummyWorkbook, ReadOnlyWorksheet, sheet_xml):
+    from openpyxl.worksheet.read_only import RowIndex
+    monkeypatch.setattr(RowIndex, "block_size", 100)
+    tmpdir.chdir()
+    with open("sheet.xml", "wb") as out:
+        out.write(sheet_xml)
+
+    ws = ReadOnlyWorksheet(DummyWorkbook, "Sheet", "", "sheet.xml", [])
+    assert ws.row_index is None
+    assert ws._get_cell(60, 1).value == 60
+    assert len(ws.row_index.rows) > 10
+    assert ws._get_cell(3, 1).value == 3
+    assert ws._get_cell(101, 1) is EMPTY_CELL
+    rows = ws.iter_rows(min_row=98, max_col=1)
+    assert [row[0].value for row in rows] == [98, 99, 100]
+
+
+@pytest.fixture
+def values_workbook(tmpdir):
+    from openpyxl import Workbook
+    tmpdir.chdir()
+    wb = Workbook()
+    ws = wb.active
+    ws.append([1, 2.5, "text", True])
+    ws.append([datetime.date(2017, 1, 2), None, "=A1+B1", 4])
+    ws["B4"] = 7
+    wb.save("values.xlsx")
+    return load_workbook("values.xlsx", read_only=True)
+
+
+def test_values_block(values_workbook):
+    ws = values_workbook.active
+    block = ws.values_block()
+    assert block == [[c.value for c in row] for row in ws.iter_rows()]
+    assert block[1][0] == datetime.datetime(2017, 1, 2)
+    assert ws.values_block(min_row=2, max_row=3, min_col=3) == [["=A1+B1", 4],
+                                                                [None, None]]
+
+
+@pytest.mark.numpy_required
+def test_to_numpy(values_workbook):
+    from numpy import isnan
+    ws = values_workbook.active
+    block = ws.to_numpy(max_col=2)
+    assert block.shape == (4, 2)
+    assert block[0].tolist() == [1, 2.5]
+    assert block[1, 0] == 42737
+    assert isnan(block[1, 1])
+    assert block[3, 1] == 7
+
+    block = ws.to_numpy(min_row=2, dtype=object)
+    assert block[0].tolist() == [datetime.datetime(2017, 1, 2), None, "=A1+B1", 4]
+
+
+@pytest.mark.numpy_required
+def test_to_numpy_dates(values_workbook):
+    ws = values_workbook.active
+    block = ws.to_numpy(min_row=2, max_row=2, max_col=2, dtype="datetime64[D]")
+    assert block.dtype.str == "<M8[D]"
+    assert str(block[0, 0]) == "2017-01-02"
+    assert str(block[0, 1]) == "NaT"
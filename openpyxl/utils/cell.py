@@ -89,12 +89,41 @@ def _get_column_letter(col_idx):
     return ''.join(reversed(letters))
 
 
-_COL_STRING_CACHE = {}
-_STRING_COL_CACHE = {}
-for i in range(1, 18279):
-    col = _get_column_letter(i)
-    _STRING_COL_CACHE[i] = col
-    _COL_STRING_CACHE[col] = i
+def _column_index(col):
+    """Convert column letters into an index or None if they are invalid
+    ('C' -> 3)
+    """
+    if not 1 <= len(col) <= 3:
+        return
+    idx = 0
+    for letter in col:
+        if not 'A' <= letter <= 'Z':
+            return
+        idx = idx * 26 + ord(letter) - 64
+    return idx
+
+
+class _ColumnLetters(dict):
+    """Column letters by index, calculated when first needed"""
+
+    def __missing__(self, idx):
+        col = self[idx] = _get_column_letter(idx)
+        return col
+
+
+class _ColumnIndices(dict):
+    """Column indices by letters, calculated when first needed"""
+
+    def __missing__(self, col):
+        idx = _column_index(col)
+        if idx is None:
+            raise KeyError(col)
+        self[col] = idx
+        return idx
+
+
+_COL_STRING_CACHE = _ColumnIndices()
+_STRING_COL_CACHE = _ColumnLetters()
 
 
 def get_column_letter(idx,):
@@ -103,7 +132,7 @@ def get_column_letter(idx,):
     """
     try:
         return _STRING_COL_CACHE[idx]
-    except KeyError:
+    except (KeyError, TypeError):
         raise ValueError("Invalid column index {0}".format(idx))
 
 
@@ -2,7 +2,10 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2017 openpyxl
 
 import numpy
-from pandas import Timestamp
+from pandas import DatetimeIndex, Timestamp, isnull
+
+from openpyxl.styles.numbers import FORMAT_DATE_DATETIME
+from .datetime import to_excel_array, CALENDAR_WINDOWS_1900
 
 
 def dataframe_to_rows(df, index=True, header=True):
@@ -17,19 +20,88 @@ def dataframe_to_rows(df, index=True, header=True):
         values = b.values
 
         if b.dtype.type == numpy.datetime64:
-            values = numpy.array([Timestamp(v) for v in values.ravel()])
-            values = values.reshape(b.shape)
-
-        result = values.tolist()
+            result = [DatetimeIndex(col).tolist() for col in values]
+        else:
+            result = numpy.asarray(values).reshape(b.shape).tolist()
 
         for col_loc, col in zip(b.mgr_locs, result):
             data[col_loc] = col
 
     if header:
-        values = list(df.columns.values)
-        if df.columns.dtype.type == numpy.datetime64:
-            values = [Timestamp(v) for v in values]
-        yield [None]*index + values
+        yield _header(df, index)
+
+    if index:
+        data.insert(0, list(df.index))
+    for row in zip(*data):
+        yield list(row)
+
+
+def _header(df, index):
+    values = list(df.columns.values)
+    if df.columns.dtype.type == numpy.datetime64:
+        values = [Timestamp(v) for v in values]
+    return [None]*index + values
+
+
+def _block_columns(values, base_date):
+    """
+    Lists of values for the rows of a block of a dataframe. Dates are
+    converted to serial numbers and missing values to None for the whole
+    block at once.
+    """
+    dates = values.dtype.type == numpy.datetime64
+    if dates:
+        values = to_excel_array(values, base_date)
+    missing = isnull(values)
+    if missing.any():
+        values = values.astype(object)
+        values[missing] = None
+    return values.tolist(), dates
+
+
+def dataframe_to_columns(df, index=True, base_date=CALENDAR_WINDOWS_1900):
+    """
+    Convert a Pandas dataframe into a list of values for each column, block
+    by block. Dates are converted to serial numbers and missing values to
+    None.
+
+    Return the columns and the indices of the columns containing dates,
+    counting from 1 as worksheets do.
+    """
+    blocks = df._data.blocks
+    ncols = sum(b.shape[0] for b in blocks)
+    data = [None] * ncols
+    date_cols = []
+
+    for b in blocks:
+        values = numpy.asarray(b.values).reshape(b.shape)
+        result, dates = _block_columns(values, base_date)
+        for col_loc, col in zip(b.mgr_locs, result):
+            data[col_loc] = col
+            if dates:
+                date_cols.append(col_loc + 1 + index)
 
-    for idx, v in enumerate(df.index):
-        yield [v]*index + [data[j][idx] for j in range(ncols)]
+    if index:
+        values = numpy.asarray(df.index.values).reshape(1, -1)
+        result, dates = _block_columns(values, base_date)
+        data.insert(0, result[0])
+        if dates:
+            date_cols.append(1)
+
+    return data, sorted(date_cols)
+
+
+def append_dataframe(ws, df, index=True, header=True):
+    """
+    Append a Pandas dataframe to a worksheet or a write-only worksheet.
+
+    The columns of the dataframe are converted block by block and the rows
+    are passed to the worksheet's `append_rows` with date formats for the
+    columns containing dates, so values are not converted cell by cell.
+    """
+    data, date_cols = dataframe_to_columns(df, index,
+                                           ws.parent.excel_base_date)
+    if header:
+        ws.append(_header(df, index))
+    formats = dict.fromkeys(date_cols, FORMAT_DATE_DATETIME)
+    ws.append_rows(zip(*data), formats)
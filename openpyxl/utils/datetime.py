@@ -70,6 +70,57 @@ def from_excel(value, offset=CALENDAR_WINDOWS_1900):
         return datetime.datetime(*parts[:3] + [0])
 
 
+def _epoch(offset):
+    """Day zero of a calendar as a NumPy date"""
+    import numpy
+    year, month, day, _ = jd2gcal(MJD_0, offset - MJD_0)
+    return numpy.datetime64(datetime.date(year, month, day), 'D')
+
+
+def to_excel_array(values, offset=CALENDAR_WINDOWS_1900):
+    """
+    Convert an array of dates or datetimes, such as a NumPy `datetime64`
+    array, to an array of serial numbers in one go. Not a Time becomes NaN.
+    """
+    import numpy
+    values = numpy.asarray(values)
+    if values.dtype.kind != "M":
+        values = values.astype("datetime64[us]")
+    day = numpy.timedelta64(1, 'D')
+    dates = values.astype("datetime64[D]")
+    days = (dates - _epoch(offset)) / day
+    if offset == CALENDAR_WINDOWS_1900:
+        days[days <= 60] -= 1 # 1900 is not a leap year
+    fraction = (values - dates) / numpy.timedelta64(1, 'us') / 10**6
+    return days + fraction / SECS_PER_DAY
+
+
+def from_excel_array(values, offset=CALENDAR_WINDOWS_1900):
+    """
+    Convert an array of serial numbers to a NumPy `datetime64` array in one
+    go. NaN becomes Not a Time. Unlike `from_excel` times of day are not
+    returned as times but on day zero of the calendar.
+    """
+    import numpy
+    values = numpy.array(values, dtype=float)
+    if offset == CALENDAR_WINDOWS_1900:
+        values[(values > 1) & (values < 60)] += 1 # 1900 is not a leap year
+    missing = numpy.isnan(values)
+    values[missing] = 0
+    days = numpy.floor(values)
+    micros = numpy.round((values - days) * SECS_PER_DAY * 10**6)
+    # as in from_excel times which are lost when adding the offset are
+    # taken as midnight
+    julian = (values + offset) - offset
+    jumped = (julian == numpy.floor(julian)) & (micros > 0)
+    days[jumped] = julian[jumped]
+    micros[jumped] = 0
+    result = (_epoch(offset) + days.astype("timedelta64[D]")
+              + micros.astype("timedelta64[us]"))
+    result[missing] = numpy.datetime64("NaT")
+    return result
+
+
 class GMT(tzinfo):
 
     def utcoffset(self, dt):
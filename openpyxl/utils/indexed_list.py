@@ -43,5 +43,8 @@ class IndexedList(list):
             list.append(self, value)
 
     def add(self, value):
-        self.append(value)
-        return self._dict[value]
+        idx = self._dict.get(value)
+        if idx is None:
+            idx = self._dict[value] = len(self)
+            list.append(self, value)
+        return idx
@@ -90,6 +90,11 @@ def test_column_letter(value, expected):
     assert get_column_letter(value) == expected
 
 
+def test_column_round_trip():
+    for idx in range(1, 18279):
+        assert column_index_from_string(get_column_letter(idx)) == idx
+
+
 def test_coordinate_tuple():
     from .. import coordinate_to_tuple
     assert coordinate_to_tuple("D15") == (15, 4)
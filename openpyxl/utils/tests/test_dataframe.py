@@ -25,3 +25,42 @@ def test_dataframe():
         [3, 3.0, 1.0, 'foo4', Timestamp('2009-01-06 00:00:00')],
         [4, 4.0, 0.0, 'foo5', Timestamp('2009-01-07 00:00:00')],
         )
+
+
+@pytest.mark.pandas_required
+def test_dataframe_to_columns():
+    import numpy
+    from pandas import DataFrame, to_datetime
+
+    from ..dataframe import dataframe_to_columns
+    df = DataFrame({"a": [1.5, numpy.nan], "b": ["x", None],
+                    "c": to_datetime(["2017-01-02 06:00", None])})
+
+    columns, date_cols = dataframe_to_columns(df)
+    assert columns == [[0, 1], [1.5, None], ["x", None], [42737.25, None]]
+    assert date_cols == [4]
+    columns, date_cols = dataframe_to_columns(df.set_index("c"), index=True)
+    assert columns[0] == [42737.25, None]
+    assert date_cols == [1]
+
+
+@pytest.mark.pandas_required
+@pytest.mark.parametrize("write_only", [False, True])
+def test_append_dataframe(tmpdir, write_only):
+    from datetime import datetime
+    from pandas import DataFrame, to_datetime
+    from openpyxl import Workbook, load_workbook
+
+    from ..dataframe import append_dataframe
+    tmpdir.chdir()
+    df = DataFrame({"a": [1.5, None],
+                    "b": to_datetime([None, "2017-01-02 06:00"])})
+    wb = Workbook(write_only=write_only)
+    ws = wb.create_sheet() if write_only else wb.active
+
+    append_dataframe(ws, df, index=False)
+    wb.save("frame.xlsx")
+
+    ws = load_workbook("frame.xlsx").active
+    assert list(ws.values) == [("a", "b"), (1.5, None),
+                               (None, datetime(2017, 1, 2, 6))]
@@ -88,6 +88,32 @@ def test_from_excel_mac(value, expected):
     assert FUT(value, CALENDAR_MAC_1904) == expected
 
 
+@pytest.mark.numpy_required
+@pytest.mark.parametrize("offset", ["CALENDAR_WINDOWS_1900", "CALENDAR_MAC_1904"])
+def test_to_excel_array(offset):
+    from numpy import array, isnan
+    from .. import datetime as dt
+    offset = getattr(dt, offset)
+    values = [datetime(1900, 1, 15), datetime(1900, 3, 1, 12),
+              datetime(2010, 1, 18, 14, 15, 20, 1600), datetime(1506, 10, 15)]
+    serials = dt.to_excel_array(array(values + [None], dtype="datetime64[us]"),
+                                offset)
+    assert serials[:-1].tolist() == [dt.to_excel(v, offset) for v in values]
+    assert isnan(serials[-1])
+
+
+@pytest.mark.numpy_required
+@pytest.mark.parametrize("offset", ["CALENDAR_WINDOWS_1900", "CALENDAR_MAC_1904"])
+def test_from_excel_array(offset):
+    from numpy import nan
+    from .. import datetime as dt
+    offset = getattr(dt, offset)
+    values = [40167, 59, 61.5, -25063, 40372.27616898148, 40196.5939815,
+              42126.958333333219, 42126.999999999884]
+    result = dt.from_excel_array(values + [nan], offset)
+    assert result.tolist() == [dt.from_excel(v, offset) for v in values] + [None]
+
+
 def test_time_to_days():
     from ..datetime  import time_to_days
     FUT = time_to_days
@@ -52,3 +52,11 @@ def test_table_builder(list):
             sb.append(letter)
         assert sb.index(letter) == result[letter]
     assert sb == ['a', 'b', 'c', 'd']
+
+
+def test_add(list):
+    l = list()
+    assert l.add('a') == 0
+    assert l.add('b') == 1
+    assert l.add('a') == 0
+    assert l == ['a', 'b']
@@ -217,3 +217,29 @@ class TestCopy:
         ws = wb.create_sheet()
         with pytest.raises(ValueError):
             wb.copy_worksheet(ws)
+
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_pickle(self, compact):
+        import pickle
+        wb = Workbook(compact_cells=compact)
+        ws = wb.active
+        ws['C3'] = "text"
+        ws.append([2.5])
+        cp = pickle.loads(pickle.dumps(wb))
+        ws = cp.active
+        assert ws['C3'].value == "text"
+        assert ws['A4'].value == 2.5
+        assert ws.max_row == 4
+
+
+    def test_close_shared_strings(self, tmpdir):
+        import os
+        tmpdir.chdir()
+        wb = Workbook(max_shared_strings=10)
+        wb.active.append(["a", "b"])
+        wb.save("strings.xlsx")
+        assert os.path.exists(wb.shared_strings.filename)
+        wb.close()
+        assert not os.path.exists(wb.shared_strings.filename)
+        assert load_workbook("strings.xlsx").active["B1"].value == "b"
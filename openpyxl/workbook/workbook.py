@@ -16,6 +16,7 @@ from openpyxl.utils.exceptions import ReadOnlyWorkbookException
 
 from openpyxl.writer.write_only import WriteOnlyWorksheet, save_dump
 from openpyxl.writer.excel import save_workbook
+from openpyxl.writer.strings import SharedStringFile
 
 from openpyxl.styles.cell_style import StyleArray
 from openpyxl.styles.named_styles import NamedStyle
@@ -43,6 +44,43 @@ from openpyxl.xml.constants import (
 )
 
 
+class LazySheet(object):
+    """
+    Placeholder for a worksheet which is only read when it is first used.
+
+    `loader` is called with the title and returns the worksheet.
+    """
+
+    sheet_state = "visible"
+
+    def __init__(self, parent, title, loader):
+        self.parent = parent
+        self.title = title
+        self._loader = loader
+
+
+    def __repr__(self):
+        return '<{0} "{1}">'.format(self.__class__.__name__, self.title)
+
+
+    def load(self):
+        """
+        Read the worksheet and put it in the workbook in place of this one
+        """
+        sheets = self.parent._sheets
+        idx = sheets.index(self)
+        # remove the placeholder so that the title is not seen as a duplicate
+        del sheets[idx]
+        try:
+            ws = self._loader(self.title)
+        except Exception:
+            sheets.insert(idx, self)
+            raise
+        ws.sheet_state = self.sheet_state
+        sheets.insert(idx, ws)
+        return ws
+
+
 class Workbook(object):
     """Workbook is the container for all other parts of the document."""
 
@@ -54,6 +92,9 @@ class Workbook(object):
 
     def __init__(self,
                  write_only=False,
+                 compact_cells=False,
+                 inline_strings=False,
+                 max_shared_strings=None,
                  ):
         self._sheets = []
         self._active_sheet_index = 0
@@ -62,7 +103,12 @@ class Workbook(object):
         self.properties = DocumentProperties()
         self.security = DocumentSecurity()
         self.__write_only = write_only
-        self.shared_strings = IndexedList()
+        self.__compact_cells = compact_cells
+        self.__inline_strings = inline_strings
+        if max_shared_strings is None:
+            self.shared_strings = IndexedList()
+        else:
+            self.shared_strings = SharedStringFile(max_shared_strings)
 
         self._setup_styles()
 
@@ -118,6 +164,14 @@ class Workbook(object):
     def write_only(self):
         return self.__write_only
 
+    @property
+    def compact_cells(self):
+        return self.__compact_cells
+
+    @property
+    def inline_strings(self):
+        return self.__inline_strings
+
     @property
     def keep_links(self):
         return self._keep_links
@@ -131,7 +185,7 @@ class Workbook(object):
     def active(self):
         """Get the currently active sheet or None"""
         try:
-            return self._sheets[self._active_sheet_index]
+            return self._load_sheet(self._sheets[self._active_sheet_index])
         except IndexError:
             pass
 
@@ -227,9 +281,9 @@ class Workbook(object):
         :type name: string
 
         """
-        for sheet in self.worksheets:
-            if sheet.title == key:
-                return sheet
+        for sheet in self._sheets:
+            if sheet.title == key and not isinstance(sheet, Chartsheet):
+                return self._load_sheet(sheet)
         raise KeyError("Worksheet {0} does not exist.".format(key))
 
     def __delitem__(self, key):
@@ -244,9 +298,22 @@ class Workbook(object):
     def get_sheet_names(self):
         return self.sheetnames
 
+    def _load_sheet(self, sheet):
+        if isinstance(sheet, LazySheet):
+            sheet = sheet.load()
+        return sheet
+
+    def _load_sheets(self):
+        """
+        Read all worksheets which have not been used yet
+        """
+        for sheet in list(self._sheets):
+            self._load_sheet(sheet)
+
     @property
     def worksheets(self):
-        return [s for s in self._sheets if isinstance(s, (Worksheet, ReadOnlyWorksheet, WriteOnlyWorksheet))]
+        return [self._load_sheet(s) for s in self._sheets
+                if isinstance(s, (Worksheet, ReadOnlyWorksheet, WriteOnlyWorksheet, LazySheet))]
 
     @property
     def chartsheets(self):
@@ -328,10 +395,16 @@ class Workbook(object):
         return ct
 
 
-    def save(self, filename):
+    def save(self, filename, compression='default', processes=None):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        `compression` is one of 'store', 'fast', 'default' or 'max'. Storing
+        parts without compression is fastest but makes the largest files.
+
+        `processes` is the number of processes to serialise worksheets with,
+        0 for one per cpu. It is ignored for write-only workbooks.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequents attempts to
@@ -340,9 +413,10 @@ class Workbook(object):
         if self.read_only:
             raise TypeError("""Workbook is read-only""")
         if self.write_only:
-            save_dump(self, filename)
+            save_dump(self, filename, compression=compression)
         else:
-            save_workbook(self, filename)
+            save_workbook(self, filename, processes=processes,
+                          compression=compression)
 
 
     @property
@@ -373,7 +447,11 @@ class Workbook(object):
 
     def close(self):
         """
-        Close workbook file if open. Only affects read-only and write-only modes.
+        Close workbook file if open. Only affects read-only, write-only and
+        lazily loaded workbooks, and workbooks keeping their shared strings
+        in a temporary file, which is removed.
         """
         if hasattr(self, '_archive'):
             self._archive.close()
+        if isinstance(self.shared_strings, SharedStringFile):
+            self.shared_strings.close()
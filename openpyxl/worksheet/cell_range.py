@@ -0,0 +1,403 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+"""Sets and indices of rectangular ranges of cells"""
+
+from bisect import bisect_right
+from operator import itemgetter
+
+from openpyxl.compat import basestring, range
+from openpyxl.utils import (
+    range_boundaries,
+    rows_from_range,
+    get_column_letter,
+    coordinate_to_tuple,
+)
+from openpyxl.utils.exceptions import CellCoordinatesException
+from openpyxl.xml.constants import MAX_COLUMN, MAX_ROW
+
+
+INF = float("inf")
+
+
+class RangeIndex(object):
+    """
+    Index of ranges given as (min_col, min_row, max_col, max_row) with a key
+    for finding the ranges which contain a cell or overlap another range.
+
+    Each range is filed under the smallest aligned block of 2**k rows which
+    contains it so that all ranges of a block cross its middle row. Within
+    a block ranges are sorted by column with the furthest column reached so
+    far, so only ranges which can reach a column are looked at. A cell is
+    found by looking at one block for each size.
+
+    Keys are compared when the same range is added more than once.
+    """
+
+    def __init__(self):
+        self._levels = {}
+
+
+    @staticmethod
+    def _block(min_row, max_row):
+        start, end = min_row - 1, max_row - 1
+        level = (start ^ end).bit_length()
+        return level, start >> level
+
+
+    def add(self, bounds, key):
+        min_col, min_row, max_col, max_row = bounds
+        level, block = self._block(min_row, max_row)
+        blocks = self._levels.setdefault(level, {})
+        entries, reach = blocks.setdefault(block, ([], []))
+        entry = (min_col, max_col, min_row, max_row, key)
+        idx = bisect_right(entries, entry)
+        entries.insert(idx, entry)
+        reach.insert(idx, max_col)
+        _update_reach(entries, reach, idx)
+
+
+    def remove(self, bounds, key):
+        min_col, min_row, max_col, max_row = bounds
+        level, block = self._block(min_row, max_row)
+        blocks = self._levels[level]
+        entries, reach = blocks[block]
+        idx = entries.index((min_col, max_col, min_row, max_row, key))
+        del entries[idx]
+        del reach[idx]
+        if entries:
+            _update_reach(entries, reach, idx)
+        else:
+            del blocks[block]
+            if not blocks:
+                del self._levels[level]
+
+
+    def find(self, row, col):
+        """
+        Return (bounds, key) for all ranges containing a cell
+        """
+        found = []
+        for level, blocks in self._levels.items():
+            bucket = blocks.get((row - 1) >> level)
+            if bucket is None:
+                continue
+            entries, reach = bucket
+            idx = bisect_right(entries, (col, INF)) - 1
+            while idx >= 0 and reach[idx] >= col:
+                min_col, max_col, min_row, max_row, key = entries[idx]
+                if max_col >= col and min_row <= row <= max_row:
+                    found.append(((min_col, min_row, max_col, max_row), key))
+                idx -= 1
+        return found
+
+
+    def overlapping(self, bounds):
+        """
+        Return (bounds, key) for all ranges overlapping a range
+        """
+        min_col, min_row, max_col, max_row = bounds
+        found = []
+        for level, blocks in self._levels.items():
+            first, last = (min_row - 1) >> level, (max_row - 1) >> level
+            if last - first < len(blocks):
+                buckets = (blocks.get(block) for block in range(first, last + 1))
+            else:
+                buckets = (bucket for block, bucket in blocks.items()
+                           if first <= block <= last)
+            for bucket in buckets:
+                if bucket is None:
+                    continue
+                entries, reach = bucket
+                idx = bisect_right(entries, (max_col, INF)) - 1
+                while idx >= 0 and reach[idx] >= min_col:
+                    entry = entries[idx]
+                    if (entry[1] >= min_col and entry[2] <= max_row
+                        and entry[3] >= min_row):
+                        found.append(((entry[0], entry[2], entry[1], entry[3]),
+                                      entry[4]))
+                    idx -= 1
+        return found
+
+
+def _update_reach(entries, reach, idx):
+    # furthest column reached by the entries up to each position
+    value = reach[idx - 1] if idx else 0
+    for pos in range(idx, len(entries)):
+        value = max(value, entries[pos][1])
+        reach[pos] = value
+
+
+def range_to_bounds(range_string):
+    """
+    (min_col, min_row, max_col, max_row) of a cell or range of cells.
+    Whole columns 'A:B' and whole rows '1:2' run to the edge of the sheet
+    and reversed ranges 'B2:A1' are put in order.
+    """
+    min_col, min_row, max_col, max_row = range_boundaries(range_string)
+    if min_row is None:
+        min_row, max_row = 1, MAX_ROW
+    if min_col is None:
+        min_col, max_col = 1, MAX_COLUMN
+    if min_col > max_col:
+        min_col, max_col = max_col, min_col
+    if min_row > max_row:
+        min_row, max_row = max_row, min_row
+    return min_col, min_row, max_col, max_row
+
+
+def bounds_to_range(bounds):
+    min_col, min_row, max_col, max_row = bounds
+    if (min_row, max_row) == (1, MAX_ROW):
+        return "{0}:{1}".format(get_column_letter(min_col),
+                                get_column_letter(max_col))
+    if (min_col, max_col) == (1, MAX_COLUMN):
+        return "{0}:{1}".format(min_row, max_row)
+    coord = "{0}{1}".format(get_column_letter(min_col), min_row)
+    if (min_col, min_row) == (max_col, max_row):
+        return coord
+    return "{0}:{1}{2}".format(coord, get_column_letter(max_col), max_row)
+
+
+class CellRangeSet(object):
+    """
+    Set of cells such as the cells a data validation or conditional format
+    applies to, held as ranges which do not overlap.
+
+    Ranges which are added are kept aside until the set is next used. Many
+    of them are then combined with the set in one pass: rows covering the
+    same columns are joined. A few are split around the ranges in the set
+    and joined with neighbouring ranges of the same width or height.
+    """
+
+    def __init__(self, ranges=None):
+        self._bounds = set()
+        self._index = RangeIndex()
+        self._pending = []
+        if isinstance(ranges, basestring):
+            ranges = ranges.split()
+        for range_string in ranges or ():
+            self.add(range_string)
+
+
+    def add(self, range_string):
+        """
+        Add a cell 'A1' or a range of cells 'A1:B4'
+        """
+        self._pending.append(range_to_bounds(range_string))
+
+
+    def add_bounds(self, bounds):
+        self._pending.append(tuple(bounds))
+
+
+    def discard(self, range_string):
+        """
+        Remove a cell 'A1' or a range of cells 'A1:B4' from the set
+        """
+        bounds = range_to_bounds(range_string)
+        self._update()
+        for other, _ in self._index.overlapping(bounds):
+            self._discard(other)
+            for part in _subtract(other, bounds):
+                self._insert(part)
+
+
+    def _update(self):
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+        if len(pending) * 8 < len(self._bounds):
+            for bounds in pending:
+                self._add(bounds)
+            return
+        self._bounds = set(_cover(list(self._bounds) + pending))
+        self._index = RangeIndex()
+        for bounds in self._bounds:
+            self._index.add(bounds, None)
+
+
+    def _add(self, bounds):
+        pieces = [bounds]
+        for other, _ in self._index.overlapping(bounds):
+            pieces = [part for piece in pieces for part in _subtract(piece, other)]
+        for piece in pieces:
+            self._insert(piece)
+
+
+    def _insert(self, bounds):
+        joined = True
+        while joined:
+            joined = False
+            for neighbour in self._neighbours(bounds):
+                if neighbour in self._bounds:
+                    self._discard(neighbour)
+                    bounds = _join(bounds, neighbour)
+                    joined = True
+                    break
+        self._bounds.add(bounds)
+        self._index.add(bounds, None)
+
+
+    def _neighbours(self, bounds):
+        """
+        Ranges which can be joined with a range, if they are in the set
+        """
+        min_col, min_row, max_col, max_row = bounds
+        for row, col in ((min_row, min_col - 1), (min_row - 1, min_col),
+                         (min_row, max_col + 1), (max_row + 1, min_col)):
+            for other, _ in self._index.find(row, col):
+                if _join(bounds, other) is not None:
+                    yield other
+
+
+    def _discard(self, bounds):
+        self._bounds.remove(bounds)
+        self._index.remove(bounds, None)
+
+
+    def find(self, row, col):
+        """
+        Return the bounds of the range containing a cell or None
+        """
+        self._update()
+        found = self._index.find(row, col)
+        if found:
+            return found[0][0]
+
+
+    def __contains__(self, coordinate):
+        if not isinstance(coordinate, basestring):
+            return False
+        try:
+            row, col = coordinate_to_tuple(coordinate)
+        except CellCoordinatesException:
+            return False
+        return self.find(row, col) is not None
+
+
+    def __iter__(self):
+        """
+        Bounds of the ranges ordered by column and row
+        """
+        self._update()
+        return iter(sorted(self._bounds))
+
+
+    def __len__(self):
+        self._update()
+        return len(self._bounds)
+
+
+    def __bool__(self):
+        return bool(self._bounds or self._pending)
+
+    __nonzero__ = __bool__
+
+
+    def __copy__(self):
+        self._update()
+        cp = self.__class__()
+        for bounds in self._bounds:
+            cp._bounds.add(bounds)
+            cp._index.add(bounds, None)
+        return cp
+
+
+    def __str__(self):
+        return " ".join(bounds_to_range(bounds) for bounds in self)
+
+
+    def __repr__(self):
+        return "<{0} {1!r}>".format(self.__class__.__name__, str(self))
+
+
+    def coordinates(self):
+        """
+        Coordinates of all cells, each range row by row
+        """
+        for bounds in self:
+            for row in rows_from_range(bounds_to_range(bounds)):
+                for coordinate in row:
+                    yield coordinate
+
+
+def _cover(ranges):
+    """
+    Ranges which do not overlap covering a collection of ranges. The rows
+    between the first and last rows of the ranges are split into bands
+    within which the columns covered do not change and bands covering the
+    same columns are joined.
+    """
+    ranges = sorted(ranges, key=itemgetter(1))
+    edges = sorted(set(r[1] for r in ranges) | set(r[3] + 1 for r in ranges))
+    cover = []
+    runs = {}
+    active = []
+    pos = 0
+    for top, next_top in zip(edges, edges[1:]):
+        active = [r for r in active if r[3] >= top]
+        while pos < len(ranges) and ranges[pos][1] == top:
+            active.append(ranges[pos])
+            pos += 1
+        columns = _join_columns(sorted((r[0], r[2]) for r in active))
+        for run in list(runs):
+            if run not in columns:
+                cover.append((run[0], runs.pop(run), run[1], top - 1))
+        for run in columns:
+            runs.setdefault(run, top)
+    for run, top in runs.items():
+        cover.append((run[0], top, run[1], edges[-1] - 1))
+    return cover
+
+
+def _join_columns(columns):
+    """
+    Join sorted (min_col, max_col) pairs which overlap or touch
+    """
+    joined = []
+    for min_col, max_col in columns:
+        if joined and min_col <= joined[-1][1] + 1:
+            if max_col > joined[-1][1]:
+                joined[-1] = (joined[-1][0], max_col)
+        else:
+            joined.append((min_col, max_col))
+    return set(joined)
+
+
+def _subtract(bounds, other):
+    """
+    Split a range into the parts outside another range
+    """
+    min_col, min_row, max_col, max_row = bounds
+    o_min_col, o_min_row, o_max_col, o_max_row = other
+    if (o_min_col > max_col or o_max_col < min_col
+        or o_min_row > max_row or o_max_row < min_row):
+        return [bounds]
+    parts = []
+    if o_min_row > min_row:
+        parts.append((min_col, min_row, max_col, o_min_row - 1))
+    if o_max_row < max_row:
+        parts.append((min_col, o_max_row + 1, max_col, max_row))
+    top, bottom = max(min_row, o_min_row), min(max_row, o_max_row)
+    if o_min_col > min_col:
+        parts.append((min_col, top, o_min_col - 1, bottom))
+    if o_max_col < max_col:
+        parts.append((o_max_col + 1, top, max_col, bottom))
+    return parts
+
+
+def _join(bounds, other):
+    """
+    The range covering two adjacent ranges of the same width or height,
+    otherwise None
+    """
+    min_col, min_row, max_col, max_row = bounds
+    o_min_col, o_min_row, o_max_col, o_max_row = other
+    if (min_row, max_row) == (o_min_row, o_max_row):
+        if o_max_col + 1 == min_col or max_col + 1 == o_min_col:
+            return min(min_col, o_min_col), min_row, max(max_col, o_max_col), max_row
+    elif (min_col, max_col) == (o_min_col, o_max_col):
+        if o_max_row + 1 == min_row or max_row + 1 == o_min_row:
+            return min_col, min(min_row, o_min_row), max_col, max(max_row, o_max_row)
@@ -0,0 +1,528 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+"""Storage for worksheet cells."""
+
+from array import array
+from bisect import bisect_left
+from heapq import merge
+from itertools import groupby
+from operator import itemgetter
+
+from openpyxl.cell import Cell
+from openpyxl.styles.cell_style import StyleArray
+
+
+# index 0 marks an entry which has been removed or turned into a cell
+DATA_TYPES = (None, 'n', 's', 'f', 'b', 'e', 'str', 'inlineStr')
+TYPE_CODES = dict((t, idx) for idx, t in enumerate(DATA_TYPES) if t)
+
+
+class BoundsTracker(object):
+    """
+    Keep track of the smallest and largest rows and columns of a collection
+    of (row, column) keys as they are added. Removing a key on the edge only
+    marks the bounds for recalculation when they are next needed.
+    """
+
+    _bounds = None
+    _stale = False
+
+    @property
+    def bounds(self):
+        """
+        (min_row, min_col, max_row, max_col) or None if there are no keys
+        """
+        if self._stale:
+            self._recalculate()
+        return self._bounds
+
+
+    def _extend(self, row, col):
+        bounds = self._bounds
+        if self._stale:
+            return
+        if bounds is None:
+            self._bounds = (row, col, row, col)
+        else:
+            min_row, min_col, max_row, max_col = bounds
+            if (row < min_row or row > max_row
+                or col < min_col or col > max_col):
+                self._bounds = (min(row, min_row), min(col, min_col),
+                                max(row, max_row), max(col, max_col))
+
+
+    def _discard(self, row, col):
+        bounds = self._bounds
+        if bounds is not None and (row in (bounds[0], bounds[2])
+                                   or col in (bounds[1], bounds[3])):
+            self._stale = True
+
+
+    def _recalculate(self):
+        self._stale = False
+        self._bounds = None
+        rows = set()
+        cols = set()
+        for row, col in self:
+            rows.add(row)
+            cols.add(col)
+        if rows:
+            self._bounds = (min(rows), min(cols), max(rows), max(cols))
+
+
+class CellDict(BoundsTracker, dict):
+    """
+    Dictionary of (row, column) to cells which knows its bounds and keeps an
+    index of the columns in each row in order.
+    """
+
+    def __init__(self):
+        dict.__init__(self)
+        self._rows = {}
+
+
+    def __reduce__(self):
+        # the row index and bounds are rebuilt as the items are restored
+        return self.__class__, (), None, None, iter(dict.items(self))
+
+
+    def _add_key(self, row, col):
+        self._extend(row, col)
+        cols = self._rows.get(row)
+        if cols is None:
+            self._rows[row] = array('i', [col])
+        elif col > cols[-1]:
+            cols.append(col)
+        else:
+            idx = bisect_left(cols, col)
+            if cols[idx] != col:
+                cols.insert(idx, col)
+
+
+    def _remove_key(self, row, col):
+        self._discard(row, col)
+        cols = self._rows[row]
+        if len(cols) == 1:
+            del self._rows[row]
+        else:
+            cols.remove(col)
+
+
+    def __setitem__(self, key, cell):
+        if key not in self:
+            self._add_key(*key)
+        dict.__setitem__(self, key, cell)
+
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._remove_key(*key)
+
+
+    def update(self, cells):
+        """
+        Add many cells, the keys of each row are added to the index at once
+        """
+        keys = sorted(key for key in cells if key not in self)
+        dict.update(self, cells)
+        for row, group in groupby(keys, key=itemgetter(0)):
+            cols = array('i', [col for _, col in group])
+            self._extend(row, cols[0])
+            self._extend(row, cols[-1])
+            existing = self._rows.get(row)
+            if existing is None:
+                self._rows[row] = cols
+            elif cols[0] > existing[-1]:
+                existing.extend(cols)
+            else:
+                self._rows[row] = array('i', sorted(existing + cols))
+
+
+    def setdefault(self, key, cell=None):
+        if key not in self:
+            self._add_key(*key)
+        return dict.setdefault(self, key, cell)
+
+
+    def pop(self, key, *default):
+        if key in self:
+            self._remove_key(*key)
+        return dict.pop(self, key, *default)
+
+
+    def popitem(self):
+        key, cell = dict.popitem(self)
+        self._remove_key(*key)
+        return key, cell
+
+
+    def clear(self):
+        dict.clear(self)
+        self._rows.clear()
+        self._bounds = None
+        self._stale = False
+
+
+    def _recalculate(self):
+        self._stale = False
+        self._bounds = None
+        rows = self._rows
+        if rows:
+            self._bounds = (min(rows), min(cols[0] for cols in rows.values()),
+                            max(rows), max(cols[-1] for cols in rows.values()))
+
+
+    def add_values(self, worksheet, values, styles=None):
+        """
+        Add cells for (row, column, value, data type) entries of bound
+        values with the style ids of some columns.
+        """
+        cell_styles = worksheet.parent._cell_styles
+        arrays = dict((col, cell_styles[style_id])
+                      for col, style_id in (styles or {}).items())
+        cells = {}
+        new = Cell.__new__
+        for row, col, value, data_type in values:
+            # the value is already bound so the cell is filled in directly
+            cell = new(Cell)
+            cell.parent = worksheet
+            style = arrays.get(col)
+            if style is not None:
+                style = StyleArray(style)
+            cell._style = style
+            cell.row = row
+            cell.col_idx = col
+            cell._value = value
+            cell.data_type = data_type
+            cell._hyperlink = None
+            cell._comment = None
+            cells[(row, col)] = cell
+        self.update(cells)
+
+
+    def rows(self, min_row=None, max_row=None, store=False):
+        """
+        Return (row, [(column, cell), ...]) for all cells ordered by row,
+        optionally limited to a range of rows.
+        """
+        rows = (row for row in self._rows if _in_rows(row, min_row, max_row))
+        for row in sorted(rows):
+            yield row, [(col, self[(row, col)]) for col in self._rows[row]]
+
+
+    def restyle(self, update, min_row=None, min_col=None, max_row=None,
+                max_col=None):
+        """
+        Apply a style update to all cells in a range
+        """
+        for row, cols in self._rows.items():
+            if not _in_rows(row, min_row, max_row):
+                continue
+            for col in cols:
+                if _in_rows(col, min_col, max_col):
+                    cell = self[(row, col)]
+                    cell._style = update.array(cell._style)
+
+
+class _Column(object):
+    """
+    Cell data for a single column held in parallel arrays sorted by row.
+
+    Values are held in a typed array as long as the column only contains
+    floats.
+    """
+
+    __slots__ = ('rows', 'values', 'types', 'styles')
+
+    def __init__(self):
+        self.rows = array('i')
+        self.values = array('d')
+        self.types = array('B')
+        self.styles = array('i')
+
+
+    def find(self, row):
+        """
+        Return the position of a live entry for the row or None
+        """
+        rows = self.rows
+        idx = bisect_left(rows, row)
+        if idx < len(rows) and rows[idx] == row and self.types[idx]:
+            return idx
+
+
+    def add(self, row, value, type_code, style_id):
+        """
+        Add or replace the entry for a row.
+        Return whether a new entry was created.
+        """
+        values = self.values
+        if type(value) is not float and isinstance(values, array):
+            values = self.values = list(values)
+
+        rows = self.rows
+        if not rows or row > rows[-1]:
+            idx = len(rows)
+        else:
+            idx = bisect_left(rows, row)
+            if rows[idx] == row:
+                created = not self.types[idx]
+                values[idx] = value
+                self.types[idx] = type_code
+                self.styles[idx] = style_id
+                return created
+
+        rows.insert(idx, row)
+        values.insert(idx, value)
+        self.types.insert(idx, type_code)
+        self.styles.insert(idx, style_id)
+        return True
+
+
+    def __iter__(self):
+        """
+        Return (row, position) for all live entries
+        """
+        types = self.types
+        for idx, row in enumerate(self.rows):
+            if types[idx]:
+                yield row, idx
+
+
+class ColumnarCellStore(BoundsTracker):
+    """
+    Mapping of (row, column) to cells for a worksheet.
+
+    Values, data types and style ids of plain cells are held in typed arrays
+    for each column and cells are only created when they are accessed.
+    Accessed cells and cells with comments or hyperlinks are kept as
+    ordinary cell objects.
+
+    Cells added with `update` are taken over by the store and must not be
+    referenced elsewhere, assignment keeps the cell itself.
+    """
+
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+        self._columns = {}
+        self._cells = {}
+        self._packed = 0
+
+
+    def _find(self, key):
+        row, col = key
+        column = self._columns.get(col)
+        if column is not None:
+            return column, column.find(row)
+        return None, None
+
+
+    def _remove_packed(self, key):
+        column, idx = self._find(key)
+        if idx is not None:
+            column.types[idx] = 0
+            self._packed -= 1
+            return True
+        return False
+
+
+    def _cell(self, col, column, idx):
+        """
+        Create a cell from column data
+        """
+        style_id = column.styles[idx]
+        style = None
+        if style_id:
+            style = self.worksheet.parent._cell_styles[style_id]
+        cell = Cell(self.worksheet, row=column.rows[idx], col_idx=col,
+                    style_array=style)
+        cell._value = column.values[idx]
+        cell.data_type = DATA_TYPES[column.types[idx]]
+        return cell
+
+
+    def pack(self, cell):
+        """
+        Add a cell to the store. Plain cells are added to the column arrays.
+        """
+        key = (cell.row, cell.col_idx)
+        if cell._hyperlink is not None or cell._comment is not None:
+            self[key] = cell
+            return
+
+        self._cells.pop(key, None)
+        style_id = 0
+        if cell.has_style:
+            style_id = cell.style_id
+        column = self._columns.get(cell.col_idx)
+        if column is None:
+            column = self._columns[cell.col_idx] = _Column()
+        if column.add(cell.row, cell._value, TYPE_CODES[cell.data_type], style_id):
+            self._packed += 1
+        self._extend(*key)
+
+
+    def update(self, cells):
+        for cell in cells.values():
+            self.pack(cell)
+
+
+    def add_values(self, worksheet, values, styles=None):
+        """
+        Add (row, column, value, data type) entries of bound values to the
+        column arrays with the style ids of some columns, without creating
+        cells.
+        """
+        styles = styles or {}
+        columns = self._columns
+        cells = self._cells
+        for row, col, value, data_type in values:
+            column = columns.get(col)
+            if column is None:
+                column = columns[col] = _Column()
+            if cells:
+                cells.pop((row, col), None)
+            if column.add(row, value, TYPE_CODES[data_type], styles.get(col, 0)):
+                self._packed += 1
+            self._extend(row, col)
+
+
+    def __contains__(self, key):
+        if key in self._cells:
+            return True
+        return self._find(key)[1] is not None
+
+
+    def __getitem__(self, key):
+        try:
+            return self._cells[key]
+        except KeyError:
+            pass
+        column, idx = self._find(key)
+        if idx is None:
+            raise KeyError(key)
+        return self._unpack(key[1], column, idx)
+
+
+    def _unpack(self, col, column, idx):
+        """
+        Turn packed column data into a stored cell
+        """
+        cell = self._cell(col, column, idx)
+        column.types[idx] = 0
+        self._packed -= 1
+        self._cells[(cell.row, col)] = cell
+        return cell
+
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+
+    def __setitem__(self, key, cell):
+        self._remove_packed(key)
+        self._cells[key] = cell
+        self._extend(*key)
+
+
+    def __delitem__(self, key):
+        if not self._remove_packed(key):
+            del self._cells[key]
+        self._discard(*key)
+
+
+    def __len__(self):
+        return len(self._cells) + self._packed
+
+
+    def __iter__(self):
+        for key in list(self._cells):
+            yield key
+        for col, column in list(self._columns.items()):
+            for row, idx in column:
+                yield row, col
+
+
+    def keys(self):
+        return list(self)
+
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+
+    def values(self):
+        return [cell for key, cell in self.items()]
+
+
+    def rows(self, min_row=None, max_row=None, store=False):
+        """
+        Return (row, [(column, cell), ...]) for all cells ordered by row,
+        optionally limited to a range of rows.
+        Cells for packed values are created for each row and only stored if
+        `store` is True, so that changes to them are kept.
+        """
+        cells = (item for item in self._cells.items()
+                 if _in_rows(item[0][0], min_row, max_row))
+        cells = groupby(sorted(cells), key=_row)
+        cells = ((row, 0, [(key[1], cell) for key, cell in group])
+                 for row, group in cells)
+
+        columns = [_entries(col, column, min_row, max_row)
+                   for col, column in sorted(self._columns.items())]
+        if store:
+            cell = self._unpack
+        else:
+            cell = self._cell
+        packed = ((row, 1, [(col, cell(col, column, idx))
+                            for _, col, column, idx in group])
+                  for row, group in groupby(merge(*columns), key=itemgetter(0)))
+
+        for row, group in groupby(merge(cells, packed), key=itemgetter(0)):
+            row_cells = []
+            for _, _, entries in group:
+                row_cells.extend(entries)
+            row_cells.sort(key=itemgetter(0))
+            yield row, row_cells
+
+
+    def restyle(self, update, min_row=None, min_col=None, max_row=None,
+                max_col=None):
+        """
+        Apply a style update to all cells in a range. The styles of packed
+        values are changed without creating cells.
+        """
+        for (row, col), cell in self._cells.items():
+            if (_in_rows(row, min_row, max_row)
+                and _in_rows(col, min_col, max_col)):
+                cell._style = update.array(cell._style)
+
+        for col, column in self._columns.items():
+            if not _in_rows(col, min_col, max_col):
+                continue
+            styles = column.styles
+            for row, idx in column:
+                if max_row is not None and row > max_row:
+                    break
+                if _in_rows(row, min_row, max_row):
+                    styles[idx] = update.style_id(styles[idx])
+
+
+def _row(item):
+    return item[0][0]
+
+
+def _entries(col, column, min_row=None, max_row=None):
+    for row, idx in column:
+        if max_row is not None and row > max_row:
+            break
+        if _in_rows(row, min_row, max_row):
+            yield row, col, column, idx
+
+
+def _in_rows(row, min_row=None, max_row=None):
+    return ((min_row is None or row >= min_row)
+            and (max_row is None or row <= max_row))
@@ -1,9 +1,8 @@
 from __future__ import absolute_import
 # Copyright (c) 2010-2017 openpyxl
 
-from collections import defaultdict
+from copy import copy
 from itertools import chain
-from operator import itemgetter
 
 from openpyxl.descriptors.serialisable import Serialisable
 from openpyxl.descriptors import (
@@ -16,11 +15,9 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.nested import NestedText
 from openpyxl.compat import OrderedDict, safe_string, unicode
-from openpyxl.utils import (
-    rows_from_range,
-    coordinate_to_tuple,
-    get_column_letter,
-)
+from openpyxl.utils import rows_from_range
+
+from .cell_range import CellRangeSet
 
 
 def collapse_cell_addresses(cells, input_ranges=()):
@@ -30,30 +27,13 @@ def collapse_cell_addresses(cells, input_ranges=()):
         E.g. Cells A1, A2, A3, B1, B2 and B3 should have the data-validation
         object applied, attempt to collapse down to a single range, A1:B3.
 
-        Currently only collapsing contiguous vertical ranges (i.e. above
-        example results in A1:A3 B1:B3).
+        Neighbouring ranges of the same width or height are joined, this
+        does not always find the fewest ranges.
     """
-
-    ranges = list(input_ranges)
-
-    # convert cell into row, col tuple
-    raw_coords = (coordinate_to_tuple(cell) for cell in cells)
-
-    # group by column in order
-    grouped_coords = defaultdict(list)
-    for row, col in sorted(raw_coords, key=itemgetter(1)):
-        grouped_coords[col].append(row)
-
-    # create range string from first and last row in column
-    for col, cells in grouped_coords.items():
-        col = get_column_letter(col)
-        fmt = "{0}{1}:{2}{3}"
-        if len(cells) == 1:
-            fmt = "{0}{1}"
-        r = fmt.format(col, min(cells), col, max(cells))
-        ranges.append(r)
-
-    return " ".join(ranges)
+    ranges = CellRangeSet(input_ranges)
+    for cell in cells:
+        ranges.add(cell)
+    return str(ranges)
 
 
 def expand_cell_ranges(range_string):
@@ -68,6 +48,69 @@ def expand_cell_ranges(range_string):
     return list(chain.from_iterable(cells))
 
 
+class CellCoordinates(object):
+    """
+    Live view of the coordinates of the cells a data validation applies to.
+    Cells added or removed change the ranges of the validation.
+    """
+
+    def __init__(self, dv):
+        self.dv = dv
+
+
+    def add(self, cell):
+        self.dv.add(cell)
+
+    append = add
+
+
+    def update(self, cells):
+        for cell in cells:
+            self.dv.add(cell)
+
+    extend = update
+
+
+    def discard(self, cell):
+        if hasattr(cell, "coordinate"):
+            cell = cell.coordinate
+        self.dv.cell_ranges.discard(cell)
+
+
+    def remove(self, cell):
+        if cell not in self:
+            raise KeyError(cell)
+        self.discard(cell)
+
+
+    def __contains__(self, coordinate):
+        return coordinate in self.dv.cell_ranges
+
+
+    def __iter__(self):
+        return self.dv.cell_ranges.coordinates()
+
+
+    def __len__(self):
+        return sum((max_col - min_col + 1) * (max_row - min_row + 1)
+                   for min_col, min_row, max_col, max_row in self.dv.cell_ranges)
+
+
+    def __eq__(self, other):
+        try:
+            return set(self) == set(other)
+        except TypeError:
+            return False
+
+
+    def __ne__(self, other):
+        return not self == other
+
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class DataValidation(Serialisable):
 
     tagname = "dataValidation"
@@ -127,7 +170,7 @@ class DataValidation(Serialisable):
         self.showErrorMessage = showErrorMessage
         self.showInputMessage = showInputMessage
         self.type = type
-        self.cells = set()
+        self.cell_ranges = CellRangeSet()
         self.ranges = []
         if sqref is not None:
             self.sqref = sqref
@@ -140,18 +183,47 @@ class DataValidation(Serialisable):
 
 
     def add(self, cell):
-        """Adds a openpyxl.cell to this validator"""
-        self.cells.add(cell.coordinate)
+        """Adds a openpyxl.cell, a coordinate or a range of cells to this
+        validator"""
+        if hasattr(cell, "coordinate"):
+            cell = cell.coordinate
+        self.cell_ranges.add(cell)
+
+
+    def _all_ranges(self):
+        if not self.ranges:
+            return self.cell_ranges
+        ranges = copy(self.cell_ranges)
+        for range_string in self.ranges:
+            ranges.add(range_string)
+        return ranges
+
+
+    def __contains__(self, coordinate):
+        return coordinate in self._all_ranges()
+
+
+    @property
+    def cells(self):
+        """Coordinates of the cells this validator applies to"""
+        return CellCoordinates(self)
+
+
+    @cells.setter
+    def cells(self, cells):
+        self.cell_ranges = CellRangeSet()
+        for cell in cells:
+            self.add(cell)
 
 
     @property
     def sqref(self):
-        return collapse_cell_addresses(self.cells, self.ranges)
+        return str(self._all_ranges())
 
 
     @sqref.setter
     def sqref(self, range_string):
-        self.cells = expand_cell_ranges(range_string)
+        self.cell_ranges = CellRangeSet(range_string)
 
 
 class DataValidationList(Serialisable):
@@ -190,3 +262,10 @@ class DataValidationList(Serialisable):
 
     def append(self, dv):
         self.dataValidation.append(dv)
+
+
+    def validations(self, coordinate):
+        """
+        Return the data validations which apply to a cell
+        """
+        return [dv for dv in self.dataValidation if coordinate in dv]
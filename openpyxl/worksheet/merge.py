@@ -1,12 +1,26 @@
 from __future__ import absolute_import
 # Copyright (c) 2010-2017 openpyxl
 
+try:
+    from collections.abc import Set
+except ImportError:
+    from collections import Set
+
+from openpyxl.compat import basestring, range
 from openpyxl.descriptors.serialisable import Serialisable
 from openpyxl.descriptors import (
     Integer,
     String,
     Sequence,
 )
+from openpyxl.utils import (
+    range_boundaries,
+    coordinate_to_tuple,
+    get_column_letter,
+)
+from openpyxl.utils.exceptions import CellCoordinatesException
+
+from .cell_range import RangeIndex
 
 
 class MergeCell(Serialisable):
@@ -41,3 +55,140 @@ class MergeCells(Serialisable):
     @property
     def count(self):
         return len(self.mergeCell)
+
+
+
+class MergedCellIndex(object):
+    """
+    Merged cell ranges in the order they were added with an index for
+    finding the ranges which contain a cell or overlap a range.
+    """
+
+    def __init__(self, ranges=()):
+        self._ranges = []
+        self._bounds = {}
+        self._index = RangeIndex()
+        for range_string in ranges:
+            self.append(range_string)
+
+
+    def append(self, range_string):
+        """
+        Add a range, ranges which are already merged are ignored
+        """
+        if range_string in self._bounds:
+            return
+        bounds = range_boundaries(range_string)
+        overlap = self._index.overlapping(bounds)
+        if overlap:
+            raise ValueError("{0} overlaps merged cells {1}".format(
+                range_string, overlap[0][1]))
+        self._ranges.append(range_string)
+        self._bounds[range_string] = bounds
+        self._index.add(bounds, range_string)
+
+
+    def remove(self, range_string):
+        if range_string not in self._bounds:
+            raise ValueError("{0} is not merged".format(range_string))
+        bounds = self._bounds.pop(range_string)
+        self._ranges.remove(range_string)
+        self._index.remove(bounds, range_string)
+
+
+    def find(self, row, col):
+        """
+        Return the merged range containing a cell or None
+        """
+        found = self._index.find(row, col)
+        if found:
+            return found[0][1]
+
+
+    def overlapping(self, min_col, min_row, max_col, max_row):
+        """
+        Return the merged ranges which overlap a range
+        """
+        bounds = (min_col, min_row, max_col, max_row)
+        return [key for _, key in self._index.overlapping(bounds)]
+
+
+    def bounds(self, range_string):
+        """
+        (min_col, min_row, max_col, max_row) of a merged range
+        """
+        return self._bounds[range_string]
+
+
+    def __contains__(self, range_string):
+        return range_string in self._bounds
+
+
+    def __iter__(self):
+        return iter(self._ranges)
+
+
+    def __len__(self):
+        return len(self._ranges)
+
+
+    def __getitem__(self, idx):
+        return self._ranges[idx]
+
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+    def __ne__(self, other):
+        return not self == other
+
+
+    def __copy__(self):
+        return self.__class__(self._ranges)
+
+
+    def __repr__(self):
+        return repr(self._ranges)
+
+
+class MergedCellSet(Set):
+    """
+    Coordinates of all merged cells of a worksheet. Checking whether a cell
+    is merged uses the index of merged ranges.
+    """
+
+    def __init__(self, index):
+        self._index = index
+
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # results of set operations are plain sets
+        return set(it)
+
+
+    def __contains__(self, coordinate):
+        if not isinstance(coordinate, basestring):
+            return False
+        try:
+            row, col = coordinate_to_tuple(coordinate)
+        except CellCoordinatesException:
+            return False
+        return self._index.find(row, col) is not None
+
+
+    def __iter__(self):
+        for range_string in self._index:
+            min_col, min_row, max_col, max_row = self._index.bounds(range_string)
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    yield "{0}{1}".format(get_column_letter(col), row)
+
+
+    def __len__(self):
+        size = 0
+        for range_string in self._index:
+            min_col, min_row, max_col, max_row = self._index.bounds(range_string)
+            size += (max_row - min_row + 1) * (max_col - min_col + 1)
+        return size
@@ -4,6 +4,10 @@ from __future__ import absolute_import
 """ Read worksheets on-demand
 """
 
+from bisect import bisect_right
+import re
+from string import digits as DIGITS
+
 # compatibility
 from openpyxl.compat import (
     range,
@@ -12,6 +16,8 @@ from openpyxl.compat import (
 
 # package
 from openpyxl.cell.text import Text
+from openpyxl.styles import is_date_format
+from openpyxl.styles.numbers import BUILTIN_FORMATS
 
 from openpyxl.xml.functions import iterparse, safe_iterator
 from openpyxl.xml.constants import SHEET_MAIN_NS
@@ -22,8 +28,10 @@ from openpyxl.utils import (
     get_column_letter,
     coordinate_to_tuple,
 )
+from openpyxl.utils.cell import _COL_STRING_CACHE
+from openpyxl.utils.datetime import from_excel, from_excel_array
 from openpyxl.worksheet.dimensions import SheetDimension
-from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
+from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL, _cast_number
 
 
 def read_dimension(source):
@@ -53,10 +61,124 @@ FORMULA_TAG = '{%s}f' % SHEET_MAIN_NS
 INLINE_TAG = '{%s}is' % SHEET_MAIN_NS
 DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
 
+ROW_START = re.compile(br'<(?:[\w.-]+:)?row\b([^>]*)>')
+ROW_NUMBER = re.compile(br'''\sr=["'](\d+)''')
+CHUNK_SIZE = 1024 * 1024
+
+
+class RowIndex(object):
+    """
+    Offsets of rows in the uncompressed xml of a worksheet.
+
+    One row is recorded for every block of `block_size` bytes, which allows
+    parsing to start close to a row rather than at the top of the file.
+    The index is only valid for the source it was built from.
+    """
+
+    block_size = 32768
+
+    def __init__(self, header=b"", rows=(), offsets=()):
+        self.header = header
+        self.rows = list(rows)
+        self.offsets = list(offsets)
+
+
+    @classmethod
+    def from_source(cls, source, block_size=None):
+        """
+        Scan the raw xml for the start of rows without parsing it.
+        Rows without coordinates cannot be located and result in an empty
+        index.
+        """
+        if block_size is None:
+            block_size = cls.block_size
+        index = cls()
+        header = None
+        buf = b""
+        pos = 0 # offset of the start of the buffer
+        last = -block_size
+
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            buf += chunk
+            end = 0
+            for match in ROW_START.finditer(buf):
+                number = ROW_NUMBER.search(match.group(1))
+                if number is None:
+                    return cls()
+                offset = pos + match.start()
+                if header is None:
+                    header = buf[:match.start()]
+                if offset - last >= block_size:
+                    index.rows.append(int(number.group(1)))
+                    index.offsets.append(offset)
+                    last = offset
+                end = match.end()
+
+            if header is not None:
+                # keep anything which could be the start of an incomplete tag
+                start = buf.rfind(b"<", end)
+                if start == -1:
+                    start = len(buf)
+                pos += start
+                buf = buf[start:]
+
+        index.header = header or b""
+        return index
+
+
+    def seek(self, source, row):
+        """
+        Return a file-like object for the xml which skips the blocks before
+        the row. The source is returned if there are none.
+        """
+        idx = bisect_right(self.rows, row) - 1
+        if idx < 1:
+            return source
+        _skip(source, self.offsets[idx])
+        return _HeaderReader(self.header, source)
+
+
+def _skip(source, size):
+    try:
+        source.seek(size)
+        return
+    except (AttributeError, IOError, ValueError):
+        pass
+    while size > 0:
+        chunk = source.read(min(size, CHUNK_SIZE))
+        if not chunk:
+            break
+        size -= len(chunk)
+
+
+class _HeaderReader(object):
+    """
+    Prepend the opening of a document to a source positioned within it.
+    """
+
+    def __init__(self, header, source):
+        self._header = header
+        self._source = source
+
+
+    def read(self, size=-1):
+        header = self._header
+        if not header:
+            return self._source.read(size)
+        if size is None or size < 0:
+            self._header = b""
+            return header + self._source.read()
+        self._header = header[size:]
+        return header[:size]
+
 
 class ReadOnlyWorksheet(object):
 
     _xml = None
+    row_index = None
     _min_column = 1
     _min_row = 1
     _max_column = _max_row = None
@@ -70,6 +192,7 @@ class ReadOnlyWorksheet(object):
         self.shared_strings = shared_strings
         self.base_date = parent_workbook.excel_base_date
         self.xml_source = xml_source
+        self._date_styles = {}
         dimensions = read_dimension(self.xml_source)
         if dimensions is not None:
             self.min_column, self.min_row, self.max_column, self.max_row = dimensions
@@ -103,18 +226,48 @@ class ReadOnlyWorksheet(object):
         return self._cells_by_row(min_col, min_row, max_col, max_row)
 
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row):
+    def _open_rows(self, min_row):
+        """
+        Return the xml source for reading from a row. Sources which can be
+        opened again are indexed the first time a row other than the first
+        is requested and subsequently start at the nearest indexed row.
+        """
+        source = self.xml_source
+        if min_row <= 1 or hasattr(self._xml, "read"):
+            return source
+        if not hasattr(source, "read"):
+            source = open(source, "rb")
+
+        index = self.row_index
+        if index is None:
+            try:
+                index = self.row_index = RowIndex.from_source(source)
+            finally:
+                source.close()
+            return self._open_rows(min_row)
+        return index.seek(source, min_row)
+
+
+    def _cells_by_row(self, min_col, min_row, max_col, max_row,
+                      values_only=False, create_cells=True):
         """
         The source worksheet file may have columns or rows missing.
         Missing cells will be created.
         """
+        rows = self._read_rows(min_col, min_row, max_col, max_row)
+        if values_only:
+            return (tuple(c.value for c in row) for row in rows)
+        return rows
+
+
+    def _read_rows(self, min_col, min_row, max_col, max_row):
         if max_col is not None:
             empty_row = tuple(EMPTY_CELL for column in range(min_col, max_col + 1))
         else:
             empty_row = []
         row_counter = min_row
 
-        p = iterparse(self.xml_source, tag=[ROW_TAG], remove_blank_text=True)
+        p = iterparse(self._open_rows(min_row), tag=[ROW_TAG], remove_blank_text=True)
         for _event, element in p:
             if element.tag == ROW_TAG:
                 row_id = int(element.get("r", row_counter))
@@ -184,9 +337,173 @@ class ReadOnlyWorksheet(object):
                 yield EMPTY_CELL
 
 
+    def _is_date(self, style_id):
+        """
+        Whether numbers with the style are dates, looked up once per style
+        """
+        try:
+            return self._date_styles[style_id]
+        except KeyError:
+            pass
+        wb = self.parent
+        is_date = False
+        if style_id:
+            fmt_id = wb._cell_styles[style_id].numFmtId
+            if fmt_id < 164:
+                fmt = BUILTIN_FORMATS.get(fmt_id, "General")
+            else:
+                fmt = wb._number_formats[fmt_id - 164]
+            is_date = is_date_format(fmt)
+        self._date_styles[style_id] = is_date
+        return is_date
+
+
+    def _iter_values(self, min_col, min_row, max_col, max_row, numeric=False):
+        """
+        Yield (row, column, value) for cells with values directly from the
+        xml without creating cells. With `numeric` only numbers are
+        returned and dates are left as serial numbers.
+        """
+        data_only = getattr(self.parent, 'data_only', False)
+        shared_strings = self.shared_strings
+        base_date = self.base_date
+        is_date = self._is_date
+        row = 0
+
+        p = iterparse(self._open_rows(min_row), tag=[ROW_TAG], remove_blank_text=True)
+        for _event, element in p:
+            if element.tag != ROW_TAG:
+                continue
+            row = int(element.get("r", row + 1))
+            if max_row is not None and row > max_row:
+                break
+            if row < min_row:
+                element.clear()
+                continue
+
+            column = 0
+            for cell in element:
+                coordinate = cell.get('r')
+                if coordinate:
+                    letters = coordinate.rstrip(DIGITS)
+                    try:
+                        column = _COL_STRING_CACHE[letters]
+                    except KeyError:
+                        column = coordinate_to_tuple(coordinate)[1]
+                else:
+                    column += 1
+                if column < min_col:
+                    continue
+                if max_col is not None and column > max_col:
+                    break
+
+                data_type = cell.get('t', 'n')
+                value = formula = inline = None
+                for child in cell:
+                    if child.tag == VALUE_TAG:
+                        value = child.text
+                    elif child.tag == FORMULA_TAG:
+                        formula = child.text or ""
+                    elif child.tag == INLINE_TAG:
+                        inline = child
+
+                if formula is not None and not data_only:
+                    if numeric:
+                        continue
+                    value = "=%s" % formula
+                elif data_type == 'inlineStr':
+                    if numeric or inline is None:
+                        continue
+                    value = Text.from_tree(inline).content
+                elif not value:
+                    continue
+                elif data_type == 'n':
+                    if numeric:
+                        value = float(value)
+                    elif is_date(int(cell.get('s', 0))):
+                        value = from_excel(_cast_number(value), base_date)
+                    else:
+                        value = _cast_number(value)
+                elif numeric:
+                    continue
+                elif data_type == 's':
+                    value = shared_strings[int(value)]
+                elif data_type == 'b':
+                    value = value == '1'
+
+                yield row, column, value
+            element.clear()
+
+
+    def _block(self, min_row, max_row, min_col, max_col, numeric=False):
+        """
+        Return the values and boundaries of a block of cells. The boundaries
+        default to those of the worksheet.
+        """
+        min_row = min_row or 1
+        min_col = min_col or 1
+        max_row = max_row or self.max_row
+        max_col = max_col or self.max_column
+        values = self._iter_values(min_col, min_row, max_col, max_row, numeric)
+        if max_row is None or max_col is None:
+            values = list(values)
+            if max_row is None:
+                max_row = max([v[0] for v in values] or [min_row - 1])
+            if max_col is None:
+                max_col = max([v[1] for v in values] or [min_col - 1])
+        return values, (max_row - min_row + 1, max_col - min_col + 1), min_row, min_col
+
+
+    def values_block(self, min_row=None, max_row=None, min_col=None, max_col=None):
+        """
+        Return the values of a range of cells as a list of lists of rows.
+
+        Values are read straight from the source without creating cells.
+        Missing cells are None.
+        """
+        values, (rows, cols), min_row, min_col = self._block(min_row, max_row,
+                                                             min_col, max_col)
+        block = [[None] * cols for _ in range(rows)]
+        for row, column, value in values:
+            block[row - min_row][column - min_col] = value
+        return block
+
+
+    def to_numpy(self, min_row=None, max_row=None, min_col=None, max_col=None,
+                 dtype=float):
+        """
+        Return the values of a range of cells as a two-dimensional NumPy
+        array.
+
+        For numeric types only numbers are read, dates are kept as serial
+        numbers and other cells are NaN, or 0 for integers. For `datetime64`
+        types all serial numbers are converted at once and other cells are
+        Not a Time. Use `object` for the values returned by `values_block`.
+        """
+        import numpy
+
+        dtype = numpy.dtype(dtype)
+        dates = dtype.kind == "M"
+        numeric = dtype.kind in "iufc" or dates
+        values, shape, min_row, min_col = self._block(min_row, max_row,
+                                                      min_col, max_col, numeric)
+        if not numeric:
+            fill = None
+        elif dtype.kind in "fcM":
+            fill = numpy.nan
+        else:
+            fill = 0
+        block = numpy.full(shape, fill, float if dates else dtype)
+        for row, column, value in values:
+            block[row - min_row, column - min_col] = value
+        if dates:
+            block = from_excel_array(block, self.base_date).astype(dtype)
+        return block
+
+
     def _get_cell(self, row, column):
         """Cells are returned by a generator which can be empty"""
-        for row in self.get_squared_range(column, row, column, row):
+        for row in self._cells_by_row(column, row, column, row):
             if row:
                 return row[0]
         return EMPTY_CELL
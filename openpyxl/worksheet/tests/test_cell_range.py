@@ -0,0 +1,119 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+from copy import copy
+
+import pytest
+
+
+@pytest.fixture
+def RangeIndex():
+    from ..cell_range import RangeIndex
+    return RangeIndex
+
+
+@pytest.fixture
+def CellRangeSet():
+    from ..cell_range import CellRangeSet
+    return CellRangeSet
+
+
+class TestRangeIndex:
+
+
+    def test_find(self, RangeIndex):
+        index = RangeIndex()
+        index.add((1, 1, 4, 10), "A1:D10")
+        index.add((2, 5, 2, 5), "B5")
+        index.add((3, 3, 6, 4), "C3:F4")
+        assert sorted(key for _, key in index.find(5, 2)) == ["A1:D10", "B5"]
+        assert sorted(key for _, key in index.find(4, 5)) == ["C3:F4"]
+        assert index.find(11, 1) == []
+
+
+    def test_overlapping(self, RangeIndex):
+        index = RangeIndex()
+        index.add((1, 1, 1, 1000), "A1:A1000")
+        index.add((3, 3, 6, 4), "C3:F4")
+        index.add((8, 8, 8, 8), "H8")
+        found = index.overlapping((1, 4, 3, 8))
+        assert sorted(key for _, key in found) == ["A1:A1000", "C3:F4"]
+
+
+    def test_remove(self, RangeIndex):
+        index = RangeIndex()
+        index.add((1, 1, 2, 2), "A1:B2")
+        index.add((1, 1, 2, 2), "A1:B2 again")
+        index.remove((1, 1, 2, 2), "A1:B2")
+        assert index.find(1, 1) == [((1, 1, 2, 2), "A1:B2 again")]
+        index.remove((1, 1, 2, 2), "A1:B2 again")
+        assert index._levels == {}
+
+
+class TestCellRangeSet:
+
+
+    def test_ctor(self, CellRangeSet):
+        ranges = CellRangeSet("A1:B2 D4")
+        assert str(ranges) == "A1:B2 D4"
+        assert len(ranges) == 2
+
+
+    def test_join_cells(self, CellRangeSet):
+        ranges = CellRangeSet()
+        for coord in ["A1", "B1", "A2", "B2", "A3"]:
+            ranges.add(coord)
+        assert str(ranges) == "A1:B2 A3"
+        ranges.add("B3")
+        assert str(ranges) == "A1:B3"
+
+
+    def test_overlapping_ranges(self, CellRangeSet):
+        ranges = CellRangeSet("B2:D4")
+        ranges.add("A3:E3")
+        assert sorted(ranges.coordinates()) == sorted(
+            ["B2", "C2", "D2", "A3", "B3", "C3", "D3", "E3", "B4", "C4", "D4"])
+
+
+    def test_contains(self, CellRangeSet):
+        ranges = CellRangeSet("B2:D4")
+        assert "C3" in ranges
+        assert "A1" not in ranges
+        assert "junk" not in ranges
+        assert ranges.find(4, 4) == (2, 2, 4, 4)
+
+
+    def test_copy(self, CellRangeSet):
+        ranges = CellRangeSet("A1")
+        cp = copy(ranges)
+        cp.add("A2")
+        assert str(ranges) == "A1"
+        assert str(cp) == "A1:A2"
+
+
+    def test_discard(self, CellRangeSet):
+        ranges = CellRangeSet("A1:C3")
+        ranges.discard("B2")
+        assert "B2" not in ranges
+        assert len(ranges) == 4
+        ranges.discard("A1:C1")
+        assert str(ranges) == "A2 A3:C3 C2"
+
+
+    def test_whole_columns_and_rows(self, CellRangeSet):
+        ranges = CellRangeSet("A:B $D:$D 3:4")
+        assert "B1048576" in ranges
+        assert "XFD3" in ranges
+        assert "C5" not in ranges
+        assert str(ranges) == "A1:B2 3:4 A5:B1048576 D1:D2 D5:D1048576"
+        assert str(CellRangeSet("A:A")) == "A:A"
+
+
+    def test_reversed(self, CellRangeSet):
+        assert str(CellRangeSet("C3:A1")) == "A1:C3"
+        assert str(CellRangeSet("E:D 3:2")) == "2:3 D1:E1 D4:E1048576"
+
+
+    def test_invalid(self, CellRangeSet):
+        with pytest.raises(ValueError):
+            CellRangeSet("junk")
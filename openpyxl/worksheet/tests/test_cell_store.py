@@ -0,0 +1,306 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+import pytest
+
+from openpyxl.cell import Cell
+from openpyxl.workbook import Workbook
+from openpyxl.styles import Font
+from openpyxl.styles.cell_style import StyleArray
+
+
+@pytest.fixture
+def ws():
+    wb = Workbook(compact_cells=True)
+    return wb.active
+
+
+class TestCellDict:
+
+
+    def test_empty(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        assert cells.bounds is None
+
+
+    def test_extend(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells[(5, 3)] = None
+        assert cells.bounds == (5, 3, 5, 3)
+        cells.update({(2, 4): None, (7, 1): None})
+        assert cells.bounds == (2, 1, 7, 4)
+        cells.setdefault((8, 8))
+        assert cells.bounds == (2, 1, 8, 8)
+
+
+    def test_remove_inside(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells.update({(1, 1): None, (2, 2): None, (3, 3): None})
+        del cells[(2, 2)]
+        assert cells._stale is False
+        assert cells.bounds == (1, 1, 3, 3)
+
+
+    def test_remove_edge(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells.update({(1, 1): None, (2, 2): None, (3, 3): None})
+        del cells[(3, 3)]
+        cells.pop((1, 1))
+        assert cells._stale is True
+        cells[(2, 5)] = None
+        assert cells.bounds == (2, 2, 2, 5)
+        cells.popitem()
+        cells.popitem()
+        assert cells.bounds is None
+
+
+    def test_clear(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells[(1, 1)] = None
+        cells.clear()
+        assert cells.bounds is None
+        assert cells._rows == {}
+
+
+    def test_row_index(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells.update({(2, 3): None, (2, 1): None})
+        cells[(2, 2)] = None
+        cells[(2, 2)] = None
+        cells[(1, 5)] = None
+        assert dict((k, list(v)) for k, v in cells._rows.items()) == {
+            1: [5], 2: [1, 2, 3]}
+        del cells[(2, 2)]
+        cells.pop((1, 5))
+        assert dict((k, list(v)) for k, v in cells._rows.items()) == {
+            2: [1, 3]}
+
+
+    def test_update_row_index(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells.update({(1, 2): None, (1, 4): None})
+        cells.update({(1, 5): None, (1, 3): None, (1, 2): None, (2, 1): None})
+        assert dict((k, list(v)) for k, v in cells._rows.items()) == {
+            1: [2, 3, 4, 5], 2: [1]}
+        assert cells.bounds == (1, 1, 2, 5)
+
+
+    def test_add_values(self):
+        from ..cell_store import CellDict
+        wb = Workbook()
+        ws = wb.active
+        style_id = wb._cell_styles.add(StyleArray([0, 0, 0, 2, 0, 0, 0, 0, 0]))
+        cells = CellDict()
+        cells.add_values(ws, [(1, 1, 1.5, 'n'), (1, 2, True, 'b')], {2: style_id})
+        a1, b1 = cells[(1, 1)], cells[(1, 2)]
+        assert (a1.coordinate, a1.value, a1.has_style) == ("A1", 1.5, False)
+        assert (b1.coordinate, b1.data_type, b1.number_format) == ("B1", 'b', "0.00")
+        assert b1._style is not wb._cell_styles[style_id]
+
+
+    def test_rows(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells.update({(3, 1): "C", (1, 2): "B", (1, 1): "A"})
+        assert list(cells.rows()) == [
+            (1, [(1, "A"), (2, "B")]),
+            (3, [(1, "C")]),
+        ]
+
+
+    def test_rows_range(self):
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells.update({(3, 1): "C", (1, 1): "A", (2, 1): "B"})
+        assert list(cells.rows(2, 2)) == [(2, [(1, "B")])]
+        assert [row for row, _ in cells.rows(min_row=2)] == [2, 3]
+
+
+    def test_copy(self):
+        from copy import copy
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells[(1, 1)] = "A"
+        cp = copy(cells)
+        assert list(cp.rows()) == [(1, [(1, "A")])]
+
+
+    def test_pickle(self):
+        import pickle
+        from ..cell_store import CellDict
+        cells = CellDict()
+        cells.update({(3, 1): "C", (1, 2): "B", (1, 1): "A"})
+        cp = pickle.loads(pickle.dumps(cells))
+        assert cp == cells
+        assert cp.bounds == (1, 1, 3, 2)
+        assert list(cp.rows()) == list(cells.rows())
+
+
+class TestColumnarCellStore:
+
+
+    def test_ctor(self, ws):
+        from ..cell_store import ColumnarCellStore
+        assert isinstance(ws._cells, ColumnarCellStore)
+        assert len(ws._cells) == 0
+
+
+    def test_append_packs_values(self, ws):
+        ws.append([1.5, 2.5])
+        ws.append([None, 3.5])
+        store = ws._cells
+        assert len(store) == 4
+        assert store._cells == {}
+        assert store._columns[1].values == [1.5, None]
+        assert store._columns[2].values.tolist() == [2.5, 3.5]
+
+
+    def test_getitem_materialises_cell(self, ws):
+        ws.append([1, "=A1"])
+        store = ws._cells
+        cell = store[(1, 2)]
+        assert cell.value == "=A1"
+        assert cell.data_type == "f"
+        assert store[(1, 2)] is cell
+        assert store._packed == 1
+        assert len(store) == 2
+
+
+    def test_changes_to_cell_are_kept(self, ws):
+        ws.append([1])
+        ws['A1'].value = 5
+        ws['A1'].font = Font(bold=True)
+        assert ws['A1'].value == 5
+        assert ws['A1'].font.b is True
+
+
+    def test_style(self, ws):
+        ws['A1'].font = Font(bold=True)
+        ws['A1'].value = 3
+        ws._cells.pack(ws._cells[(1, 1)])
+        assert ws._cells._cells == {}
+        assert ws['A1'].font.b is True
+
+
+    def test_contains(self, ws):
+        ws.append([1])
+        assert (1, 1) in ws._cells
+        assert (1, 2) not in ws._cells
+        assert (2, 1) not in ws._cells
+
+
+    def test_delete(self, ws):
+        ws.append([1, 2])
+        ws['B1']
+        del ws._cells[(1, 1)]
+        del ws._cells[(1, 2)]
+        assert len(ws._cells) == 0
+        with pytest.raises(KeyError):
+            del ws._cells[(1, 1)]
+
+
+    def test_bounds(self, ws):
+        ws.append_rows([[1, 2], [3, 4]])
+        ws['E1'] = 5
+        assert ws._cells.bounds == (1, 1, 2, 5)
+        ws['A1']
+        del ws._cells[(2, 1)]
+        del ws._cells[(1, 5)]
+        assert ws._cells.bounds == (1, 1, 2, 2)
+
+
+    def test_pack_replaces_entry(self, ws):
+        ws.append([1])
+        cell = ws['A1']
+        cell.value = 3
+        ws._cells.pack(cell)
+        assert ws._cells._packed == 1
+        assert ws._cells._cells == {}
+        assert ws['A1'].value == 3
+
+
+    def test_add_values(self, ws):
+        style_id = ws.parent._cell_styles.add(StyleArray([0, 0, 0, 2, 0, 0, 0, 0, 0]))
+        ws['B1'] = "replaced"
+        ws._cells.add_values(ws, [(1, 1, 1.5, 'n'), (1, 2, 2.5, 'n'),
+                                  (2, 1, True, 'b')], {1: style_id})
+        assert ws._cells._cells == {}
+        assert len(ws._cells) == 3
+        assert ws._cells.bounds == (1, 1, 2, 2)
+        assert ws['B1'].value == 2.5
+        assert ws['A2'].data_type == 'b'
+        assert ws['A2'].number_format == "0.00"
+        assert ws['B1'].has_style is False
+
+
+    def test_insert_out_of_order(self, ws):
+        ws.append_rows([[1], [None], [3]])
+        cell = Cell(ws, row=2, col_idx=1, value=2)
+        ws._cells.update({(2, 1): cell})
+        assert list(ws._cells._columns[1].rows) == [1, 2, 3]
+        assert ws['A2'].value == 2
+
+
+    def test_hyperlinks_are_not_packed(self, ws):
+        ws['A1'].hyperlink = "http://test.com"
+        cell = ws['A1']
+        ws._cells.update({(1, 1): cell})
+        assert ws._cells[(1, 1)] is cell
+
+
+    def test_iteration(self, ws):
+        ws.append([1, 2])
+        ws['C3'] = 3
+        assert sorted(ws._cells) == [(1, 1), (1, 2), (3, 3)]
+        assert sorted(ws._cells.keys()) == sorted(ws._cells)
+        assert sorted(c.value for c in ws._cells.values()) == [1, 2, 3]
+        assert ws._cells.get((4, 4)) is None
+
+
+    def test_rows(self, ws):
+        ws.append([1, 2])
+        ws['C1'] = 3
+        ws['A3'] = 4
+        ws.append([5])
+        ws.append_rows([[None, 6]])
+        rows = [(idx, [(col, c.value) for col, c in row])
+                for idx, row in ws._cells.rows()]
+        assert rows == [
+            (1, [(1, 1), (2, 2), (3, 3)]),
+            (3, [(1, 4)]),
+            (4, [(1, 5)]),
+            (5, [(2, 6)]),
+        ]
+        assert len(ws._cells._cells) == 2
+
+
+    def test_rows_range(self, ws):
+        ws.append_rows([[1], [2], [3], [4]])
+        ws['B3'] = 5
+        rows = [(idx, [(col, c.value) for col, c in row])
+                for idx, row in ws._cells.rows(2, 3)]
+        assert rows == [(2, [(1, 2)]), (3, [(1, 3), (2, 5)])]
+
+
+    def test_rows_do_not_store_cells(self, ws):
+        ws.append([1, 2])
+        list(ws._cells.rows())
+        assert ws._cells._cells == {}
+
+
+    def test_restyle(self, ws):
+        from openpyxl.styles.styleable import StyleUpdate
+        ws.append_rows([[1, 2], [3, 4]])
+        update = StyleUpdate(ws.parent, font=Font(bold=True))
+        ws._cells.restyle(update, min_row=2, max_col=1)
+        assert ws._cells._cells == {}
+        assert ws['A2'].font.b is True
+        assert ws['A1'].has_style is False
+        assert ws['B2'].has_style is False
@@ -75,6 +75,38 @@ class TestDataValidation:
         assert dv.cells == ["A1"]
 
 
+    def test_cells(self, DataValidation):
+        dv = DataValidation()
+        dv.cells.add("B2")
+        dv.cells.append("A1")
+        dv.cells.extend(["A2", "B1"])
+        assert dv.sqref == "A1:B2"
+        assert len(dv.cells) == 4
+        assert "B1" in dv.cells
+        dv.cells.discard("A1")
+        assert dv.sqref == "A2:B2 B1"
+        dv.cells = ["C3", "A1"]
+        assert dv.sqref == "A1 C3"
+        assert dv.cells == ["A1", "C3"]
+
+
+    def test_add_range(self, DataValidation):
+        dv = DataValidation()
+        dv.add("A1:B2")
+        dv.add("A3")
+        dv.add("B3")
+        assert dv.sqref == "A1:B3"
+        assert "B2" in dv
+        assert "C1" not in dv
+
+
+    def test_ranges(self, DataValidation):
+        dv = DataValidation(sqref="A1")
+        dv.ranges.append("A2:A5")
+        assert dv.sqref == "A1:A5"
+        assert "A4" in dv
+
+
     def test_read_formula(self, DataValidation):
         xml = """
         <dataValidation xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" allowBlank="0" showErrorMessage="1" showInputMessage="1" sqref="A1" type="list">
@@ -127,6 +159,18 @@ class TestDataValidationList:
         assert diff is None, diff
 
 
+    def test_validations(self, DataValidationList):
+        from ..datavalidation import DataValidation
+        dvs = DataValidationList()
+        dv1 = DataValidation(sqref="A1:A10")
+        dv2 = DataValidation(sqref="A5:C5")
+        dvs.append(dv1)
+        dvs.append(dv2)
+        assert dvs.validations("A5") == [dv1, dv2]
+        assert dvs.validations("B5") == [dv2]
+        assert dvs.validations("B6") == []
+
+
     def test_from_xml(self, DataValidationList):
         src = """
         <dataValidations />
@@ -141,10 +185,13 @@ COLLAPSE_TEST_DATA = [
         ["A1"], "A1"
         ),
     (
-        ["A1", "B1"], "A1 B1"
+        ["A1", "B1"], "A1:B1"
+        ),
+    (
+        ["A1", "A2", "A3", "A4", "B1", "B2", "B3", "B4"], "A1:B4"
         ),
     (
-        ["A1", "A2", "A3", "A4", "B1", "B2", "B3", "B4"], "A1:A4 B1:B4"
+        ["A1", "B1", "C1", "A2", "B2", "C2", "A3"], "A1:C2 A3"
         ),
     (
         ["A2", "A4", "A3", "A1", "A5"], "A1:A5"
@@ -0,0 +1,98 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2017 openpyxl
+
+from copy import copy
+
+import pytest
+
+
+@pytest.fixture
+def MergedCellIndex():
+    from ..merge import MergedCellIndex
+    return MergedCellIndex
+
+
+class TestMergedCellIndex:
+
+
+    def test_ctor(self, MergedCellIndex):
+        index = MergedCellIndex(["A1:B2", "D4:D10"])
+        assert index == ["A1:B2", "D4:D10"]
+        assert len(index) == 2
+        assert "D4:D10" in index
+        assert index.bounds("D4:D10") == (4, 4, 4, 10)
+
+
+    def test_append_duplicate(self, MergedCellIndex):
+        index = MergedCellIndex(["A1:B2"])
+        index.append("A1:B2")
+        assert index == ["A1:B2"]
+
+
+    @pytest.mark.parametrize("range_string", ["B2:C3", "A1:A1", "A2:Z2", "B1:B5"])
+    def test_append_overlapping(self, MergedCellIndex, range_string):
+        index = MergedCellIndex(["A1:B2"])
+        with pytest.raises(ValueError):
+            index.append(range_string)
+
+
+    @pytest.mark.parametrize("row, col, result",
+                             [
+                                 (1, 1, "A1:B2"),
+                                 (2, 2, "A1:B2"),
+                                 (3, 1, None),
+                                 (2, 3, "C2:E2"),
+                                 (7, 4, "D5:D8"),
+                                 (9, 4, None),
+                             ]
+                             )
+    def test_find(self, MergedCellIndex, row, col, result):
+        index = MergedCellIndex(["A1:B2", "C2:E2", "D5:D8"])
+        assert index.find(row, col) == result
+
+
+    def test_overlapping(self, MergedCellIndex):
+        index = MergedCellIndex(["A1:B2", "C2:E2", "D5:D8", "A100:A200"])
+        assert sorted(index.overlapping(2, 2, 4, 5)) == ["A1:B2", "C2:E2", "D5:D8"]
+        assert index.overlapping(1, 3, 3, 99) == []
+        assert index.overlapping(1, 150, 1, 150) == ["A100:A200"]
+
+
+    def test_remove(self, MergedCellIndex):
+        index = MergedCellIndex(["A1:B2", "C2:E2"])
+        index.remove("A1:B2")
+        assert index == ["C2:E2"]
+        assert index.find(1, 1) is None
+        index.append("A1:B3")
+        with pytest.raises(ValueError):
+            index.remove("A1:B2")
+
+
+    def test_copy(self, MergedCellIndex):
+        index = MergedCellIndex(["A1:B2"])
+        cp = copy(index)
+        cp.remove("A1:B2")
+        assert index.find(1, 1) == "A1:B2"
+
+
+class TestMergedCellSet:
+
+
+    def test_contains(self):
+        from ..merge import MergedCellIndex, MergedCellSet
+        merged = MergedCellSet(MergedCellIndex(["B2:C3"]))
+        assert "C3" in merged
+        assert "A1" not in merged
+        assert "junk" not in merged
+        assert set(merged) == set(["B2", "B3", "C2", "C3"])
+        assert len(merged) == 4
+
+
+    def test_operators(self):
+        from ..merge import MergedCellIndex, MergedCellSet
+        merged = MergedCellSet(MergedCellIndex(["B2:B3"]))
+        assert merged & set(["B3", "D4"]) == set(["B3"])
+        assert merged | set(["D4"]) == set(["B2", "B3", "D4"])
+        assert merged - set(["B2"]) == set(["B3"])
+        assert merged ^ set(["B2", "D4"]) == set(["B3", "D4"])
+        assert merged == set(["B2", "B3"])
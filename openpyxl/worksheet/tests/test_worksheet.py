@@ -255,6 +255,94 @@ class TestWorksheet:
         assert ws['A2'].value == 25
 
 
+    def test_append_rows(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.append(['header'])
+
+        ws.append_rows([[1, 2.5, True], (2, 3.5, False)])
+
+        assert ws.max_row == 3
+        assert tuple(ws.values)[1:] == ((1, 2.5, True), (2, 3.5, False))
+        assert [c.data_type for c in ws[2]] == ['n', 'n', 'b']
+
+
+    def test_append_rows_mixed_types(self, Worksheet):
+        from datetime import date
+        ws = Worksheet(Workbook())
+
+        ws.append_rows([[1, 'a'], ['=A1', None], [date(2017, 1, 1), 'b']])
+
+        assert ws['A1'].data_type == 'n'
+        assert ws['A2'].data_type == 'f'
+        assert ws['A3'].value.date() == date(2017, 1, 1)
+        assert ws['A3'].number_format == 'yyyy-mm-dd'
+        assert ws['B1'].data_type == 's'
+        assert (2, 2) not in ws._cells
+
+
+    def test_append_rows_invalid(self, Worksheet):
+        ws = Worksheet(Workbook())
+        with pytest.raises(TypeError):
+            ws.append_rows(["test"])
+
+
+    def test_append_rows_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        cell = Cell(ws, value=5)
+        ws.append_rows([[1, cell], [2, 3]])
+        assert ws['B1'] is cell
+        assert cell.coordinate == "B1"
+        assert tuple(ws.values) == ((1, 5), (2, 3))
+        other = Worksheet(Workbook())
+        with pytest.raises(ValueError):
+            other.append_rows([[cell]])
+
+
+    @pytest.mark.parametrize("compact_cells", [False, True])
+    def test_append_rows_formats(self, Worksheet, compact_cells):
+        ws = Worksheet(Workbook(compact_cells=compact_cells))
+        ws.append_rows([[42737.25, 1], [None, 2], ["a", 3]],
+                       number_formats={1: "yyyy-mm-dd h:mm:ss"})
+        assert ws['A1'].number_format == "yyyy-mm-dd h:mm:ss"
+        assert ws['A1'].is_date
+        assert ws['A3'].number_format == "yyyy-mm-dd h:mm:ss"
+        assert 'A2' not in ws
+        assert ws['B1'].has_style is False
+
+
+    @pytest.mark.numpy_required
+    def test_append_array(self, Worksheet):
+        from numpy import arange
+        ws = Worksheet(Workbook())
+
+        ws.append_array(arange(6.0).reshape(2, 3))
+
+        assert tuple(ws.values) == ((0, 1, 2), (3, 4, 5))
+        assert type(ws['C2'].value) is float
+
+
+    @pytest.mark.numpy_required
+    def test_append_array_dates(self, Worksheet):
+        from datetime import datetime
+        from numpy import array
+        ws = Worksheet(Workbook())
+        ws.append([1])
+
+        ws.append_array(array([["2017-01-02T06:00", "NaT"]], dtype="datetime64[m]"))
+
+        assert ws['A2'].value == datetime(2017, 1, 2, 6)
+        assert ws['A2'].internal_value == 42737.25
+        assert ws['A2'].number_format == "yyyy-mm-dd h:mm:ss"
+        assert 'B2' not in ws
+        assert ws['A1'].has_style is False
+
+
+    def test_append_array_invalid(self, Worksheet):
+        ws = Worksheet(Workbook())
+        with pytest.raises(TypeError):
+            ws.append_array([[1, 2]])
+
+
     def test_rows(self, Worksheet):
 
         ws = Worksheet(Workbook())
@@ -326,6 +414,45 @@ class TestWorksheet:
         assert next(vals) == (4, 5, 6)
 
 
+    @pytest.mark.parametrize("compact_cells", [False, True])
+    def test_values_sparse(self, Worksheet, compact_cells):
+        ws = Worksheet(Workbook(compact_cells=compact_cells))
+        ws['B2'] = 1
+        ws['D5'] = 2
+        assert tuple(ws.values) == (
+            (None, None, None, None),
+            (None, 1, None, None),
+            (None, None, None, None),
+            (None, None, None, None),
+            (None, None, None, 2),
+        )
+        assert len(ws._cells) == 2
+        assert list(ws.iter_rows(min_row=2, max_row=2, min_col=2, max_col=3,
+                                 values_only=True)) == [(1, None)]
+
+
+    def test_iter_rows_without_creating_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['B2'] = 1
+        rows = tuple(ws.iter_rows(min_row=1, max_row=3, max_col=2,
+                                  create_cells=False))
+        assert [[c.coordinate for c in row] for row in rows] == [
+            ['A1', 'B1'], ['A2', 'B2'], ['A3', 'B3']]
+        assert rows[1][1] is ws._cells[(2, 2)]
+        assert len(ws._cells) == 1
+
+
+    @pytest.mark.parametrize("compact_cells", [False, True])
+    def test_change_cells_without_creating_cells(self, Worksheet, compact_cells):
+        ws = Worksheet(Workbook(compact_cells=compact_cells))
+        ws.append_rows([[1, 2], [3, 4]])
+        for row in ws.iter_rows(max_row=3, create_cells=False):
+            for cell in row:
+                cell.value = 99
+        assert list(ws.values) == [(99, 99), (99, 99)]
+        assert len(ws._cells) == 4
+
+
     def test_auto_filter(self, Worksheet):
         ws = Worksheet(Workbook())
 
@@ -422,6 +549,7 @@ class TestWorksheet:
         assert ws._merged_cells == ["A1:D4"]
         assert (4, 4) not in ws._cells
         assert (1, 1) in ws._cells
+        assert ws.calculate_dimension() == "A1:A1"
 
 
     def test_merge_coordinate(self, Worksheet):
@@ -430,6 +558,21 @@ class TestWorksheet:
         assert ws._merged_cells == ["A1:D4"]
 
 
+    def test_merge_overlapping(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("A1:D4")
+        with pytest.raises(ValueError):
+            ws.merge_cells("C3:F6")
+        assert ws._merged_cells == ["A1:D4"]
+
+
+    def test_merged_range(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws.merge_cells("B2:D4")
+        assert ws.merged_range(3, 3) == "B2:D4"
+        assert ws.merged_range(1, 1) is None
+
+
     def test_unmerge_range_string(self, Worksheet):
         ws = Worksheet(Workbook())
         ws._merged_cells = ["A1:D4"]
@@ -442,6 +585,45 @@ class TestWorksheet:
         ws.unmerge_cells(start_row=1, start_column=1, end_row=4, end_column=4)
 
 
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_style_range(self, compact):
+        from openpyxl.styles import Font
+        wb = Workbook(compact_cells=compact)
+        ws = wb.active
+        ws.append([1, 2])
+        ws['A1'].number_format = "0.00"
+        ws.style_range("A1:B2", font=Font(bold=True))
+        assert len(ws._cells) == 4
+        assert ws['A1'].number_format == "0.00"
+        assert ws['B2'].font.b is True
+        assert all(c.font.b for row in ws['A1:B2'] for c in row)
+        assert ws['C1'].has_style is False
+
+
+    def test_style_range_columns(self):
+        from openpyxl.styles import Font
+        wb = Workbook()
+        ws = wb.active
+        ws['B3'] = 1
+        ws['D3'] = 2
+        ws.style_range("B:C", font=Font(italic=True), number_format="0%")
+        assert ws.column_dimensions['B'].font.i is True
+        assert ws.column_dimensions['C'].number_format == "0%"
+        assert ws['B3'].font.i is True
+        assert ws['D3'].has_style is False
+        assert len(ws._cells) == 2
+
+
+    def test_style_range_rows(self):
+        from openpyxl.styles import PatternFill
+        wb = Workbook()
+        ws = wb.active
+        ws['B3'] = 1
+        ws.style_range("3:3", fill=PatternFill(patternType="solid"))
+        assert ws.row_dimensions[3].fill.patternType == "solid"
+        assert ws['B3'].fill.patternType == "solid"
+
+
     @pytest.mark.parametrize("value, result, rows_cols",
                              [
                                  (3, "1:3", None),
@@ -6,6 +6,7 @@ from __future__ import absolute_import
 
 # Python stdlib imports
 from itertools import islice, product
+from math import isnan
 import re
 from inspect import isgenerator
 from warnings import warn
@@ -16,7 +17,8 @@ from openpyxl.compat import (
     range,
     basestring,
     deprecated,
-    safe_string
+    safe_string,
+    NUMERIC_TYPES,
 )
 
 # package imports
@@ -25,13 +27,15 @@ from openpyxl.utils import (
     column_index_from_string,
     get_column_letter,
     range_boundaries,
-    rows_from_range,
     coordinate_to_tuple,
     absolute_coordinate,
 )
 from openpyxl.utils.cell import COORD_RE
+from openpyxl.utils.datetime import to_excel_array
 
 from openpyxl.cell import Cell
+from openpyxl.styles import numbers
+from openpyxl.styles.styleable import StyleUpdate
 from openpyxl.utils.exceptions import (
     SheetTitleException,
     InsufficientCoordinatesException,
@@ -48,7 +52,9 @@ from openpyxl.workbook.child import _WorkbookChild
 from openpyxl.workbook.defined_name import COL_RANGE_RE, ROW_RANGE_RE
 from openpyxl.utils.bound_dictionary import BoundDictionary
 
+from .cell_store import CellDict, ColumnarCellStore
 from .datavalidation import DataValidationList
+from .merge import MergedCellIndex, MergedCellSet
 from .page import (
     PrintPageSetup,
     PageMargins,
@@ -80,6 +86,19 @@ def flatten(results):
         yield(c.value for c in row)
 
 
+def _column_binder(value):
+    """
+    Return the type and data type to bind to a column from its first value.
+    Only types which need no conversion are bound, other values must be
+    bound individually.
+    """
+    if value is True or value is False:
+        return bool, Cell.TYPE_BOOL
+    if isinstance(value, NUMERIC_TYPES):
+        return type(value), Cell.TYPE_NUMERIC
+    return None, None
+
+
 class Worksheet(_WorkbookChild):
     """Represents a worksheet.
 
@@ -126,13 +145,16 @@ class Worksheet(_WorkbookChild):
         self.column_dimensions = DimensionHolder(worksheet=self,
                                                  default_factory=self._add_column)
         self.page_breaks = PageBreak()
-        self._cells = {}
+        if getattr(self.parent, "compact_cells", False):
+            self._cells = ColumnarCellStore(self)
+        else:
+            self._cells = CellDict()
         self._charts = []
         self._images = []
         self._rels = RelationshipList()
         self._drawing = None
         self._comments = []
-        self._merged_cells = []
+        self._merged_cells = MergedCellIndex()
         self._tables = []
         self.data_validations = DataValidationList()
         self._hyperlinks = []
@@ -387,9 +409,9 @@ class Worksheet(_WorkbookChild):
     @property
     def min_row(self):
         min_row = 1
-        if self._cells:
-            rows = set(c[0] for c in self._cells)
-            min_row = min(rows)
+        bounds = self._cells.bounds
+        if bounds is not None:
+            min_row = bounds[0]
         return min_row
 
 
@@ -400,18 +422,18 @@ class Worksheet(_WorkbookChild):
         :rtype: int
         """
         max_row = 1
-        if self._cells:
-            rows = set(c[0] for c in self._cells)
-            max_row = max(rows)
+        bounds = self._cells.bounds
+        if bounds is not None:
+            max_row = bounds[2]
         return max_row
 
 
     @property
     def min_column(self):
         min_col = 1
-        if self._cells:
-            cols = set(c[1] for c in self._cells)
-            min_col = min(cols)
+        bounds = self._cells.bounds
+        if bounds is not None:
+            min_col = bounds[1]
         return min_col
 
 
@@ -422,26 +444,18 @@ class Worksheet(_WorkbookChild):
         :rtype: int
         """
         max_col = 1
-        if self._cells:
-            cols = set(c[1] for c in self._cells)
-            max_col = max(cols)
+        bounds = self._cells.bounds
+        if bounds is not None:
+            max_col = bounds[3]
         return max_col
 
 
     def calculate_dimension(self):
         """Return the minimum bounding range for all cells containing data."""
-        if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
-        else:
+        bounds = self._cells.bounds
+        if bounds is None:
             return "A1:A1"
+        min_row, min_col, max_row, max_col = bounds
 
         return '%s%d:%s%d' % (
             get_column_letter(min_col), min_row,
@@ -455,7 +469,7 @@ class Worksheet(_WorkbookChild):
 
 
     def iter_rows(self, range_string=None, min_row=None, max_row=None, min_col=None, max_col=None,
-                  row_offset=0, column_offset=0):
+                  row_offset=0, column_offset=0, values_only=False, create_cells=True):
         """
         Return cells from the worksheet as rows. Boundaries for the cells can
         be passed in either as indices of rows and columns.
@@ -488,6 +502,12 @@ class Worksheet(_WorkbookChild):
         :param column_offset: additional columns (e.g. 3)
         :type column_offset: int
 
+        :param values_only: return the values of cells instead of the cells
+        :type values_only: bool
+
+        :param create_cells: add cells for missing coordinates to the worksheet. If False, cells which do not exist are created for each row without being stored and changes to them are lost
+        :type create_cells: bool
+
         :rtype: generator
         """
 
@@ -510,13 +530,54 @@ class Worksheet(_WorkbookChild):
         return self._cells_by_row(min_col + column_offset,
                                   min_row + row_offset,
                                   max_col,
-                                  max_row)
+                                  max_row,
+                                  values_only=values_only,
+                                  create_cells=create_cells)
 
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row):
+    def _cells_by_row(self, min_col, min_row, max_col, max_row,
+                      values_only=False, create_cells=True):
+        if values_only or not create_cells:
+            return self._stored_rows(min_col, min_row, max_col, max_row,
+                                     values_only)
+        return (tuple(self.cell(row=row, column=column)
+                      for column in range(min_col, max_col + 1))
+                for row in range(min_row, max_row + 1))
+
+
+    def _stored_rows(self, min_col, min_row, max_col, max_row, values_only=False):
+        """
+        Get rows from the cells in the worksheet without adding any.
+        Rows without cells are skipped using the row index of the cells.
+        Cells which do not exist are created for each row without being
+        stored.
+        """
+        columns = range(min_col, max_col + 1)
+        empty_values = (None,) * len(columns)
+        stored = self._cells.rows(min_row, max_row, store=not values_only)
+        next_row, cells = next(stored, (None, None))
+
         for row in range(min_row, max_row + 1):
-            yield tuple(self.cell(row=row, column=column)
-                    for column in range(min_col, max_col + 1))
+            if row != next_row:
+                if values_only:
+                    yield empty_values
+                else:
+                    yield tuple(Cell(self, row=row, col_idx=column)
+                                for column in columns)
+                continue
+
+            values = list(empty_values)
+            for column, cell in cells:
+                if min_col <= column <= max_col:
+                    if values_only:
+                        cell = cell.value
+                    values[column - min_col] = cell
+            if not values_only:
+                for idx, cell in enumerate(values):
+                    if cell is None:
+                        values[idx] = Cell(self, row=row, col_idx=min_col + idx)
+            next_row, cells = next(stored, (None, None))
+            yield tuple(values)
 
 
     @property
@@ -530,8 +591,8 @@ class Worksheet(_WorkbookChild):
         """
         Return the values of all the cells, row by row
         """
-        for row in self.iter_rows():
-            yield tuple(c.value for c in row)
+        for row in self.iter_rows(values_only=True):
+            yield row
 
 
     def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None):
@@ -687,7 +748,10 @@ class Worksheet(_WorkbookChild):
 
 
     def merge_cells(self, range_string=None, start_row=None, start_column=None, end_row=None, end_column=None):
-        """ Set merge on a cell range.  Range is a cell range (e.g. A1:E1) """
+        """ Set merge on a cell range.  Range is a cell range (e.g. A1:E1)
+
+        A ValueError is raised if the range overlaps merged cells
+        """
         if not range_string and not all((start_row, start_column, end_row, end_column)):
             msg = "You have to provide a value either for 'coordinate' or for\
             'start_row', 'start_column', 'end_row' *and* 'end_column'"
@@ -720,11 +784,7 @@ class Worksheet(_WorkbookChild):
     @property
     def merged_cells(self):
         """Utility for checking whether a cell has been merged or not"""
-        cells = set()
-        for _range in self._merged_cells:
-            for row in rows_from_range(_range):
-                cells = cells.union(set(row))
-        return cells
+        return MergedCellSet(self._merged_cells)
 
 
     @property
@@ -733,6 +793,13 @@ class Worksheet(_WorkbookChild):
         return self._merged_cells[:]
 
 
+    def merged_range(self, row, column):
+        """
+        Return the merged range containing a cell or None
+        """
+        return self._merged_cells.find(row, column)
+
+
     def unmerge_cells(self, range_string=None, start_row=None, start_column=None, end_row=None, end_column=None):
         """ Remove merge on a cell range.  Range is a cell range (e.g. A1:E1) """
         if not range_string:
@@ -755,6 +822,43 @@ class Worksheet(_WorkbookChild):
             msg = 'Cell range %s not known as merged.' % range_string
             raise InsufficientCoordinatesException(msg)
 
+    def style_range(self, range_string, font=None, fill=None, border=None,
+                    number_format=None, protection=None, alignment=None):
+        """
+        Apply styles to a range of cells 'A1:D25' or to rows or columns
+        '4:10', 'A:D'. Only the given styles are changed and each is added to
+        the workbook once.
+
+        Cells in a range of cells are created if they do not exist. For rows
+        and columns the row or column default is set and existing cells are
+        changed.
+        """
+        update = StyleUpdate(self.parent, font=font, fill=fill, border=border,
+                             number_format=number_format,
+                             protection=protection, alignment=alignment)
+        if not update.changes:
+            return
+
+        min_col, min_row, max_col, max_row = range_boundaries(range_string)
+        if min_row is None:
+            for col in range(min_col, max_col + 1):
+                dim = self.column_dimensions[get_column_letter(col)]
+                dim._style = update.array(dim._style)
+        elif min_col is None:
+            for row in range(min_row, max_row + 1):
+                dim = self.row_dimensions[row]
+                dim._style = update.array(dim._style)
+        else:
+            new_cells = {}
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    if (row, col) not in self._cells:
+                        new_cells[(row, col)] = Cell(self, row=row, col_idx=col)
+            self._cells.update(new_cells)
+
+        self._cells.restyle(update, min_row, min_col, max_row, max_col)
+
+
     def append(self, iterable):
         """Appends a group of values at the bottom of the current sheet.
 
@@ -774,6 +878,7 @@ class Worksheet(_WorkbookChild):
 
         """
         row_idx = self._current_row + 1
+        cells = {}
 
         if (isinstance(iterable, (list, tuple, range))
             or isgenerator(iterable)):
@@ -786,23 +891,125 @@ class Worksheet(_WorkbookChild):
                     cell.parent = self
                     cell.col_idx = col_idx
                     cell.row = row_idx
+                    self._cells[(row_idx, col_idx)] = cell
                 else:
                     cell = Cell(self, row=row_idx, col_idx=col_idx, value=content)
-                self._cells[(row_idx, col_idx)] = cell
+                    cells[(row_idx, col_idx)] = cell
 
         elif isinstance(iterable, dict):
             for col_idx, content in iterable.items():
                 if isinstance(col_idx, basestring):
                     col_idx = column_index_from_string(col_idx)
                 cell = Cell(self, row=row_idx, col_idx=col_idx, value=content)
-                self._cells[(row_idx, col_idx)] = cell
+                cells[(row_idx, col_idx)] = cell
 
         else:
             self._invalid_row(iterable)
 
+        self._cells.update(cells)
         self._current_row = row_idx
 
 
+    def append_rows(self, rows, number_formats=None):
+        """Appends many rows of values at the bottom of the current sheet.
+
+        Like calling :meth:`append` for each row, except that empty (`None`)
+        values do not create cells, but optimised for large blocks of
+        homogeneous data such as numbers: the data type of each column is
+        bound once from its first value and following values of the same
+        type are added to the cells of the sheet without creating cell
+        objects. Values of other types are bound individually.
+
+        :param rows: iterable of lists, tuples, ranges or generators of values
+        :type rows: iterable
+
+        :param number_formats: number formats for the cells of some columns
+        :type number_formats: dict of column index to format
+
+        Usage:
+
+        * append_rows([[1, 2.5, 'a'], [2, 3.5, 'b']])
+        * append_rows([[42737.25]], number_formats={1: 'yyyy-mm-dd h:mm:ss'})
+
+        :raise: TypeError when a row is not a list, tuple, range or generator
+
+        """
+        row_idx = self._current_row
+        binders = {}
+        values = []
+        cells = {}
+        styles = {}
+        for col_idx, number_format in (number_formats or {}).items():
+            update = StyleUpdate(self.parent, number_format=number_format)
+            styles[col_idx] = update.style_id(0)
+
+        for row in rows:
+            if not (isinstance(row, (list, tuple, range)) or isgenerator(row)):
+                self._invalid_row(row)
+            row_idx += 1
+
+            for col_idx, value in enumerate(row, 1):
+                if value is None:
+                    continue
+
+                binder = binders.get(col_idx)
+                if binder is None:
+                    binder = binders[col_idx] = _column_binder(value)
+
+                if type(value) is binder[0]:
+                    values.append((row_idx, col_idx, value, binder[1]))
+                elif isinstance(value, Cell):
+                    # compatible with append
+                    cell = value
+                    if cell.parent and cell.parent != self:
+                        raise ValueError("Cells cannot be copied from other worksheets")
+                    cell.parent = self
+                    cell.col_idx = col_idx
+                    cell.row = row_idx
+                    self._cells[(row_idx, col_idx)] = cell
+                else:
+                    style = styles.get(col_idx)
+                    if style is not None:
+                        style = self.parent._cell_styles[style]
+                    cell = Cell(self, row=row_idx, col_idx=col_idx,
+                                style_array=style)
+                    cell.value = value
+                    cells[(row_idx, col_idx)] = cell
+
+        self._cells.add_values(self, values, styles)
+        self._cells.update(cells)
+        self._current_row = row_idx
+
+
+    def append_array(self, array):
+        """Appends a two-dimensional array, such as a NumPy `ndarray`, at the
+        bottom of the current sheet.
+
+        The array is converted to native Python values in a single call and
+        appended using :meth:`append_rows`. Arrays of `datetime64` values are
+        converted to serial numbers in a single call and formatted as dates.
+
+        :param array: two-dimensional array of values
+        :type array: numpy.ndarray
+
+        :raise: TypeError when the array is not two-dimensional
+
+        """
+        if getattr(array, "ndim", None) != 2:
+            raise TypeError("Value must be a two-dimensional array. Supplied value is {0}".format(
+                type(array))
+                            )
+        if array.dtype.kind != "M":
+            self.append_rows(array.tolist())
+            return
+
+        serials = to_excel_array(array, self.parent.excel_base_date)
+        formats = dict.fromkeys(range(1, array.shape[1] + 1),
+                                numbers.FORMAT_DATE_DATETIME)
+        self.append_rows([[None if isnan(v) else v for v in row]
+                          for row in serials.tolist()], formats)
+
+
     def _invalid_row(self, iterable):
         raise TypeError('Value must be a list, tuple, range or generator, or a dict. Supplied value is {0}'.format(
             type(iterable))
@@ -861,13 +1068,13 @@ class Worksheet(_WorkbookChild):
         return RowDimension(self)
 
 
-    def _write(self):
+    def _write(self, rows=None):
         from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
         from openpyxl.writer.worksheet import write_worksheet
         self._drawing = SpreadsheetDrawing()
         self._drawing.charts = self._charts
         self._drawing.images = self._images
-        return write_worksheet(self)
+        return write_worksheet(self, rows=rows)
 
 
     @property
@@ -1,27 +1,29 @@
 from __future__ import absolute_import
 # Copyright (c) 2010-2017 openpyxl
 
+from heapq import merge
+from itertools import groupby
 from operator import itemgetter
 
 from openpyxl.compat import safe_string
 from openpyxl.comments.comment_sheet import CommentRecord
+from openpyxl.utils.cell import _STRING_COL_CACHE
+from openpyxl.writer.strings import write_string_item
 from openpyxl.xml.functions import Element, SubElement
 from openpyxl import LXML
 
 
 def get_rows_to_write(worksheet):
-    """Return all rows, and any cells that they contain"""
-    # order cells by row
-    rows = {}
-    for (row, col), cell in worksheet._cells.items():
-        rows.setdefault(row, []).append((col, cell))
-
+    """Return all rows, and any cells that they contain, ordered by row"""
     # add empty rows if styling has been applied
-    for row_idx in worksheet.row_dimensions:
-        if row_idx not in rows:
-            rows[row_idx] = []
+    empty = ((row_idx, []) for row_idx in sorted(worksheet.row_dimensions))
+    rows = merge(worksheet._cells.rows(), empty)
 
-    return sorted(rows.items())
+    for row_idx, group in groupby(rows, key=itemgetter(0)):
+        cells = []
+        for _, row in group:
+            cells.extend(row)
+        yield row_idx, cells
 
 
 def write_rows(xf, worksheet):
@@ -31,8 +33,7 @@ def write_rows(xf, worksheet):
     max_column = worksheet.max_column
 
     with xf.element("sheetData"):
-        for row_idx, row in sorted(all_rows):
-            row = sorted(row, key=itemgetter(0))
+        for row_idx, row in all_rows:
             write_row(xf, worksheet, row, row_idx, max_column)
 
 
@@ -56,6 +57,10 @@ def write_row(xf, worksheet, row, row_idx, max_column):
             el = write_cell(xf, worksheet, cell, cell.has_style)
 
 
+def _inline_strings(worksheet):
+    return getattr(worksheet.parent, "inline_strings", False)
+
+
 def etree_write_cell(xf, worksheet, cell, styled=None):
 
     coordinate = cell.coordinate
@@ -63,7 +68,10 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
     if styled:
         attributes['s'] = '%d' % cell.style_id
 
-    if cell.data_type != 'f':
+    inline = cell.data_type == 's' and _inline_strings(worksheet)
+    if inline:
+        attributes['t'] = 'inlineStr'
+    elif cell.data_type != 'f':
         attributes['t'] = cell.data_type
 
     value = cell._value
@@ -84,11 +92,14 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
             formula.text = value[1:]
             value = None
 
-    if cell.data_type == 's':
-        value = worksheet.parent.shared_strings.add(value)
-    cell_content = SubElement(el, 'v')
-    if value is not None:
-        cell_content.text = safe_string(value)
+    if inline:
+        el.append(write_string_item(value, 'is'))
+    else:
+        if cell.data_type == 's':
+            value = worksheet.parent.shared_strings.add(value)
+        cell_content = SubElement(el, 'v')
+        if value is not None:
+            cell_content.text = safe_string(value)
 
     if cell.hyperlink:
         worksheet._hyperlinks.append(cell.hyperlink)
@@ -102,7 +113,10 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
     if styled:
         attributes['s'] = '%d' % cell.style_id
 
-    if cell.data_type != 'f':
+    inline = cell.data_type == 's' and _inline_strings(worksheet)
+    if inline:
+        attributes['t'] = 'inlineStr'
+    elif cell.data_type != 'f':
         attributes['t'] = cell.data_type
 
     value = cell._value
@@ -123,16 +137,157 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                     xf.write(value[1:])
                     value = None
 
-        if cell.data_type == 's':
-            value = worksheet.parent.shared_strings.add(value)
-        with xf.element("v"):
-            if value is not None:
-                xf.write(safe_string(value))
+        if inline:
+            xf.write(write_string_item(value, 'is'))
+        else:
+            if cell.data_type == 's':
+                value = worksheet.parent.shared_strings.add(value)
+            with xf.element("v"):
+                if value is not None:
+                    xf.write(safe_string(value))
 
         if cell.hyperlink:
             worksheet._hyperlinks.append(cell.hyperlink)
 
 
+def _escape_text(value):
+    return (value.replace("&", "&amp;").replace("<", "&lt;")
+            .replace(">", "&gt;").replace("\r", "&#13;"))
+
+
+def _escape_attribute(value):
+    return (_escape_text(value).replace('"', "&quot;")
+            .replace("\n", "&#10;").replace("\t", "&#9;"))
+
+
+def _inline_string(value):
+    if value.strip() != value:
+        return '<is><t xml:space="preserve">%s</t></is>' % _escape_text(value)
+    return '<is><t>%s</t></is>' % _escape_text(value)
+
+
+def _attributes(attrs):
+    return "".join(' %s="%s"' % (key, _escape_attribute(value))
+                   for key, value in attrs.items())
+
+
+_PLAIN_NUMBERS = (int, float, bool)
+
+
+def iter_rows_xml(worksheet):
+    """
+    Serialise worksheet data row by row without creating elements for cells.
+
+    Produces the same markup as `write_rows` with the lxml writer, each row
+    as ASCII encoded bytes.
+    """
+    dims = worksheet.row_dimensions
+    spans = '1:%d' % worksheet.max_column
+    letters = _STRING_COL_CACHE
+    add_string = worksheet.parent.shared_strings.add
+    formula_attributes = worksheet.formula_attributes
+    comments = worksheet._comments
+    hyperlinks = worksheet._hyperlinks
+    inline = _inline_strings(worksheet)
+
+    for row_idx, row in get_rows_to_write(worksheet):
+        attrs = {'r': '%d' % row_idx, 'spans': spans}
+        if row_idx in dims:
+            attrs.update(dict(dims[row_idx]))
+        parts = ['<row%s>' % _attributes(attrs)]
+
+        for col, cell in row:
+            value = cell._value
+            styled = cell.has_style
+            if value is None and not styled and not cell._comment:
+                continue
+
+            coordinate = '%s%d' % (letters[col], row_idx)
+            data_type = cell.data_type
+            tag = '<c r="%s"' % coordinate
+            if styled:
+                tag += ' s="%d"' % cell.style_id
+            if data_type == 's' and inline:
+                tag += ' t="inlineStr"'
+            elif data_type != 'f':
+                tag += ' t="%s"' % data_type
+
+            if cell._comment is not None:
+                comments.append(CommentRecord.from_cell(cell))
+
+            if value is None or value == '':
+                parts.append(tag + '></c>')
+                continue
+
+            if data_type == 'f':
+                shared_formula = formula_attributes.get(coordinate, {})
+                parts.append('%s><f%s>%s</f><v></v></c>' % (
+                    tag, _attributes(shared_formula), _escape_text(value[1:])))
+            elif data_type == 's':
+                if inline:
+                    parts.append('%s>%s</c>' % (tag, _inline_string(value)))
+                else:
+                    parts.append('%s><v>%d</v></c>' % (tag, add_string(value)))
+            elif type(value) in _PLAIN_NUMBERS:
+                if value != value: # NaN
+                    parts.append(tag + '><v></v></c>')
+                else:
+                    parts.append('%s><v>%.16g</v></c>' % (tag, value))
+            else:
+                parts.append('%s><v>%s</v></c>' % (
+                    tag, _escape_text(safe_string(value))))
+
+            if cell._hyperlink:
+                hyperlinks.append(cell._hyperlink)
+
+        parts.append('</row>')
+        yield "".join(parts).encode("ascii", "xmlcharrefreplace")
+
+
+def prepare_rows(worksheet):
+    """
+    Add the strings and styles of cells to the workbook, and their comments
+    and hyperlinks to the worksheet, in the order `iter_rows_xml` would.
+
+    Rows can then be serialised elsewhere without changing the workbook.
+    """
+    add_string = worksheet.parent.shared_strings.add
+    inline = _inline_strings(worksheet)
+    worksheet._hyperlinks = []
+
+    for row_idx, row in get_rows_to_write(worksheet):
+        for col, cell in row:
+            value = cell._value
+            styled = cell.has_style
+            if value is None and not styled and not cell._comment:
+                continue
+            if styled:
+                cell.style_id
+            if cell._comment is not None:
+                worksheet._comments.append(CommentRecord.from_cell(cell))
+            if value is None or value == '':
+                continue
+            if cell.data_type == 's' and not inline:
+                add_string(value)
+            if cell._hyperlink:
+                worksheet._hyperlinks.append(cell._hyperlink)
+
+
+def write_rows_raw(xf, out, worksheet, rows=None):
+    """
+    Write worksheet data straight to the file underneath an lxml
+    incremental writer.
+
+    `rows` can be data already serialised with `iter_rows_xml`.
+    """
+    if rows is None:
+        rows = iter_rows_xml(worksheet)
+    with xf.element("sheetData"):
+        xf.flush()
+        for row in rows:
+            out.write(row)
+
+
 if LXML:
     write_cell = lxml_write_cell
 else:
@@ -5,8 +5,9 @@ from __future__ import absolute_import
 
 # Python stdlib imports
 from io import BytesIO
+import os
 import re
-from zipfile import ZipFile, ZIP_DEFLATED
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 
 # package imports
 from openpyxl.xml.constants import (
@@ -26,6 +27,7 @@ from openpyxl.xml.constants import (
     PACKAGE_XL
     )
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl import LXML
 from openpyxl.xml.functions import tostring, fromstring, Element
 from openpyxl.packaging.manifest import Manifest
 from openpyxl.packaging.relationship import (
@@ -35,7 +37,7 @@ from openpyxl.packaging.relationship import (
 )
 from openpyxl.packaging.extended import ExtendedProperties
 
-from openpyxl.writer.strings import write_string_table
+from openpyxl.writer.strings import write_string_table, SharedStringFile
 from openpyxl.writer.workbook import (
     write_root_rels,
     write_workbook_rels,
@@ -43,17 +45,105 @@ from openpyxl.writer.workbook import (
 )
 from openpyxl.writer.theme import write_theme
 from openpyxl.writer.worksheet import write_worksheet
+from openpyxl.writer.etree_worksheet import prepare_rows, iter_rows_xml
+from openpyxl.worksheet import Worksheet
 from openpyxl.styles.stylesheet import write_stylesheet
 
 from openpyxl.comments.comment_sheet import CommentSheet
 
 
+# zip method and deflate level for each compression option
+COMPRESSION = {
+    'store': (ZIP_STORED, None),
+    'fast': (ZIP_DEFLATED, 1),
+    'default': (ZIP_DEFLATED, None),
+    'max': (ZIP_DEFLATED, 9),
+}
+
+
+def open_archive(filename, compression='default'):
+    """
+    Open a zip archive for writing with one of the `COMPRESSION` options.
+    Levels other than the default need Python 3.7 or later.
+    """
+    if compression not in COMPRESSION:
+        raise ValueError("Compression must be one of {0}".format(
+            ", ".join(sorted(COMPRESSION))))
+    method, level = COMPRESSION[compression]
+    archive = ZipFile(filename, 'w', method, allowZip64=True)
+    archive.compresslevel = level
+    return archive
+
+
+# worksheets shared with forked processes
+_WORKSHEETS = []
+
+
+def _serialise_rows(idx):
+    return b"".join(iter_rows_xml(_WORKSHEETS[idx]))
+
+
+def _fork_context():
+    if not hasattr(os, "fork"):
+        return
+    import multiprocessing
+    try:
+        return multiprocessing.get_context("fork")
+    except AttributeError: # Python 2 always forks
+        return multiprocessing
+
+
+def serialise_rows_parallel(worksheets, processes=None):
+    """
+    Serialise the cell data of worksheets in a pool of processes.
+
+    Strings and styles are added to the workbook beforehand so that all
+    processes use the same indices. Returns the data for each worksheet in
+    order or None for worksheets which must be written normally.
+
+    Shared strings written to a file forget their indices, so worksheets
+    are always written normally with them.
+    """
+    global _WORKSHEETS
+    context = _fork_context()
+    file_strings = any(isinstance(ws.parent.shared_strings, SharedStringFile)
+                       for ws in worksheets)
+    if context is None or not LXML or file_strings:
+        return [None] * len(worksheets)
+
+    todo = []
+    for idx, ws in enumerate(worksheets):
+        if isinstance(ws, Worksheet):
+            prepare_rows(ws)
+            todo.append(idx)
+
+    _WORKSHEETS = worksheets
+    pool = context.Pool(processes)
+    try:
+        results = pool.map(_serialise_rows, todo)
+    finally:
+        pool.close()
+        pool.join()
+        _WORKSHEETS = []
+
+    rows = [None] * len(worksheets)
+    for idx, xml in zip(todo, results):
+        rows[idx] = [xml]
+    return rows
+
+
 class ExcelWriter(object):
-    """Write a workbook object to an Excel file."""
+    """Write a workbook object to an Excel file.
 
-    def __init__(self, workbook, archive):
+    With `processes` the cell data of worksheets is serialised in parallel
+    by that many processes, or one for each cpu if it is 0. This needs lxml
+    and a platform which can fork, otherwise worksheets are written in turn.
+    """
+
+    def __init__(self, workbook, archive, processes=None):
         self._archive = archive
         self.workbook = workbook
+        self.processes = processes
         self.manifest = Manifest()
         self.vba_modified = set()
         self._tables = []
@@ -83,8 +173,11 @@ class ExcelWriter(object):
         self._write_images()
         self._write_charts()
 
-        self._archive.writestr(ARC_SHARED_STRINGS,
-                              write_string_table(self.workbook.shared_strings))
+        strings = self.workbook.shared_strings
+        if isinstance(strings, SharedStringFile):
+            strings._write_archive(archive)
+        else:
+            archive.writestr(ARC_SHARED_STRINGS, write_string_table(strings))
         self._write_external_links()
 
         stylesheet = write_stylesheet(self.workbook)
@@ -191,13 +284,22 @@ class ExcelWriter(object):
 
     def _write_worksheets(self):
 
-        for idx, ws in enumerate(self.workbook.worksheets, 1):
+        worksheets = self.workbook.worksheets
+        rows = [None] * len(worksheets)
+        if self.processes is not None and not self.workbook.write_only:
+            rows = serialise_rows_parallel(worksheets, self.processes or None)
+
+        for idx, ws in enumerate(worksheets, 1):
 
             ws._id = idx
-            xml = ws._write()
             rels_path = get_rels_path(ws.path)[1:]
 
-            self._archive.writestr(ws.path[1:], xml)
+            if self.workbook.write_only:
+                ws._write_archive(self._archive)
+            elif rows[idx-1] is not None:
+                self._archive.writestr(ws.path[1:], ws._write(rows[idx-1]))
+            else:
+                self._archive.writestr(ws.path[1:], ws._write())
             self.manifest.append(ws)
 
             if ws._drawing:
@@ -249,7 +351,7 @@ class ExcelWriter(object):
         self._archive.close()
 
 
-def save_workbook(workbook, filename,):
+def save_workbook(workbook, filename, processes=None, compression='default'):
     """Save the given workbook on the filesystem under the name filename.
 
     :param workbook: the workbook to save
@@ -258,19 +360,27 @@ def save_workbook(workbook, filename,):
     :param filename: the path to which save the workbook
     :type filename: string
 
+    :param processes: number of processes to serialise worksheets with, 0 for one per cpu
+    :type processes: int
+
+    :param compression: 'store', 'fast', 'default' or 'max'
+    :type compression: string
+
     :rtype: bool
 
     """
-    archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
-    writer = ExcelWriter(workbook, archive)
+    # lazy sheets must be read before the file they come from is overwritten
+    workbook._load_sheets()
+    archive = open_archive(filename, compression)
+    writer = ExcelWriter(workbook, archive, processes=processes)
     writer.save(filename)
     return True
 
 
-def save_virtual_workbook(workbook,):
+def save_virtual_workbook(workbook, compression='default'):
     """Return an in-memory workbook, suitable for a Django response."""
     temp_buffer = BytesIO()
-    archive = ZipFile(temp_buffer, 'w', ZIP_DEFLATED, allowZip64=True)
+    archive = open_archive(temp_buffer, compression)
 
     writer = ExcelWriter(workbook, archive)
 
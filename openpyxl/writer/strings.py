@@ -3,13 +3,25 @@ from __future__ import absolute_import
 
 """Write the shared string table."""
 from io import BytesIO
+import os
 
 # package imports
-from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import Element, xmlfile, SubElement
+from openpyxl.xml.constants import SHEET_MAIN_NS, ARC_SHARED_STRINGS
+from openpyxl.xml.functions import Element, xmlfile, SubElement, tostring
 
 PRESERVE_SPACE = '{%s}space' % "http://www.w3.org/XML/1998/namespace"
 
+
+def write_string_item(key, tag='si'):
+    """Create the element for a string"""
+    el = Element(tag)
+    text = SubElement(el, 't')
+    text.text = key
+    if key.strip() != key:
+        text.set(PRESERVE_SPACE, 'preserve')
+    return el
+
+
 def write_string_table(string_table):
     """Write the string table xml."""
     out = BytesIO()
@@ -18,11 +30,66 @@ def write_string_table(string_table):
         with xf.element("sst", xmlns=SHEET_MAIN_NS, uniqueCount="%d" % len(string_table)):
 
             for key in string_table:
-                el = Element('si')
-                text = SubElement(el, 't')
-                text.text = key
-                if key.strip() != key:
-                    text.set(PRESERVE_SPACE, 'preserve')
-                xf.write(el)
+                xf.write(write_string_item(key))
 
     return  out.getvalue()
+
+
+class SharedStringFile(object):
+    """
+    Shared string table which is written to a temporary file as strings are
+    added.
+
+    At most `max_strings` strings are kept in memory to look up their
+    indices. When this is full it is emptied, so that strings seen again
+    afterwards are added to the table again.
+
+    The temporary file is removed by `close`.
+    """
+
+    def __init__(self, max_strings=10000):
+        from .write_only import create_temporary_file
+        self.max_strings = max_strings
+        self._indices = {}
+        self._count = 0
+        self.filename = create_temporary_file(suffix='.xml')
+        self._file = open(self.filename, 'wb')
+        self._file.write(('<sst xmlns="%s">' % SHEET_MAIN_NS).encode("ascii"))
+
+
+    def add(self, value):
+        idx = self._indices.get(value)
+        if idx is None:
+            if len(self._indices) >= self.max_strings:
+                self._indices.clear()
+            idx = self._indices[value] = self._count
+            self._count += 1
+            self._file.write(tostring(write_string_item(value)))
+        return idx
+
+
+    def __len__(self):
+        return self._count
+
+
+    def _write_archive(self, archive):
+        """
+        Copy the table into the archive. Strings can still be added afterwards.
+        """
+        end = self._file.tell()
+        self._file.write(b"</sst>")
+        self._file.flush()
+        archive.write(self.filename, ARC_SHARED_STRINGS)
+        self._file.seek(end)
+        self._file.truncate()
+
+
+    def close(self):
+        """
+        Close and remove the temporary file. No strings can be added
+        afterwards.
+        """
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
@@ -143,3 +143,93 @@ def test_merge_vba(ExcelWriter, archive, datadir):
         'xl/ctrlProps/ctrlProp8.xml',
         'xl/ctrlProps/ctrlProp2.xml',
     ])
+
+
+@pytest.mark.lxml_required
+def test_parallel_worksheets(ExcelWriter):
+    from openpyxl.comments import Comment
+    from openpyxl.styles import Font
+
+    def write(processes):
+        wb = Workbook()
+        for idx in range(3):
+            ws = wb.create_sheet()
+            ws.append(["Metabolite", "Mean", idx])
+            ws.append(["Sheet%d" % idx, 1.5, "=B2*2"])
+            ws["A1"].font = Font(bold=True, size=10 + idx)
+            ws["B1"].comment = Comment("Note %d" % idx, "Author")
+            ws["C2"].hyperlink = "http://test.com/%d" % idx
+        out = BytesIO()
+        archive = ZipFile(out, "w")
+        writer = ExcelWriter(wb, archive, processes=processes)
+        writer.write_data()
+        archive.close()
+        archive = ZipFile(out)
+        return dict((name, archive.read(name)) for name in archive.namelist()
+                    if name != "docProps/core.xml")
+
+    serial = write(None)
+    assert write(2) == serial
+
+
+@pytest.mark.lxml_required
+def test_parallel_shared_string_file(tmpdir):
+    from openpyxl import load_workbook
+    from ..excel import save_workbook
+    tmpdir.chdir()
+    wb = Workbook(max_shared_strings=2)
+    for idx in range(3):
+        ws = wb.create_sheet()
+        for row in range(10):
+            ws.append(["s%d" % (row % 3), "t%d" % row])
+
+    save_workbook(wb, "strings.xlsx", processes=2)
+
+    wb = load_workbook("strings.xlsx")
+    for ws in wb.worksheets[1:]:
+        assert [row for row in ws.values][4] == ("s1", "t4")
+
+
+@pytest.mark.parametrize("compression, method",
+                         [
+                             ("store", 0),
+                             ("fast", 8),
+                             ("default", 8),
+                             ("max", 8),
+                         ]
+                         )
+def test_save_compression(tmpdir, compression, method):
+    from openpyxl import load_workbook
+    tmpdir.chdir()
+    wb = Workbook()
+    wb.active.append(list(range(100)))
+    wb.save("compressed.xlsx", compression=compression)
+
+    archive = ZipFile("compressed.xlsx")
+    assert set(info.compress_type for info in archive.infolist()) == set([method])
+    archive.close()
+    wb = load_workbook("compressed.xlsx")
+    assert wb.active["CV1"].value == 99
+
+
+def test_save_processes(tmpdir, monkeypatch):
+    from .. import excel
+    tmpdir.chdir()
+    calls = []
+    serialise = excel.serialise_rows_parallel
+
+    def parallel(worksheets, processes=None):
+        calls.append(processes)
+        return serialise(worksheets, processes)
+
+    monkeypatch.setattr(excel, "serialise_rows_parallel", parallel)
+    wb = Workbook()
+    wb.active.append([1, "text"])
+    wb.save("parallel.xlsx", processes=2)
+    assert calls == [2]
+
+
+def test_invalid_compression():
+    from ..excel import open_archive
+    with pytest.raises(ValueError):
+        open_archive(BytesIO(), "zip")
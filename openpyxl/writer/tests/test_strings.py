@@ -29,3 +29,53 @@ def test_preseve_space():
     """
     diff = compare_xml(content, expected)
     assert diff is None, diff
+
+
+class TestSharedStringFile:
+
+
+    def test_add(self):
+        from ..strings import SharedStringFile
+        table = SharedStringFile()
+        assert table.add("a") == 0
+        assert table.add("b") == 1
+        assert table.add("a") == 0
+        assert len(table) == 2
+
+
+    def test_bounded(self):
+        from ..strings import SharedStringFile
+        table = SharedStringFile(max_strings=2)
+        for value in "abc":
+            table.add(value)
+        assert table._indices == {"c": 2}
+        assert table.add("a") == 3
+
+
+    def test_write_archive(self):
+        from io import BytesIO
+        from zipfile import ZipFile
+        from openpyxl.reader.strings import read_string_table
+        from openpyxl.xml.constants import ARC_SHARED_STRINGS
+        from ..strings import SharedStringFile
+
+        table = SharedStringFile()
+        table.add("a")
+        table.add(" b ")
+        for expected in (["a", " b "], ["a", " b ", "c"]):
+            archive = ZipFile(BytesIO(), "w")
+            table._write_archive(archive)
+            xml = archive.read(ARC_SHARED_STRINGS)
+            assert read_string_table(xml) == expected
+            table.add("c")
+
+
+    def test_close(self):
+        import os
+        from ..strings import SharedStringFile
+        table = SharedStringFile()
+        table.add("a")
+        table.close()
+        assert table._file.closed
+        assert not os.path.exists(table.filename)
+        table.close()
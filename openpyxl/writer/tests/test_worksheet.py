@@ -198,7 +198,7 @@ def test_get_rows_to_write(worksheet):
     ws.row_dimensions[10] = None
     ws.row_dimensions[2] = None
 
-    cells_by_row = get_rows_to_write(ws)
+    cells_by_row = list(get_rows_to_write(ws))
 
     assert cells_by_row == [
         (2, []),
@@ -206,6 +206,76 @@ def test_get_rows_to_write(worksheet):
     ]
 
 
+def test_get_packed_rows_to_write():
+    from openpyxl import Workbook
+    from .. etree_worksheet import get_rows_to_write
+
+    ws = Workbook(compact_cells=True).active
+    ws['A10'] = "test"
+    ws.append([1, 2])
+    ws.row_dimensions[10] = None
+    ws.row_dimensions[2] = None
+
+    cells_by_row = [(idx, [(col, c.value) for col, c in row])
+                    for idx, row in get_rows_to_write(ws)]
+
+    assert cells_by_row == [
+        (2, []),
+        (10, [(1, "test")]),
+        (11, [(1, 1), (2, 2)]),
+    ]
+
+
+def test_write_compact_cells(write_worksheet):
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+
+    sheets = []
+    for compact in (False, True):
+        ws = Workbook(compact_cells=compact).active
+        ws.append(["Name", "Value", None, "=B2*2"])
+        ws.append_rows([["a", 1.5], ["b", 2, True]])
+        ws["C1"].font = Font(bold=True)
+        ws["A5"].hyperlink = "http://test.com"
+        ws.row_dimensions[4].height = 30
+        sheets.append(write_worksheet(ws))
+
+    assert sheets[0] == sheets[1]
+
+
+@pytest.mark.lxml_required
+@pytest.mark.parametrize("inline", [False, True])
+def test_write_fast_rows(write_worksheet, inline):
+    from openpyxl.comments import Comment
+    from openpyxl.styles import Font
+
+    ws = Workbook(inline_strings=inline).active
+    ws.append(["Name", u"Caf\xe9", None, "=B2*2", True, 1e17, 2**40])
+    ws.append_rows([["a<b & c", 1.5], [" b ", float("nan"), False]])
+    ws["A4"] = decimal.Decimal("1.25")
+    ws["B4"] = datetime.date(2017, 1, 1)
+    ws["C4"] = "#N/A"
+    ws["D4"] = u'=CONCATENATE("\u4e2d", "<", A1)'
+    ws["E4"] = ""
+    ws["A6"] = "=A1"
+    ws.formula_attributes["A6"] = {"t": "shared", "ref": "A6:A7", "si": "0"}
+    ws["C1"].font = Font(bold=True)
+    ws["F6"].font = Font(italic=True)
+    ws["A7"].hyperlink = "http://test.com"
+    ws["A7"].value = "link"
+    ws["B7"].comment = Comment("Note", "Author")
+    ws.row_dimensions[3].height = 30
+    ws.row_dimensions[9].hidden = True
+
+    xml = write_worksheet(ws)
+    links = ws._hyperlinks
+    comments = list(ws._comments)
+    ws._comments = []
+    assert write_worksheet(ws, fast_rows=True) == xml
+    assert ws._hyperlinks == links
+    assert ws._comments == comments
+
+
 def test_merge(worksheet):
     from .. worksheet import write_mergecells
 
@@ -192,6 +192,94 @@ def test_cell_comment(WriteOnlyWorksheet):
     assert diff is None, diff
 
 
+def test_write_archive(WriteOnlyWorksheet):
+    import os
+    ws = WriteOnlyWorksheet
+    ws.append([1, "=A1"])
+    archive = ZipFile(BytesIO(), "w")
+    ws._write_archive(archive)
+    xml = archive.read("xl/worksheets/sheetNone.xml")
+    assert b'<c r="A1" t="n"><v>1</v></c><c r="B1"><f>A1</f><v></v></c>' in xml
+    assert not os.path.exists(ws.filename)
+
+
+@pytest.mark.lxml_required
+def test_write_raw_rows(monkeypatch):
+    from openpyxl.comments import Comment
+    from openpyxl.styles import Font
+    from openpyxl.workbook import Workbook
+    from .. import write_only
+
+    def write(raw):
+        monkeypatch.setattr(write_only, "LXML", raw)
+        ws = Workbook(write_only=True).create_sheet()
+        ws.row_dimensions[2].height = 20
+        styled = write_only.WriteOnlyCell(ws, "bold")
+        styled.font = Font(bold=True)
+        commented = write_only.WriteOnlyCell(ws, 5)
+        commented.comment = Comment("Note", "Author")
+        ws.append([1, 2.5, float("nan"), True, False, None, 2**60])
+        ws.append([u"Caf\xe9", "a < b & c", "", "=A1+1", "#N/A", "="])
+        ws.append([decimal.Decimal("1.5"), datetime.date(2017, 1, 1), styled,
+                   commented, "text"])
+        ws.close()
+        with open(ws.filename, "rb") as src:
+            return src.read()
+
+    xml = write(True)
+    assert xml == write(False)
+    assert b'<row r="1"><c r="A1" t="n"><v>1</v></c>' in xml
+
+
+@pytest.mark.lxml_required
+def test_append_rows_formats(monkeypatch):
+    from openpyxl.workbook import Workbook
+    from .. import write_only
+
+    def write(raw):
+        monkeypatch.setattr(write_only, "LXML", raw)
+        ws = Workbook(write_only=True).create_sheet()
+        ws.append_rows([(42737.25, 1), (None, 2), ("text", 3)],
+                       number_formats={1: "yyyy-mm-dd h:mm:ss"})
+        ws.append([1])
+        ws.close()
+        with open(ws.filename, "rb") as src:
+            return src.read()
+
+    xml = write(True)
+    assert xml == write(False)
+    assert b'<c r="A1" s="1" t="n"><v>42737.25</v></c>' in xml
+    assert b'<c r="A3" s="1" t="s"><v>0</v></c>' in xml
+    assert b'<c r="A4" t="n"><v>1</v></c>' in xml
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_inline_strings(monkeypatch, raw):
+    from openpyxl.workbook import Workbook
+    from .. import write_only
+
+    monkeypatch.setattr(write_only, "LXML", raw and write_only.LXML)
+    wb = Workbook(write_only=True, inline_strings=True)
+    ws = wb.create_sheet()
+    ws.append(["text", " space", ""])
+    ws.close()
+    with open(ws.filename) as src:
+        xml = src.read()
+    expected = """
+    <sheetData>
+    <row r="1">
+      <c r="A1" t="inlineStr"><is><t>text</t></is></c>
+      <c r="B1" t="inlineStr"><is><t xml:space="preserve"> space</t></is></c>
+      <c r="C1" t="inlineStr"></c>
+    </row>
+    </sheetData>
+    """
+    xml = xml[xml.index("<sheetData>"):xml.index("</sheetData>") + 12]
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+    assert len(wb.shared_strings) == 0
+
+
 def test_cannot_save_twice(WriteOnlyWorksheet):
     from .. write_only import WorkbookAlreadySaved
 
@@ -331,6 +419,18 @@ def test_save():
     save_dump(wb, filename)
 
 
+def test_save_removes_shared_strings(tmpdir):
+    import os
+    from openpyxl.workbook import Workbook
+    from ..write_only import save_dump
+    tmpdir.chdir()
+    wb = Workbook(write_only=True, max_shared_strings=10)
+    ws = wb.create_sheet()
+    ws.append(["a", "b"])
+    save_dump(wb, "strings.xlsx")
+    assert not os.path.exists(wb.shared_strings.filename)
+
+
 def test_write_height(WriteOnlyWorksheet):
     from openpyxl.worksheet.dimensions import RowDimension
     ws = WriteOnlyWorksheet
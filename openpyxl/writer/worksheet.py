@@ -10,6 +10,7 @@ from warnings import warn
 # package imports
 from openpyxl.xml.functions import xmlfile
 from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl import LXML
 
 from openpyxl.styles.differential import DifferentialStyle
 from openpyxl.packaging.relationship import Relationship, RelationshipList
@@ -27,7 +28,7 @@ from openpyxl.worksheet.dimensions import (
     SheetDimension,
 )
 
-from .etree_worksheet import write_rows
+from .etree_worksheet import write_rows, write_rows_raw
 
 
 def write_mergecells(worksheet):
@@ -76,12 +77,20 @@ def write_drawing(worksheet):
         return drawing.to_tree("drawing")
 
 
-def write_worksheet(worksheet):
-    """Write a worksheet to an xml file."""
+def write_worksheet(worksheet, fast_rows=False, rows=None):
+    """Write a worksheet to an xml file.
+
+    With `fast_rows` cell data is serialised directly to bytes instead of
+    through elements. This requires lxml and is ignored otherwise.
+
+    `rows` is cell data already serialised after `prepare_rows`, and also
+    requires lxml.
+    """
 
     ws = worksheet
     ws._rels = RelationshipList()
-    ws._hyperlinks = []
+    if rows is None:
+        ws._hyperlinks = []
 
     out = BytesIO()
 
@@ -104,7 +113,12 @@ def write_worksheet(worksheet):
                 xf.write(cols)
 
             # write data
-            write_rows(xf, ws)
+            if rows is not None:
+                write_rows_raw(xf, out, ws, rows)
+            elif fast_rows and LXML:
+                write_rows_raw(xf, out, ws)
+            else:
+                write_rows(xf, ws)
 
             if ws.protection.sheet:
                 xf.write(ws.protection.to_tree())
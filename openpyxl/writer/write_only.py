@@ -8,19 +8,29 @@ import atexit
 from inspect import isgenerator
 import os
 from tempfile import NamedTemporaryFile
-from zipfile import ZipFile, ZIP_DEFLATED
 
+from openpyxl import LXML
+from openpyxl.compat import long, unicode
 from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.worksheet import Worksheet
 from openpyxl.workbook.child import _WorkbookChild
 from openpyxl.worksheet.related import Related
 from openpyxl.worksheet.dimensions import SheetFormatProperties
 
-from openpyxl.utils.exceptions import WorkbookAlreadySaved
-
-from .etree_worksheet import write_cell
-from .excel import ExcelWriter
+from openpyxl.utils.cell import _STRING_COL_CACHE
+from openpyxl.utils.exceptions import WorkbookAlreadySaved, IllegalCharacterError
+
+from .etree_worksheet import (
+    write_cell,
+    _attributes,
+    _inline_string,
+    _inline_strings,
+)
+from .excel import ExcelWriter, open_archive
+from .strings import SharedStringFile
 from .worksheet import write_drawing
 from openpyxl.xml.constants import SHEET_MAIN_NS
 from openpyxl.xml.functions import xmlfile, Element
@@ -44,6 +54,42 @@ def create_temporary_file(suffix=''):
     return filename
 
 
+def _write_number(ws, value):
+    if value != value: # NaN
+        return ' t="n"><v></v></c>'
+    return ' t="n"><v>%.16g</v></c>' % value
+
+
+def _write_bool(ws, value):
+    return ' t="b"><v>%d</v></c>' % value
+
+
+def _write_string(ws, value):
+    if value.startswith("=") and len(value) > 1 or value in Cell.ERROR_CODES:
+        return
+    value = value[:32767]
+    if next(ILLEGAL_CHARACTERS_RE.finditer(value), None):
+        raise IllegalCharacterError
+    if _inline_strings(ws):
+        if not value:
+            return ' t="inlineStr"></c>'
+        return ' t="inlineStr">%s</c>' % _inline_string(value)
+    if not value:
+        return ' t="s"></c>'
+    return ' t="s"><v>%d</v></c>' % ws.parent.shared_strings.add(value)
+
+
+# markup following the coordinate for unstyled values of common types
+# writers return None for values which need a cell
+_VALUE_WRITERS = {
+    int: _write_number,
+    long: _write_number,
+    float: _write_number,
+    bool: _write_bool,
+    unicode: _write_string,
+}
+
+
 class WriteOnlyWorksheet(_WorkbookChild):
     """
     Streaming worksheet. Optimised to reduce memory by writing rows just in
@@ -54,6 +100,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
 
     __saved = False
     writer = None
+    _column_styles = {}
     _rel_type = Worksheet._rel_type
     _path = Worksheet._path
     mime_type = Worksheet.mime_type
@@ -129,7 +176,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
         Generator that creates the XML file and the sheet header
         """
 
-        with xmlfile(self.filename) as xf:
+        with open(self.filename, "wb") as out, xmlfile(out) as xf:
             with xf.element("worksheet", xmlns=SHEET_MAIN_NS):
 
                 if self.sheet_properties:
@@ -146,7 +193,12 @@ class WriteOnlyWorksheet(_WorkbookChild):
                 if cols is not None:
                     xf.write(cols)
 
+                # values can be written directly with lxml
+                raw = LXML and not getattr(self.parent, "guess_types", False)
+
                 with xf.element("sheetData"):
+                    if raw:
+                        xf.flush()
                     cell = WriteOnlyCell(self)
                     try:
                         while True:
@@ -157,27 +209,19 @@ class WriteOnlyWorksheet(_WorkbookChild):
                                 dim = self.row_dimensions[row_idx]
                                 attrs.update(dict(dim))
 
+                            if raw:
+                                cell = self._write_raw_row(xf, out, cell, row, row_idx, attrs)
+                                continue
+
                             with xf.element("row", attrs):
 
+                                styles = self._column_styles
                                 for col_idx, value in enumerate(row, 1):
                                     if value is None:
                                         continue
-                                    try:
-                                        cell.value = value
-                                    except ValueError:
-                                        if isinstance(value, Cell):
-                                            cell = value
-                                        else:
-                                            raise ValueError
-
-                                    cell.col_idx = col_idx
-                                    cell.row = row_idx
-
-                                    styled = cell.has_style
-                                    write_cell(xf, self, cell, styled)
-
-                                    if styled: # styled cell or datetime
-                                        cell = WriteOnlyCell(self)
+                                    if col_idx in styles:
+                                        value = self._styled_cell(value, styles[col_idx][0])
+                                    cell = self._write_cell(xf, cell, value, row_idx, col_idx)
 
                     except GeneratorExit:
                         pass
@@ -203,6 +247,65 @@ class WriteOnlyWorksheet(_WorkbookChild):
                     xml = legacyDrawing.to_tree("legacyDrawing")
                     xf.write(xml)
 
+    def _write_cell(self, xf, cell, value, row_idx, col_idx):
+        """
+        Write a value using a cell and return the cell to use for the next one
+        """
+        try:
+            cell.value = value
+        except ValueError:
+            if isinstance(value, Cell):
+                cell = value
+            else:
+                raise ValueError
+
+        cell.col_idx = col_idx
+        cell.row = row_idx
+
+        styled = cell.has_style
+        write_cell(xf, self, cell, styled)
+
+        if styled: # styled cell or datetime
+            cell = WriteOnlyCell(self)
+        return cell
+
+
+    def _write_raw_row(self, xf, out, cell, row, row_idx, attrs):
+        """
+        Write a row directly to the file underneath an lxml writer.
+        Only values which need a cell are passed to the writer.
+        """
+        parts = ['<row%s>' % _attributes(attrs)]
+        letters = _STRING_COL_CACHE
+        writers = _VALUE_WRITERS
+        styles = self._column_styles
+
+        for col_idx, value in enumerate(row, 1):
+            if value is None:
+                continue
+            writer = writers.get(type(value))
+            if styles and col_idx in styles:
+                if writer is _write_number and value == value:
+                    xml = styles[col_idx][1] % value
+                else:
+                    value = self._styled_cell(value, styles[col_idx][0])
+                    xml = None
+            else:
+                xml = writer is not None and writer(self, value)
+            if xml:
+                parts.append('<c r="%s%d"%s' % (letters[col_idx], row_idx, xml))
+                continue
+
+            out.write("".join(parts).encode("ascii", "xmlcharrefreplace"))
+            parts = []
+            cell = self._write_cell(xf, cell, value, row_idx, col_idx)
+            xf.flush()
+
+        parts.append('</row>')
+        out.write("".join(parts).encode("ascii", "xmlcharrefreplace"))
+        return cell
+
+
     def close(self):
         if self.__saved:
             self._already_saved()
@@ -238,6 +341,41 @@ class WriteOnlyWorksheet(_WorkbookChild):
             self._already_saved()
 
 
+    def append_rows(self, rows, number_formats=None):
+        """
+        Append many rows of values. Numbers in the columns given by
+        `number_formats` are written with these formats without creating
+        cells.
+
+        :param rows: iterable of rows of values
+        :type rows: iterable
+
+        :param number_formats: number formats for the values of some columns
+        :type number_formats: dict of column index to format
+        """
+        styles = {}
+        for col_idx, number_format in (number_formats or {}).items():
+            cell = WriteOnlyCell(self)
+            cell.number_format = number_format
+            xml = ' s="%d" t="n"><v>%%.16g</v></c>' % cell.style_id
+            styles[col_idx] = (cell._style, xml)
+
+        self._column_styles = styles
+        try:
+            for row in rows:
+                self.append(row)
+        finally:
+            del self._column_styles
+
+
+    def _styled_cell(self, value, style):
+        if isinstance(value, Cell):
+            return value
+        cell = WriteOnlyCell(self, value)
+        cell._style = StyleArray(style)
+        return cell
+
+
     def _already_saved(self):
         raise WorkbookAlreadySaved('Workbook has already been saved and cannot be modified or saved anymore.')
 
@@ -247,21 +385,38 @@ class WriteOnlyWorksheet(_WorkbookChild):
             type(iterable))
                         )
 
-    def _write(self):
+    def _finish(self):
         self._drawing = SpreadsheetDrawing()
         self._drawing.charts = self._charts
         self._drawing.images = self._images
         self.close()
+
+
+    def _write(self):
+        self._finish()
         with open(self.filename) as src:
             out = src.read()
         self._cleanup()
         return out
 
 
-def save_dump(workbook, filename):
-    archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
+    def _write_archive(self, archive):
+        """
+        Copy the sheet from the temporary file into the archive in chunks so
+        that it is never held in memory
+        """
+        self._finish()
+        archive.write(self.filename, self.path[1:])
+        self._cleanup()
+
+
+def save_dump(workbook, filename, compression='default'):
+    archive = open_archive(filename, compression)
     if workbook.worksheets == []:
         workbook.create_sheet()
     writer = ExcelWriter(workbook, archive)
     writer.save(filename)
+    # write-only workbooks are saved once so the strings are not needed
+    if isinstance(workbook.shared_strings, SharedStringFile):
+        workbook.shared_strings.close()
     return True
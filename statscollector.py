@@ -428,8 +428,8 @@ class MetaExporter(object):
 
 					with open(csvpath, 'wb') as file:
 						writer = csv.writer(file)
-						for row in ws.rows:
-							writer.writerow([cell.value for cell in row])
+						for row in ws.values:
+							writer.writerow(row)
 
 			# Try saving the Workbook object into a file
 			try: